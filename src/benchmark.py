@@ -0,0 +1,258 @@
+import numpy as np
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import traceback
+import tracemalloc
+from datetime import datetime, timezone
+
+from scheduler_core import (build_problem_instance, evaluate_solution, evaluate_solution_incremental,
+                              evaluate_population)
+from instance_generator import DAG_SHAPES, generate_instance
+from genetic_algorithm import init_population
+from parallel_evaluation import create_evaluation_pool, close_evaluation_pool, parallel_evaluate_population
+from compiled_kernel import kernel_available, simulate_schedule
+
+# 預設的測試網格
+DEFAULT_TASK_COUNTS = (20, 100, 1000)
+LARGE_TASK_COUNTS = (1000, 2000)   # --large：比較編譯核心與逐一評估在大型實例上的加速倍數
+LARGE_ENGINES = ('scalar', 'compiled')
+DEFAULT_POPULATION_SIZES = (10, 100)
+DEFAULT_REPEATS = 5
+DEFAULT_CELL_TIME_LIMIT = 10.0  # 每個測試格最多花費的計時秒數（超過就不再重複）
+DEFAULT_OUTPUT = 'benchmark_results.json'
+
+# 結果檔格式版本
+BENCHMARK_FORMAT_VERSION = 1
+
+# 各評估方式的準備函式：輸入 (instance, ss_batch, ms_batch, rng)，
+# 回傳 (評估整個族群一次的無參數函式, 量測結束後的清理函式或 None)
+def _prepare_scalar(instance, ss_batch, ms_batch, rng, insertion=False):
+    """逐一以 evaluate_solution 評估每個個體"""
+    solutions = [{'ss': ss.tolist(), 'ms': ms.tolist()} for ss, ms in zip(ss_batch, ms_batch)]
+    
+    def run():
+        for solution in solutions:
+            evaluate_solution(solution, instance, insertion=insertion)
+    return run, None
+
+def _prepare_insertion(instance, ss_batch, ms_batch, rng):
+    """逐一以插入式策略評估每個個體"""
+    return _prepare_scalar(instance, ss_batch, ms_batch, rng, insertion=True)
+
+def _prepare_batch(instance, ss_batch, ms_batch, rng):
+    """以 evaluate_population 一次評估整個族群"""
+    def run():
+        evaluate_population(ss_batch, ms_batch, instance)
+    return run, None
+
+def _prepare_parallel(instance, ss_batch, ms_batch, rng):
+    """以 parallel_evaluation 的行程池分塊評估整個族群（行程池的建立不計入時間）"""
+    evaluation_pool = create_evaluation_pool(instance)
+    
+    def run():
+        parallel_evaluate_population(evaluation_pool, ss_batch, ms_batch)
+    return run, lambda: close_evaluation_pool(evaluation_pool)
+
+def _prepare_incremental(instance, ss_batch, ms_batch, rng):
+    """以第一個個體為父代，每個子代只改變一個任務的處理器，再以增量評估計算（模擬區域搜尋）"""
+    parent = evaluate_solution({'ss': ss_batch[0].tolist(), 'ms': ms_batch[0].tolist()}, instance)
+    children = []
+    for _ in range(len(ss_batch)):
+        ms = list(parent['ms'])
+        task = int(rng.integers(instance.task_count))
+        ms[task] = (ms[task] + 1 + int(rng.integers(max(instance.processor_count - 1, 1)))) % instance.processor_count
+        children.append({'ss': parent['ss'], 'ms': ms})
+    
+    def run():
+        for child in children:
+            evaluate_solution_incremental(parent, child, instance)
+    return run, None
+
+def _prepare_compiled(instance, ss_batch, ms_batch, rng):
+    """逐一以 compiled_kernel.simulate_schedule 評估每個個體（準備時先呼叫一次，編譯時間不計入）"""
+    start_times = np.zeros(instance.task_count)
+    end_times = np.zeros(instance.task_count)
+    processor_finish_time = np.zeros(instance.processor_count)
+    simulate_schedule(ss_batch[0], ms_batch[0], instance, start_times, end_times, 0, processor_finish_time)
+    
+    def run():
+        for ss, ms in zip(ss_batch, ms_batch):
+            simulate_schedule(ss, ms, instance, start_times, end_times, 0, processor_finish_time)
+    return run, None
+
+ENGINES = {
+    'scalar': _prepare_scalar,
+    'insertion': _prepare_insertion,
+    'batch': _prepare_batch,
+    'incremental': _prepare_incremental,
+    'parallel': _prepare_parallel,
+    'compiled': _prepare_compiled,
+}
+
+# 未指定時量測的評估方式（行程池只在多核心時才有意義，編譯核心只在安裝 Numba 時才量測）
+DEFAULT_ENGINES = ('scalar', 'insertion', 'batch', 'incremental') + (('compiled',) if kernel_available() else ())
+
+# 量測一個測試格
+def measure(run, repeats=DEFAULT_REPEATS, time_limit=DEFAULT_CELL_TIME_LIMIT):
+    """重複執行 run 並回傳 (每次耗時列表, 峰值記憶體位元組數)
+    
+    先在 tracemalloc 下執行一次取得峰值記憶體（同時作為暖身），
+    再於關閉 tracemalloc 的情況下計時，避免追蹤記憶體的額外成本影響時間。
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - t0)
+        if time.perf_counter() - started > time_limit:
+            break
+    return latencies, peak_memory
+
+def _git_revision():
+    """目前程式碼的 git commit（無法取得時回傳 None）"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+def environment_metadata():
+    """記錄執行環境，方便比較不同版本的結果"""
+    return {
+        'format_version': BENCHMARK_FORMAT_VERSION,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_revision': _git_revision(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+# 執行整個測試網格
+def run_benchmark(task_counts=DEFAULT_TASK_COUNTS, population_sizes=DEFAULT_POPULATION_SIZES, engines=None,
+                  shape='layered', processor_count=4, repeats=DEFAULT_REPEATS, time_limit=DEFAULT_CELL_TIME_LIMIT,
+                  seed=0, verbose=True):
+    """對每個 (任務數, 族群大小, 評估方式) 量測評估吞吐量、每代延遲與峰值記憶體，回傳結果字典
+    
+    每代延遲為評估一次整個族群所需的時間；每秒評估數 = 族群大小 / 延遲中位數。
+    """
+    engines = list(engines) if engines else list(DEFAULT_ENGINES)
+    results = []
+    
+    for task_count in task_counts:
+        comp_cost, comm_rate, edges = generate_instance(shape, task_count, processor_count, seed=seed)
+        instance = build_problem_instance(processor_count, task_count, comp_cost, edges, comm_rate)
+        
+        for population_size in population_sizes:
+            rng = np.random.default_rng(seed)
+            ss_batch, ms_batch = init_population(instance, population_size, rng)
+            
+            for engine in engines:
+                run, close = ENGINES[engine](instance, ss_batch, ms_batch, np.random.default_rng(seed))
+                try:
+                    latencies, peak_memory = measure(run, repeats, time_limit)
+                finally:
+                    if close is not None:
+                        close()
+                median = float(np.median(latencies))
+                record = {
+                    'engine': engine,
+                    'shape': shape,
+                    'task_count': task_count,
+                    'edge_count': instance.edge_count,
+                    'processor_count': processor_count,
+                    'population_size': population_size,
+                    'repeats': len(latencies),
+                    'latency_median': median,
+                    'latency_min': float(min(latencies)),
+                    'evaluations_per_second': population_size / median if median > 0 else float('inf'),
+                    'peak_memory_bytes': peak_memory,
+                }
+                results.append(record)
+                if verbose:
+                    print(f"{engine:>12} T={task_count:<7} N={population_size:<6} "
+                          f"每代 {median * 1000:10.3f} ms  {record['evaluations_per_second']:12.1f} 次/秒  "
+                          f"峰值記憶體 {peak_memory / 1024:10.1f} KiB")
+    
+    return {'metadata': environment_metadata(), 'results': results}
+
+# 計算加速倍數
+def speedups(report, baseline='scalar'):
+    """以 baseline 的每代延遲中位數為基準，回傳每個 (任務數, 族群大小) 中其他評估方式的加速倍數列表"""
+    baseline_latency = {(record['task_count'], record['population_size']): record['latency_median']
+                        for record in report['results'] if record['engine'] == baseline}
+    rows = []
+    for record in report['results']:
+        key = (record['task_count'], record['population_size'])
+        if record['engine'] != baseline and key in baseline_latency and record['latency_median'] > 0:
+            rows.append({
+                'engine': record['engine'],
+                'task_count': key[0],
+                'population_size': key[1],
+                'speedup': baseline_latency[key] / record['latency_median'],
+            })
+    return rows
+
+# 寫出結果
+def write_results(report, file_path):
+    """以 JSON 寫出結果；先寫暫存檔再 os.replace"""
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    os.replace(temp_path, file_path)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="量測各種評估方式的吞吐量、每代延遲與峰值記憶體")
+    parser.add_argument('--tasks', type=int, nargs='+', default=None,
+                        help=f"任務數列表（預設 {' '.join(map(str, DEFAULT_TASK_COUNTS))}）")
+    parser.add_argument('--large', action='store_true',
+                        help=f"大型實例：任務數預設 {' '.join(map(str, LARGE_TASK_COUNTS))}，"
+                             f"評估方式預設 {' '.join(LARGE_ENGINES)}，並列出相對 scalar 的加速倍數")
+    parser.add_argument('--population', type=int, nargs='+', default=list(DEFAULT_POPULATION_SIZES),
+                        help="族群大小列表")
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES), default=None, help="要量測的評估方式（預設不含 parallel）")
+    parser.add_argument('--shape', choices=DAG_SHAPES, default='layered', help="合成實例的 DAG 形狀")
+    parser.add_argument('-p', '--processors', type=int, default=4, help="處理器個數")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="每個測試格的重複次數")
+    parser.add_argument('--time-limit', type=float, default=DEFAULT_CELL_TIME_LIMIT, help="每個測試格的計時上限（秒）")
+    parser.add_argument('--seed', type=int, default=0, help="亂數種子")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, help="結果 JSON 檔名")
+    args = parser.parse_args()
+    task_counts = args.tasks or (LARGE_TASK_COUNTS if args.large else DEFAULT_TASK_COUNTS)
+    engines = args.engines or (LARGE_ENGINES if args.large else None)
+    if args.large and 'compiled' in engines and not kernel_available():
+        print("未安裝 Numba，compiled 量測的是純 Python 後備實作")
+    
+    start_time = time.time()
+    try:
+        report = run_benchmark(task_counts, args.population, engines, args.shape, args.processors,
+                               args.repeats, args.time_limit, args.seed)
+        if 'scalar' in (engines or DEFAULT_ENGINES):
+            print("\n相對 scalar 的加速倍數:")
+            for row in speedups(report):
+                print(f"{row['engine']:>12} T={row['task_count']:<7} N={row['population_size']:<6} "
+                      f"{row['speedup']:8.1f}x")
+        write_results(report, args.output)
+        print(f"\n結果已寫入 {args.output}")
+    except Exception as e:
+        print(f"執行效能測試時出錯: {e}")
+        traceback.print_exc()
+        sys.exit(1)
+    
+    execution_time = time.time() - start_time
+    print(f"程式執行耗時: {execution_time:.2f} 秒")
@@ -0,0 +1,41 @@
+import numpy as np
+import json
+import os
+
+# 檢查點檔案格式版本（格式改變時遞增，舊檔案會被拒絕）
+CHECKPOINT_FORMAT_VERSION = 1
+
+# 寫出檢查點
+def save_checkpoint(path, arrays, state):
+    """將陣列字典與可轉為 JSON 的狀態字典寫成壓縮的 .npz 檢查點
+    
+    先寫暫存檔並 fsync，再以 os.replace 取代舊檔，中途被中斷時舊的檢查點仍然完整。
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    header = json.dumps({'format_version': CHECKPOINT_FORMAT_VERSION, 'state': state})
+    with open(temp_path, 'wb') as file:
+        np.savez_compressed(file, __header__=np.array(header), **arrays)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+# 讀取檢查點
+def load_checkpoint(path):
+    """讀取 save_checkpoint 寫出的檢查點，回傳 (陣列字典, 狀態字典)"""
+    with np.load(path, allow_pickle=False) as data:
+        header = json.loads(str(data['__header__']))
+        if header.get('format_version') != CHECKPOINT_FORMAT_VERSION:
+            raise ValueError(f"不支援的檢查點格式版本: {header.get('format_version')}")
+        arrays = {name: data[name] for name in data.files if name != '__header__'}
+    return arrays, header['state']
+
+# 亂數產生器狀態
+def rng_state(rng):
+    """回傳 np.random.Generator 的完整狀態（可轉為 JSON 的字典）"""
+    return rng.bit_generator.state
+
+def restore_rng(state):
+    """由 rng_state 的結果重建 np.random.Generator，之後產生的亂數與儲存時完全相同"""
+    bit_generator = getattr(np.random, state['bit_generator'])()
+    bit_generator.state = state
+    return np.random.Generator(bit_generator)
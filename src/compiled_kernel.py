@@ -0,0 +1,166 @@
+import numpy as np
+import time
+
+from scheduler_core import (parse_problem_file, parse_solutions_file, get_default_instance, evaluate_solution,
+                            first_affected_position, evaluate_solution_incremental)
+
+# Numba 為選用套件，沒有安裝時自動改用純 Python 版本
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# 排程模擬核心
+def _simulate(ss, ms, first, pred_ptr, pred_idx, pred_vol, comp_cost, comm_rate,
+              start_times, end_times, processor_finish_time):
+    """以平坦陣列模擬依序附加的排程，從 ss 的第 first 個位置開始重算，回傳總耗時
+    
+    start_times、end_times 中前 first 個位置的任務時間必須已經正確（例如來自父代），
+    計算規則與 evaluate_solution 完全相同。此函式只使用 Numba nopython 模式支援的語法。
+    """
+    processor_finish_time[:] = 0.0
+    for k in range(first):
+        task = ss[k]
+        processor_finish_time[ms[task]] = end_times[task]
+    for k in range(first, len(ss)):
+        task = ss[k]
+        start_times[task] = 0.0
+        end_times[task] = 0.0
+    
+    for k in range(first, len(ss)):
+        task = ss[k]
+        processor = ms[task]
+        earliest_start = 0.0
+        for edge in range(pred_ptr[task], pred_ptr[task + 1]):
+            pred = pred_idx[edge]
+            pred_end = end_times[pred]
+            from_processor = ms[pred]
+            if from_processor != processor and pred_vol[edge] > 0:
+                pred_end += pred_vol[edge] * comm_rate[from_processor, processor]
+            if pred_end > earliest_start:
+                earliest_start = pred_end
+        start_time = earliest_start
+        if processor_finish_time[processor] > start_time:
+            start_time = processor_finish_time[processor]
+        end_time = start_time + comp_cost[task, processor]
+        start_times[task] = start_time
+        end_times[task] = end_time
+        processor_finish_time[processor] = end_time
+    
+    makespan = 0.0
+    for task in range(len(end_times)):
+        if end_times[task] > makespan:
+            makespan = end_times[task]
+    return makespan
+
+if numba is not None:
+    _compiled_simulate = numba.njit(cache=True, nogil=True)(_simulate)
+    KERNEL_BACKEND = 'numba'
+else:
+    _compiled_simulate = None
+    KERNEL_BACKEND = 'python'
+
+# 是否使用編譯核心（設為 False 可強制使用純 Python 版本以便比較）
+USE_COMPILED_KERNEL = True
+
+def kernel_available():
+    """編譯核心是否可用且已啟用"""
+    return _compiled_simulate is not None and USE_COMPILED_KERNEL
+
+# 以陣列模擬排程
+def simulate_schedule(ss, ms, instance, start_times, end_times, first=0, processor_finish_time=None):
+    """就地更新 start_times、end_times（長度 T 的 float64 陣列）並回傳總耗時
+    
+    ss、ms 為 int64 陣列。區域搜尋可重複使用同一組陣列，並以 first 指定第一個需要重算的位置。
+    沒有編譯核心時以相同的程式碼直譯執行（結果相同，但較慢）。
+    """
+    if processor_finish_time is None:
+        processor_finish_time = np.zeros(instance.processor_count)
+    kernel = _compiled_simulate if kernel_available() else _simulate
+    return kernel(ss, ms, first, instance.pred_ptr, instance.pred_idx, instance.pred_vol, instance.comp_cost,
+                  instance.comm_rate, start_times, end_times, processor_finish_time)
+
+# 以陣列評估解決方案
+def evaluate_arrays(ss, ms, instance, start_times=None, end_times=None, first=0, processor_finish_time=None):
+    """陣列進、陣列出的評估入口：ss、ms 為 int64 陣列，回傳 (總耗時, start_times, end_times)
+    
+    不做任何 Python 列表轉換；start_times、end_times 省略時配置新陣列，傳入時就地更新
+    （first 大於 0 時前 first 個位置的時間必須已經正確）。結果與 evaluate_solution 相同。
+    """
+    if start_times is None:
+        start_times = np.zeros(instance.task_count)
+    if end_times is None:
+        end_times = np.zeros(instance.task_count)
+    makespan = simulate_schedule(ss, ms, instance, start_times, end_times, first, processor_finish_time)
+    return makespan, start_times, end_times
+
+# 評估解決方案（編譯版本）
+def evaluate_solution_fast(solution, instance=None):
+    """與 evaluate_solution 相同的介面與結果；編譯核心可用時以它計算，否則直接呼叫 evaluate_solution
+    
+    為了相容字典格式，每次呼叫都要在列表與陣列之間轉換；大型實例上重複評估時請改用 evaluate_arrays。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    if not kernel_available():
+        return evaluate_solution(solution, instance)
+    
+    ss = np.asarray(solution['ss'], dtype=np.int64)
+    ms = np.asarray(solution['ms'], dtype=np.int64)
+    makespan, start_times, end_times = evaluate_arrays(ss, ms, instance)
+    
+    solution['start_times'] = start_times.tolist()
+    solution['end_times'] = end_times.tolist()
+    solution['makespan'] = makespan
+    return solution
+
+# 增量評估解決方案（編譯版本）
+def evaluate_solution_incremental_fast(parent, child, instance=None):
+    """與 evaluate_solution_incremental 相同的介面與結果；編譯核心可用時以它重算受影響的後段"""
+    if instance is None:
+        instance = get_default_instance()
+    if not kernel_available():
+        return evaluate_solution_incremental(parent, child, instance)
+    
+    first = first_affected_position(parent, child, instance)
+    ss = np.asarray(child['ss'], dtype=np.int64)
+    ms = np.asarray(child['ms'], dtype=np.int64)
+    start_times = np.array(parent['start_times'], dtype=np.float64)
+    end_times = np.array(parent['end_times'], dtype=np.float64)
+    makespan, _, _ = evaluate_arrays(ss, ms, instance, start_times, end_times, first)
+    
+    child['start_times'] = start_times.tolist()
+    child['end_times'] = end_times.tolist()
+    child['makespan'] = makespan
+    return child
+
+if __name__ == "__main__":
+    # 解析問題案例文件與解決方案文件
+    instance = parse_problem_file("HW01-1.txt")
+    all_solutions = parse_solutions_file("HW01-2.txt")
+    print(f"\n評估核心: {KERNEL_BACKEND}")
+    
+    # 第一次呼叫時編譯（有快取時直接載入）
+    start_time = time.time()
+    evaluate_solution_fast(dict(all_solutions[0]), instance)
+    print(f"編譯/載入核心耗時: {time.time() - start_time:.2f} 秒")
+    
+    repeats = 20000
+    for name, evaluate in (('evaluate_solution', evaluate_solution), ('evaluate_solution_fast', evaluate_solution_fast)):
+        start_time = time.time()
+        for k in range(repeats):
+            evaluate(all_solutions[k % len(all_solutions)], instance)
+        elapsed = time.time() - start_time
+        print(f"{name}: 每次 {elapsed / repeats * 1e6:.2f} 微秒")
+    
+    # 只用陣列介面時不必轉換 Python 列表
+    ss = np.array(all_solutions[0]['ss'], dtype=np.int64)
+    ms = np.array(all_solutions[0]['ms'], dtype=np.int64)
+    start_times = np.zeros(instance.task_count)
+    end_times = np.zeros(instance.task_count)
+    processor_finish_time = np.zeros(instance.processor_count)
+    start_time = time.time()
+    for _ in range(repeats):
+        evaluate_arrays(ss, ms, instance, start_times, end_times, 0, processor_finish_time)
+    elapsed = time.time() - start_time
+    print(f"evaluate_arrays: 每次 {elapsed / repeats * 1e6:.2f} 微秒")
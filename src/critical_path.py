@@ -0,0 +1,172 @@
+import numpy as np
+import time
+
+from scheduler_core import parse_problem_file, parse_solutions_file, get_default_instance, evaluate_solution
+
+# DAG 的計算下界
+def dag_lower_bound(instance=None):
+    """回傳 (下界, 路徑)：每個任務取最快處理器的計算成本、不計通信時間時的最長路徑
+    
+    任何排程都至少要依序執行這條路徑上的任務，因此它的長度是總耗時的下界。沿拓撲順序計算，O(T+E)。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    min_costs = instance.comp_cost.min(axis=1).tolist()
+    predecessors = instance.predecessors
+    finish = [0.0] * instance.task_count
+    previous = [-1] * instance.task_count
+    
+    for task in instance.topo_order.tolist():
+        ready = 0.0
+        for pred, _ in predecessors[task]:
+            if previous[task] < 0 or finish[pred] > ready:
+                ready = finish[pred]
+                previous[task] = pred
+        finish[task] = ready + min_costs[task]
+    
+    if instance.task_count == 0:
+        return 0.0, []
+    task = max(range(instance.task_count), key=finish.__getitem__)
+    length = finish[task]
+    path = []
+    while task >= 0:
+        path.append(task)
+        task = previous[task]
+    path.reverse()
+    return length, path
+
+# 排程圖上各任務在處理器上的前一個任務
+def _processor_predecessors(solution, insertion=False):
+    """回傳每個任務在同一處理器上緊接在前的任務（沒有則為 -1），以及排程圖的拓撲順序
+    
+    依序附加的排程中處理器上的順序就是 ss 的順序；插入式排程則依開始時間排序。
+    """
+    ss = solution['ss']
+    ms = solution['ms']
+    if insertion:
+        position = np.empty(len(ss), dtype=np.int64)
+        position[np.asarray(ss)] = np.arange(len(ss))
+        order = np.lexsort((position[ss], np.asarray(solution['end_times'])[ss],
+                            np.asarray(solution['start_times'])[ss]))
+        order = [ss[k] for k in order.tolist()]
+    else:
+        order = list(ss)
+    
+    processor_previous = [-1] * len(ms)
+    last_on_processor = {}
+    for task in order:
+        processor = ms[task]
+        processor_previous[task] = last_on_processor.get(processor, -1)
+        last_on_processor[processor] = task
+    return processor_previous, order
+
+# 排程的關鍵路徑與寬裕時間
+def analyze_schedule(solution, instance=None, insertion=False):
+    """分析已評估的解決方案，回傳關鍵路徑、每個任務的寬裕時間與最晚開始時間
+    
+    排程圖包含依賴邊（跨處理器時加上通信時間）與處理器順序邊（同一處理器上的前後任務）。
+    寬裕時間為在不改變處理器分配與順序、且總耗時不變下，任務最多能延後開始的時間；
+    關鍵路徑從最後完成的任務沿「剛好決定開始時間」的邊往回追溯。全部計算為 O(T+E)。
+    回傳字典包含 'critical_path'（任務列表）、'critical_edges'（(前, 後, 'dependency' 或 'processor')）、
+    'slack'、'latest_start' 與 'makespan'。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    ms = solution['ms']
+    start_times = solution['start_times']
+    end_times = solution['end_times']
+    makespan = solution['makespan']
+    tolerance = 1e-9 * max(1.0, abs(makespan))
+    predecessors = instance.predecessors
+    comm_columns = instance.comm_columns
+    cost_table = instance.cost_table
+    
+    processor_previous, order = _processor_predecessors(solution, insertion)
+    
+    # 往回追溯關鍵路徑：每一步找出使任務剛好在此時開始的前置任務
+    critical_path = []
+    critical_edges = []
+    if order:
+        task = max(order, key=end_times.__getitem__)
+        critical_path.append(task)
+        while start_times[task] > tolerance:
+            processor = ms[task]
+            binding = None
+            for pred, data_vol in predecessors[task]:
+                arrival = end_times[pred]
+                if ms[pred] != processor:
+                    arrival += data_vol * comm_columns[processor][ms[pred]]
+                if abs(arrival - start_times[task]) <= tolerance:
+                    binding = (pred, 'dependency')
+                    break
+            previous = processor_previous[task]
+            if binding is None and previous >= 0 and abs(end_times[previous] - start_times[task]) <= tolerance:
+                binding = (previous, 'processor')
+            if binding is None:
+                break
+            critical_edges.append((binding[0], task, binding[1]))
+            task = binding[0]
+            critical_path.append(task)
+        critical_path.reverse()
+        critical_edges.reverse()
+    
+    # 反向傳遞最晚完成時間：後繼任務（依賴或處理器順序）的最晚開始時間減去邊上的延遲
+    latest_finish = [makespan] * len(ms)
+    latest_start = [0.0] * len(ms)
+    for task in reversed(order):
+        processor = ms[task]
+        latest_start[task] = latest_finish[task] - cost_table[task][processor]
+        for pred, data_vol in predecessors[task]:
+            delay = data_vol * comm_columns[processor][ms[pred]] if ms[pred] != processor else 0.0
+            bound = latest_start[task] - delay
+            if bound < latest_finish[pred]:
+                latest_finish[pred] = bound
+        previous = processor_previous[task]
+        if previous >= 0 and latest_start[task] < latest_finish[previous]:
+            latest_finish[previous] = latest_start[task]
+    
+    slack = [latest_start[task] - start_times[task] for task in range(len(ms))]
+    
+    return {
+        'critical_path': critical_path,
+        'critical_edges': critical_edges,
+        'slack': slack,
+        'latest_start': latest_start,
+        'makespan': makespan,
+    }
+
+# 針對關鍵路徑的突變
+def mutate_critical_task(solution, analysis, processor_count, rng):
+    """從關鍵路徑上隨機選一個任務改到另一個處理器，回傳新的 ms（不修改原本的解決方案）
+    
+    關鍵路徑外的任務有寬裕時間，單獨移動通常無法縮短總耗時，因此只擾動關鍵路徑上的任務。
+    """
+    ms = list(solution['ms'])
+    critical_path = analysis['critical_path']
+    if not critical_path or processor_count < 2:
+        return ms
+    task = critical_path[int(rng.integers(len(critical_path)))]
+    ms[task] = (ms[task] + 1 + int(rng.integers(processor_count - 1))) % processor_count
+    return ms
+
+if __name__ == "__main__":
+    start_time = time.time()
+    
+    # 解析問題案例文件與解決方案文件
+    instance = parse_problem_file("HW01-1.txt")
+    all_solutions = parse_solutions_file("HW01-2.txt")
+    
+    lower_bound, bound_path = dag_lower_bound(instance)
+    print(f"\nDAG 下界: {lower_bound:.2f}（路徑 {bound_path}）")
+    
+    for i, solution in enumerate(all_solutions):
+        evaluate_solution(solution, instance)
+        analysis = analyze_schedule(solution, instance)
+        print(f"\n解決方案 {i+1}: 總耗時 {solution['makespan']:.2f}")
+        print(f"關鍵路徑: {analysis['critical_path']}")
+        print(f"寬裕時間為0的任務: {[t for t, s in enumerate(analysis['slack']) if abs(s) < 1e-9]}")
+    
+    execution_time = time.time() - start_time
+    print(f"\n程式執行耗時: {execution_time:.2f} 秒")
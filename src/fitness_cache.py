@@ -0,0 +1,157 @@
+import numpy as np
+import hashlib
+from collections import OrderedDict
+
+from scheduler_core import get_default_instance, evaluate_solution, evaluate_population
+
+# 預設最多快取的染色體數
+DEFAULT_CACHE_SIZE = 100000
+
+# 預設的快取記憶體上限（位元組），大型實例上由它而不是項目數決定能存多少個染色體
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+# 每個快取項目除了時間陣列以外的估計額外成本（鍵、tuple、陣列物件與 OrderedDict 節點）
+ENTRY_OVERHEAD_BYTES = 400
+
+# 計算染色體的雜湊鍵
+def chromosome_key(ss, ms):
+    """以 ss 與 ms 的內容計算 16 位元組的 BLAKE2b 雜湊，作為快取鍵"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(ss, dtype=np.int32).tobytes())
+    digest.update(b'|')
+    digest.update(np.asarray(ms, dtype=np.int32).tobytes())
+    return digest.digest()
+
+class FitnessCache:
+    """放在 evaluate_solution / evaluate_population 前面的 LRU 快取
+    
+    每個快取只對應一個問題實例。快取命中時回傳的結果就是當初評估時存下的值，
+    因此總耗時與不使用快取時完全相同。enabled 為 False 時直接呼叫原本的評估函式。
+    每個項目以 float64 陣列保存開始與結束時間（約 16·T 位元組），項目數超過 max_size
+    或估計的總位元組數超過 max_bytes 時移除最久未使用的項目。
+    """
+    
+    def __init__(self, instance=None, max_size=DEFAULT_CACHE_SIZE, enabled=True, max_bytes=DEFAULT_CACHE_BYTES):
+        self.instance = instance if instance is not None else get_default_instance()
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entry_bytes = 2 * self.instance.task_count * 8 + ENTRY_OVERHEAD_BYTES
+        self._entries = OrderedDict()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def _lookup(self, key):
+        """查詢快取並更新 LRU 順序與命中統計，未命中回傳 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+    
+    def _store(self, key, entry):
+        """存入快取，超過項目數或位元組上限時移除最久未使用的項目"""
+        if self.max_size <= 0 or self._entry_bytes > self.max_bytes:
+            return
+        if key not in self._entries:
+            self.bytes += self._entry_bytes
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size or self.bytes > self.max_bytes:
+            self._entries.popitem(last=False)
+            self.bytes -= self._entry_bytes
+    
+    def evaluate(self, solution):
+        """與 evaluate_solution 相同，但相同的 (ss, ms) 只評估一次"""
+        if not self.enabled:
+            return evaluate_solution(solution, self.instance)
+        
+        key = chromosome_key(solution['ss'], solution['ms'])
+        entry = self._lookup(key)
+        if entry is None:
+            evaluate_solution(solution, self.instance)
+            entry = (np.array(solution['start_times'], dtype=np.float64),
+                     np.array(solution['end_times'], dtype=np.float64), solution['makespan'])
+            self._store(key, entry)
+        else:
+            solution['start_times'] = entry[0].tolist()
+            solution['end_times'] = entry[1].tolist()
+            solution['makespan'] = entry[2]
+        
+        return solution
+    
+    def _evaluate_batch(self, ss_batch, ms_batch, evaluation_pool):
+        """批次評估；有行程池時交給 parallel_evaluation 平行評估"""
+        if evaluation_pool is not None:
+            from parallel_evaluation import parallel_evaluate_population
+            return parallel_evaluate_population(evaluation_pool, ss_batch, ms_batch)
+        return evaluate_population(ss_batch, ms_batch, self.instance)
+    
+    def evaluate_population(self, ss_batch, ms_batch, evaluation_pool=None):
+        """與 evaluate_population 相同，只把未命中的個體（同批重複者只算一次）送去批次評估
+        
+        evaluation_pool 為 parallel_evaluation.create_evaluation_pool 建立的行程池（須對應同一個實例），
+        提供時未命中的個體合成一批交給行程池平行評估。
+        """
+        if not self.enabled:
+            return self._evaluate_batch(ss_batch, ms_batch, evaluation_pool)
+        
+        ss_batch = np.atleast_2d(np.asarray(ss_batch, dtype=np.int64))
+        ms_batch = np.atleast_2d(np.asarray(ms_batch, dtype=np.int64))
+        pop_size = ss_batch.shape[0]
+        
+        makespans = np.zeros(pop_size)
+        task_start_times = np.zeros((pop_size, self.instance.task_count))
+        task_end_times = np.zeros((pop_size, self.instance.task_count))
+        
+        # 找出未命中的個體；同一批中重複的染色體只評估一次
+        keys = [chromosome_key(ss_batch[i], ms_batch[i]) for i in range(pop_size)]
+        pending = OrderedDict()
+        for i, key in enumerate(keys):
+            if key in pending:
+                pending[key].append(i)
+                self.hits += 1
+                continue
+            entry = self._lookup(key)
+            if entry is None:
+                pending[key] = [i]
+            else:
+                task_start_times[i], task_end_times[i], makespans[i] = entry
+        
+        if pending:
+            first_rows = [rows[0] for rows in pending.values()]
+            new_makespans, new_start, new_end = self._evaluate_batch(ss_batch[first_rows], ms_batch[first_rows],
+                                                                     evaluation_pool)
+            for k, (key, rows) in enumerate(pending.items()):
+                entry = (new_start[k].copy(), new_end[k].copy(), float(new_makespans[k]))
+                self._store(key, entry)
+                for i in rows:
+                    task_start_times[i], task_end_times[i], makespans[i] = entry
+        
+        return makespans, task_start_times, task_end_times
+    
+    def clear(self):
+        """清空快取與統計"""
+        self._entries.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def stats(self):
+        """回傳快取統計資料"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
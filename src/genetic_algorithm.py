@@ -0,0 +1,286 @@
+import numpy as np
+import argparse
+import os
+import time
+
+from scheduler_core import parse_problem_file, evaluate_population
+from lower_bounds import StoppingRule, makespan_lower_bounds
+from checkpoint import save_checkpoint, load_checkpoint, rng_state, restore_rng
+
+# 預設的遺傳演算法參數
+DEFAULT_POPULATION_SIZE = 100
+DEFAULT_GENERATIONS = 200
+DEFAULT_CROSSOVER_RATE = 0.9
+DEFAULT_MUTATION_RATE = 0.1
+DEFAULT_ELITE_COUNT = 2
+DEFAULT_TOURNAMENT_SIZE = 3
+DEFAULT_CHECKPOINT_INTERVAL = 10   # 每隔多少代寫一次檢查點
+
+# 產生隨機的拓撲排序
+def random_topological_order(instance, rng):
+    """每次從目前可執行（前置任務都已排入）的任務中隨機挑一個，產生符合依賴關係的 ss"""
+    pred_ptr = instance.pred_ptr
+    succ_ptr = instance.succ_ptr.tolist()
+    succ_idx = instance.succ_idx.tolist()
+    
+    in_degree = np.diff(pred_ptr).tolist()
+    ready = [task for task in range(instance.task_count) if in_degree[task] == 0]
+    order = []
+    while ready:
+        # 隨機取出一個可執行任務（與最後一個交換後 pop，維持 O(1)）
+        k = int(rng.integers(len(ready)))
+        ready[k], ready[-1] = ready[-1], ready[k]
+        task = ready.pop()
+        order.append(task)
+        for j in range(succ_ptr[task], succ_ptr[task + 1]):
+            succ = succ_idx[j]
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                ready.append(succ)
+    
+    return order
+
+# 初始化族群
+def init_population(instance, population_size, rng):
+    """產生初始族群：ss 為隨機拓撲排序，ms 為隨機處理器分配"""
+    ss_batch = np.array([random_topological_order(instance, rng) for _ in range(population_size)], dtype=np.int64)
+    ms_batch = rng.integers(instance.processor_count, size=(population_size, instance.task_count), dtype=np.int64)
+    return ss_batch, ms_batch
+
+# 錦標賽選擇
+def tournament_selection(makespans, count, tournament_size, rng):
+    """每次隨機抽 tournament_size 個個體，取總耗時最小者，共選出 count 個索引"""
+    candidates = rng.integers(len(makespans), size=(count, tournament_size))
+    winners = np.argmin(makespans[candidates], axis=1)
+    return candidates[np.arange(count), winners]
+
+# 保持先後順序的交配
+def crossover(ss_a, ms_a, ss_b, ms_b, rng):
+    """單點交配：子代 ss 取父代 A 的前段，其餘任務依父代 B 中的相對順序補上
+    
+    兩個父代都符合依賴關係時，子代的 ss 也必定符合依賴關係。
+    ms 以同一切點做單點交配。
+    """
+    task_count = len(ss_a)
+    cut = int(rng.integers(1, task_count)) if task_count > 1 else 0
+    
+    head = ss_a[:cut]
+    in_head = np.zeros(task_count, dtype=bool)
+    in_head[head] = True
+    child_ss = np.concatenate((head, ss_b[~in_head[ss_b]]))
+    
+    child_ms = np.concatenate((ms_a[:cut], ms_b[cut:]))
+    return child_ss, child_ms
+
+# 處理器分配的突變
+def mutate_ms(ms_batch, processor_count, mutation_rate, rng):
+    """每個基因以 mutation_rate 的機率重新分配到隨機處理器"""
+    mask = rng.random(ms_batch.shape) < mutation_rate
+    ms_batch[mask] = rng.integers(processor_count, size=int(mask.sum()))
+    return ms_batch
+
+# 產生下一代族群
+def evolve_generation(ss_batch, ms_batch, makespans, instance, rng, crossover_rate=DEFAULT_CROSSOVER_RATE,
+                      mutation_rate=DEFAULT_MUTATION_RATE, elite_count=DEFAULT_ELITE_COUNT,
+                      tournament_size=DEFAULT_TOURNAMENT_SIZE):
+    """依目前族群與其總耗時，經菁英保留、選擇、交配、突變產生下一代（尚未評估）的 (ss_batch, ms_batch)"""
+    population_size = len(ss_batch)
+    
+    # 菁英保留
+    order = np.argsort(makespans, kind='stable')
+    elite = order[:elite_count]
+    new_ss = [ss_batch[i] for i in elite]
+    new_ms = [ms_batch[i] for i in elite]
+    
+    # 選擇與交配產生其餘子代
+    offspring_count = population_size - len(new_ss)
+    parents = tournament_selection(makespans, 2 * offspring_count, tournament_size, rng)
+    for k in range(offspring_count):
+        a = parents[2 * k]
+        b = parents[2 * k + 1]
+        if rng.random() < crossover_rate:
+            child_ss, child_ms = crossover(ss_batch[a], ms_batch[a], ss_batch[b], ms_batch[b], rng)
+        else:
+            child_ss, child_ms = ss_batch[a].copy(), ms_batch[a].copy()
+        new_ss.append(child_ss)
+        new_ms.append(child_ms)
+    
+    ss_batch = np.array(new_ss)
+    ms_batch = np.array(new_ms)
+    
+    # 突變（不影響菁英）
+    mutate_ms(ms_batch[elite_count:], instance.processor_count, mutation_rate, rng)
+    
+    return ss_batch, ms_batch
+
+# 執行遺傳演算法
+def run_genetic_algorithm(instance, population_size=DEFAULT_POPULATION_SIZE, generations=DEFAULT_GENERATIONS,
+                          time_limit=None, crossover_rate=DEFAULT_CROSSOVER_RATE, mutation_rate=DEFAULT_MUTATION_RATE,
+                          elite_count=DEFAULT_ELITE_COUNT, tournament_size=DEFAULT_TOURNAMENT_SIZE,
+                          seed=None, verbose=True, evaluation_pool=None, fitness_cache=None, seed_solutions=None,
+                          lower_bound=None, stagnation_limit=None, checkpoint_path=None,
+                          checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL, resume=False):
+    """以遺傳演算法搜尋 ss/ms 排程，回傳最佳解決方案字典（含每代最佳總耗時 'history' 與停止原因 'stop_reason'）
+    
+    generations 為最多代數；time_limit（秒）不為 None 時，超過時間即停止。
+    lower_bound（例如 lower_bounds.makespan_lower_bounds 的 'lower_bound'）不為 None 時，最佳總耗時達到下界即停止；
+    stagnation_limit 不為 None 時，連續這麼多代沒有改進即停止。
+    evaluation_pool 為 parallel_evaluation.create_evaluation_pool 建立的行程池，提供時以多核心評估族群。
+    fitness_cache 為 fitness_cache.FitnessCache，提供時重複出現的染色體不再重新評估；同時提供 evaluation_pool 時，
+    未命中的染色體合成一批交給行程池評估。
+    seed_solutions 為 {'ss', 'ms'} 字典列表（例如 list_scheduling.heuristic_seeds 的結果），會放入初始族群。
+    checkpoint_path 不為 None 時，每 checkpoint_interval 代與結束時把族群、亂數狀態、代數與統計寫入檢查點；
+    resume 為 True 且檢查點存在時從檢查點接續（結果與未中斷的執行相同），time_limit 也包含先前執行的時間。
+    checkpoint_interval 必須至少為 1。
+    """
+    if checkpoint_interval < 1:
+        raise ValueError(f"checkpoint_interval 必須至少為 1（目前為 {checkpoint_interval}）")
+    rng = np.random.default_rng(seed)
+    start_clock = time.time()
+    
+    def evaluate(ss, ms):
+        if fitness_cache is not None:
+            return fitness_cache.evaluate_population(ss, ms, evaluation_pool)
+        if evaluation_pool is not None:
+            from parallel_evaluation import parallel_evaluate_population
+            return parallel_evaluate_population(evaluation_pool, ss, ms)
+        return evaluate_population(ss, ms, instance)
+    
+    stopping_rule = StoppingRule(lower_bound, stagnation_limit)
+    history = []
+    first_generation = 0
+    previous_elapsed = 0.0
+    
+    if resume and checkpoint_path is not None and os.path.exists(checkpoint_path):
+        arrays, state = load_checkpoint(checkpoint_path)
+        ss_batch, ms_batch, makespans = arrays['ss_batch'], arrays['ms_batch'], arrays['makespans']
+        if ss_batch.shape != (population_size, instance.task_count):
+            raise ValueError(f"檢查點的族群形狀 {ss_batch.shape} 與目前設定 "
+                             f"{(population_size, instance.task_count)} 不符")
+        rng = restore_rng(state['rng'])
+        history = arrays['history'].tolist()
+        first_generation = state['generation']
+        previous_elapsed = state['elapsed']
+        stopping_rule.best = state['stopping_best']
+        stopping_rule.stagnant_generations = state['stagnant_generations']
+        # 已因下界或停滯而結束的搜尋不再繼續；因代數或時間上限結束的可以延長
+        stop_reason = state['stop_reason'] if state['stop_reason'] in ('lower_bound', 'stagnation') else None
+        if verbose:
+            print(f"從檢查點 '{checkpoint_path}' 接續第 {first_generation} 代，最佳總耗時 = {makespans.min():.2f}")
+    else:
+        ss_batch, ms_batch = init_population(instance, population_size, rng)
+        if seed_solutions:
+            # 以啟發式解取代前幾個隨機個體
+            for i, solution in enumerate(seed_solutions[:population_size]):
+                ss_batch[i] = solution['ss']
+                ms_batch[i] = solution['ms']
+        makespans, _, _ = evaluate(ss_batch, ms_batch)
+        
+        # 初始族群（例如含有啟發式解）已達下界時不必再演化
+        stop_reason = stopping_rule.update(float(makespans.min()))
+        if stop_reason is not None and verbose:
+            print("初始族群已達總耗時下界，不需演化")
+    
+    def save(generation, reason):
+        best = int(np.argmin(makespans))
+        state = {
+            'generation': generation,
+            'elapsed': previous_elapsed + time.time() - start_clock,
+            'rng': rng_state(rng),
+            'stopping_best': stopping_rule.best,
+            'stagnant_generations': stopping_rule.stagnant_generations,
+            'stop_reason': reason,
+            'best_makespan': float(makespans[best]),
+        }
+        arrays = {
+            'ss_batch': ss_batch,
+            'ms_batch': ms_batch,
+            'makespans': makespans,
+            'history': np.asarray(history, dtype=np.float64),
+            'best_ss': ss_batch[best],
+            'best_ms': ms_batch[best],
+        }
+        save_checkpoint(checkpoint_path, arrays, state)
+    
+    completed = first_generation
+    for generation in range(first_generation, generations if stop_reason is None else first_generation):
+        ss_batch, ms_batch = evolve_generation(ss_batch, ms_batch, makespans, instance, rng, crossover_rate,
+                                               mutation_rate, elite_count, tournament_size)
+        
+        makespans, _, _ = evaluate(ss_batch, ms_batch)
+        best_makespan = float(makespans.min())
+        history.append(best_makespan)
+        completed = generation + 1
+        
+        if verbose:
+            print(f"第 {generation+1} 代: 最佳總耗時 = {best_makespan:.2f}")
+        
+        if time_limit is not None and previous_elapsed + time.time() - start_clock >= time_limit:
+            stop_reason = 'time_limit'
+            if verbose:
+                print(f"已達時間上限 {time_limit} 秒，於第 {generation+1} 代停止")
+            break
+        
+        reason = stopping_rule.update(best_makespan)
+        if reason is not None:
+            stop_reason = reason
+            if verbose:
+                if reason == 'lower_bound':
+                    print(f"最佳總耗時已達下界 {lower_bound:.2f}，於第 {generation+1} 代停止")
+                else:
+                    print(f"連續 {stagnation_limit} 代沒有改進，於第 {generation+1} 代停止")
+            break
+        
+        if checkpoint_path is not None and completed % checkpoint_interval == 0:
+            save(completed, None)
+    
+    stop_reason = stop_reason or 'generations'
+    if checkpoint_path is not None:
+        save(completed, stop_reason)
+    
+    best = int(np.argmin(makespans))
+    best_makespans, best_start, best_end = evaluate_population(ss_batch[best], ms_batch[best], instance)
+    return {
+        'ss': ss_batch[best].tolist(),
+        'ms': ms_batch[best].tolist(),
+        'start_times': best_start[0].tolist(),
+        'end_times': best_end[0].tolist(),
+        'makespan': float(best_makespans[0]),
+        'history': history,
+        'stop_reason': stop_reason,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="以遺傳演算法搜尋排程，可定期寫入檢查點並從檢查點接續")
+    parser.add_argument('instance', nargs='?', default="HW01-1.txt", help="問題案例文件")
+    parser.add_argument('--population', type=int, default=DEFAULT_POPULATION_SIZE, help="族群大小")
+    parser.add_argument('--generations', type=int, default=DEFAULT_GENERATIONS, help="最多代數")
+    parser.add_argument('--time-limit', type=float, default=None, help="時間上限（秒，包含先前執行的時間）")
+    parser.add_argument('--stagnation', type=int, default=50, help="連續多少代沒有改進即停止")
+    parser.add_argument('--seed', type=int, default=0, help="亂數種子")
+    parser.add_argument('--checkpoint', default=None, help="檢查點檔名（.npz）")
+    parser.add_argument('--checkpoint-interval', type=int, default=DEFAULT_CHECKPOINT_INTERVAL,
+                        help="每隔多少代寫一次檢查點")
+    parser.add_argument('--resume', action='store_true', help="檢查點存在時從檢查點接續")
+    args = parser.parse_args()
+    if args.checkpoint_interval < 1:
+        parser.error("--checkpoint-interval 必須至少為 1")
+    
+    start_time = time.time()
+    
+    # 解析問題案例文件
+    instance = parse_problem_file(args.instance)
+    
+    # 執行遺傳演算法；達到總耗時下界或連續多代沒有改進時提前停止
+    bounds = makespan_lower_bounds(instance)
+    print(f"總耗時下界: {bounds['lower_bound']:.2f}")
+    best_solution = run_genetic_algorithm(instance, args.population, args.generations, args.time_limit,
+                                          seed=args.seed, lower_bound=bounds['lower_bound'],
+                                          stagnation_limit=args.stagnation, checkpoint_path=args.checkpoint,
+                                          checkpoint_interval=args.checkpoint_interval, resume=args.resume)
+    
+    execution_time = time.time() - start_time
+    print(f"\n最佳排程 ss = {best_solution['ss']}")
+    print(f"最佳分配 ms = {best_solution['ms']}")
+    print(f"最佳總耗時: {best_solution['makespan']:.2f}")
+    print(f"程式執行耗時: {execution_time:.2f} 秒")
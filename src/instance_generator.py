@@ -0,0 +1,214 @@
+import numpy as np
+import argparse
+import os
+import time
+
+# 可產生的 DAG 形狀
+DAG_SHAPES = ('layered', 'fork_join', 'montage', 'cybershake', 'random')
+
+# 預設參數
+DEFAULT_PROCESSOR_COUNT = 4
+DEFAULT_DENSITY = 2.0          # 每個任務平均的前置任務數
+DEFAULT_CCR = 1.0              # 平均通信成本 / 平均計算成本
+DEFAULT_HETEROGENEITY = 0.5    # 處理器異質性 β，計算成本在 w̄·(1±β/2) 之間
+DEFAULT_MEAN_COMP_COST = 40.0  # 平均計算成本
+
+def _dedupe_edges(from_tasks, to_tasks, task_count):
+    """移除重複的邊並依 (起點, 終點) 排序"""
+    keys = np.unique(from_tasks.astype(np.int64) * task_count + to_tasks.astype(np.int64))
+    return keys // task_count, keys % task_count
+
+def _predecessor_counts(count, density, limits, rng):
+    """每個任務的前置任務數：1 + Poisson(density - 1)，並限制不超過可選的任務數"""
+    counts = 1 + rng.poisson(max(density - 1.0, 0.0), size=count)
+    return np.minimum(counts, limits)
+
+# 隨機 DAG
+def random_dag(task_count, density, rng):
+    """任務編號即為拓撲順序，每個任務從編號較小的任務中隨機選取前置任務"""
+    if task_count < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    targets = np.arange(1, task_count)
+    counts = _predecessor_counts(len(targets), density, targets, rng)
+    to_tasks = np.repeat(targets, counts)
+    from_tasks = (rng.random(len(to_tasks)) * to_tasks).astype(np.int64)
+    return _dedupe_edges(from_tasks, to_tasks, task_count)
+
+# 分層 DAG
+def layered_dag(task_count, density, rng):
+    """約 √T 層，每個任務的前置任務都在上一層"""
+    layer_count = max(1, int(round(np.sqrt(task_count))))
+    layer_of = (np.arange(task_count) * layer_count) // task_count
+    layer_start = np.searchsorted(layer_of, np.arange(layer_count))
+    layer_size = np.diff(np.append(layer_start, task_count))
+    
+    targets = np.flatnonzero(layer_of > 0)
+    if len(targets) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    previous = layer_of[targets] - 1
+    counts = _predecessor_counts(len(targets), density, layer_size[previous], rng)
+    to_tasks = np.repeat(targets, counts)
+    previous = np.repeat(previous, counts)
+    from_tasks = layer_start[previous] + (rng.random(len(to_tasks)) * layer_size[previous]).astype(np.int64)
+    return _dedupe_edges(from_tasks, to_tasks, task_count)
+
+# 分岔-匯合 DAG
+def fork_join_dag(task_count, density, rng):
+    """一連串「分岔 → width 個平行任務 → 匯合」的階段，匯合任務同時是下一階段的分岔任務
+    
+    width 約為 2·density；剩下不足一個階段的任務接成一條鏈。
+    """
+    width = max(2, int(round(2 * density)))
+    stage_count = (task_count - 1) // (width + 1)
+    joins = np.arange(stage_count + 1) * (width + 1)
+    branches = joins[:-1, None] + 1 + np.arange(width)
+    
+    from_tasks = [np.repeat(joins[:-1], width), branches.ravel()]
+    to_tasks = [branches.ravel(), np.repeat(joins[1:], width)]
+    
+    tail = np.arange(joins[-1], task_count)
+    from_tasks.append(tail[:-1])
+    to_tasks.append(tail[1:])
+    return _dedupe_edges(np.concatenate(from_tasks), np.concatenate(to_tasks), task_count)
+
+# 類 Montage 工作流程
+def montage_dag(task_count, density, rng):
+    """仿 Montage 天文影像拼接流程：
+    mProject(n) → mDiffFit(≈2n，各接兩張相鄰影像) → mConcatFit → mBgModel
+    → mBackground(n，另接對應的 mProject) → mImgtbl → mAdd → mShrink → mJPEG
+    """
+    if task_count < 10:
+        return random_dag(task_count, density, rng)
+    image_count = (task_count - 6) // 4
+    diff_count = task_count - 2 * image_count - 6
+    
+    projects = np.arange(image_count)
+    diffs = image_count + np.arange(diff_count)
+    concat_fit = image_count + diff_count
+    bg_model = concat_fit + 1
+    backgrounds = bg_model + 1 + np.arange(image_count)
+    img_tbl = backgrounds[-1] + 1
+    add, shrink, jpeg = img_tbl + 1, img_tbl + 2, img_tbl + 3
+    
+    # 每個 mDiffFit 比對一張影像與它後面第 1、2、… 張影像
+    first = np.arange(diff_count) % image_count
+    second = (first + 1 + np.arange(diff_count) // image_count) % image_count
+    from_tasks = [first, second, diffs, [concat_fit], np.full(image_count, bg_model), projects,
+                  backgrounds, [img_tbl, add, shrink]]
+    to_tasks = [diffs, diffs, np.full(diff_count, concat_fit), [bg_model], backgrounds, backgrounds,
+                np.full(image_count, img_tbl), [add, shrink, jpeg]]
+    from_tasks = np.concatenate([np.asarray(f, dtype=np.int64) for f in from_tasks])
+    to_tasks = np.concatenate([np.asarray(t, dtype=np.int64) for t in to_tasks])
+    return _dedupe_edges(from_tasks, to_tasks, task_count)
+
+# 類 CyberShake 工作流程
+def cybershake_dag(task_count, density, rng):
+    """仿 CyberShake 地震危害分析流程：
+    ExtractSGT(k) → SeismogramSynthesis(m，各接一個 ExtractSGT) → ZipSeis
+                    SeismogramSynthesis → PeakValCalc(m，一對一) → ZipPSA
+    """
+    if task_count < 6:
+        return random_dag(task_count, density, rng)
+    # 約 √m 個 ExtractSGT，其餘任務平分給 SeismogramSynthesis 與 PeakValCalc
+    extract_count = max(1, int(np.sqrt((task_count - 2) / 2)))
+    synth_count = (task_count - 2 - extract_count) // 2
+    extract_count = task_count - 2 - 2 * synth_count
+    
+    extracts = np.arange(extract_count)
+    synths = extract_count + np.arange(synth_count)
+    peaks = synths + synth_count
+    zip_seis = extract_count + 2 * synth_count
+    zip_psa = zip_seis + 1
+    
+    sources = rng.integers(0, extract_count, size=synth_count)
+    from_tasks = np.concatenate([extracts[sources], synths, synths, peaks])
+    to_tasks = np.concatenate([synths, np.full(synth_count, zip_seis), peaks, np.full(synth_count, zip_psa)])
+    return _dedupe_edges(from_tasks, to_tasks, task_count)
+
+DAG_BUILDERS = {
+    'layered': layered_dag,
+    'fork_join': fork_join_dag,
+    'montage': montage_dag,
+    'cybershake': cybershake_dag,
+    'random': random_dag,
+}
+
+# 產生問題實例
+def generate_instance(shape, task_count, processor_count=DEFAULT_PROCESSOR_COUNT, density=DEFAULT_DENSITY,
+                      ccr=DEFAULT_CCR, heterogeneity=DEFAULT_HETEROGENEITY, mean_comp_cost=DEFAULT_MEAN_COMP_COST,
+                      seed=None):
+    """產生合成的排程問題，回傳 (comp_cost T×P, comm_rate P×P, edges E×3)
+    
+    計算成本：每個任務的平均成本 w̄ 取自 U(0, 2·mean_comp_cost)，
+    各處理器上的成本再取自 U(w̄·(1-β/2), w̄·(1+β/2))，β 為 heterogeneity。
+    通信量取自 U(0, 2·ccr·mean_comp_cost)，不同處理器之間的通信率為 1。
+    相同的 seed 一定產生相同的實例。
+    """
+    if shape not in DAG_BUILDERS:
+        raise ValueError(f"未知的 DAG 形狀: {shape}（可用: {', '.join(DAG_SHAPES)}）")
+    rng = np.random.default_rng(seed)
+    
+    from_tasks, to_tasks = DAG_BUILDERS[shape](task_count, density, rng)
+    
+    mean_costs = rng.uniform(0.0, 2.0 * mean_comp_cost, size=task_count)
+    spread = rng.uniform(1.0 - heterogeneity / 2.0, 1.0 + heterogeneity / 2.0, size=(task_count, processor_count))
+    comp_cost = np.round(mean_costs[:, None] * spread, 1)
+    
+    comm_rate = np.ones((processor_count, processor_count)) - np.eye(processor_count)
+    
+    edges = np.empty((len(from_tasks), 3))
+    edges[:, 0] = from_tasks
+    edges[:, 1] = to_tasks
+    edges[:, 2] = np.round(rng.uniform(0.0, 2.0 * ccr * mean_comp_cost, size=len(from_tasks)))
+    return comp_cost, comm_rate, edges
+
+# 寫出問題檔案
+def write_problem_file(file_path, comp_cost, comm_rate, edges):
+    """以 HW01-1.txt 的區段格式寫出問題，可直接交給 parse_problem_file 讀取"""
+    task_count, processor_count = comp_cost.shape
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write("本區段之 ID 為0\n")
+        file.write("以下區段 (ID=1) 之參數分别為 :\n")
+        file.write("處理器個數 (thePCount)\n")
+        file.write("工作個數 (theTCount)\n")
+        file.write("有向邊個數 (theECount)\n")
+        file.write(f"{processor_count}\n{task_count}\n{len(edges)}\n\n")
+        
+        file.write("本區段之 ID 為2\n")
+        file.write("以下區段 (ID=3) 之參數 double[pFrom][pTo] theCommRate 的內容表示\n")
+        file.write("處理器 pFrom 傳送至處理器 pTo 一單位資料量所需的時間\n\n")
+        np.savetxt(file, comm_rate, fmt='%.1f')
+        file.write("\n")
+        
+        file.write("本區段之 ID 為 4\n")
+        file.write("以下區段 (ID=5) 之參數 double[tID][pID] theCompCost 的內容表示\n")
+        file.write("工作 tID 在處理器 pID 上執行所需的時間\n\n")
+        np.savetxt(file, comp_cost, fmt='%.1f')
+        file.write("\n")
+        
+        file.write("本區段之 ID 為 6\n")
+        file.write("以下區段 (ID=7) 之參數 TransData 的內容表示\n")
+        file.write("每行為 tFrom tTo 資料量\n\n")
+        np.savetxt(file, edges, fmt='%d')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="產生合成的 DAG 排程問題檔案")
+    parser.add_argument('shape', choices=DAG_SHAPES, help="DAG 形狀")
+    parser.add_argument('task_count', type=int, help="任務數")
+    parser.add_argument('-o', '--output', help="輸出檔名（預設為 <形狀>_<任務數>.txt）")
+    parser.add_argument('-p', '--processors', type=int, default=DEFAULT_PROCESSOR_COUNT, help="處理器個數")
+    parser.add_argument('--density', type=float, default=DEFAULT_DENSITY, help="每個任務平均的前置任務數")
+    parser.add_argument('--ccr', type=float, default=DEFAULT_CCR, help="通信計算比")
+    parser.add_argument('--heterogeneity', type=float, default=DEFAULT_HETEROGENEITY, help="處理器異質性 β（0~2）")
+    parser.add_argument('--seed', type=int, default=None, help="亂數種子")
+    args = parser.parse_args()
+    
+    start_time = time.time()
+    comp_cost, comm_rate, edges = generate_instance(args.shape, args.task_count, args.processors, args.density,
+                                                    args.ccr, args.heterogeneity, seed=args.seed)
+    output = args.output or f"{args.shape}_{args.task_count}.txt"
+    write_problem_file(os.path.abspath(output), comp_cost, comm_rate, edges)
+    
+    execution_time = time.time() - start_time
+    print(f"已寫出 {output}: 處理器個數={args.processors}, 工作個數={args.task_count}, 有向邊個數={len(edges)}")
+    print(f"程式執行耗時: {execution_time:.2f} 秒")
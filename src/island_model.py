@@ -0,0 +1,195 @@
+import numpy as np
+import multiprocessing
+import glob
+import os
+import tempfile
+import time
+import uuid
+
+from scheduler_core import parse_problem_file, evaluate_population
+from genetic_algorithm import (init_population, evolve_generation, DEFAULT_POPULATION_SIZE, DEFAULT_GENERATIONS,
+                               DEFAULT_CROSSOVER_RATE, DEFAULT_MUTATION_RATE, DEFAULT_ELITE_COUNT,
+                               DEFAULT_TOURNAMENT_SIZE)
+
+# 支援的遷移拓撲
+TOPOLOGIES = ('ring', 'full')
+
+# 預設的島嶼模型參數
+DEFAULT_ISLAND_COUNT = 4
+DEFAULT_MIGRATION_INTERVAL = 10
+DEFAULT_MIGRATION_RATE = 0.05
+DEFAULT_MIGRATION_TIMEOUT = 60.0
+
+# 取得遷入來源
+def migration_sources(island_id, island_count, topology):
+    """回傳會把菁英送到此島嶼的島嶼編號列表"""
+    if topology == 'ring':
+        return [(island_id - 1) % island_count] if island_count > 1 else []
+    if topology == 'full':
+        return [i for i in range(island_count) if i != island_id]
+    raise ValueError(f"未知的遷移拓撲: {topology}（可用: {', '.join(TOPOLOGIES)}）")
+
+def _migration_path(migration_dir, run_id, island_id, epoch):
+    """某次執行（run_id）中某島嶼在第 epoch 次遷移時寫出的檔案路徑"""
+    return os.path.join(migration_dir, f"{run_id}_island_{island_id}_epoch_{epoch}.npz")
+
+def clear_migration_files(migration_dir, run_id):
+    """刪除 migration_dir 中屬於 run_id 的遷移檔案（包括寫到一半的暫存檔）"""
+    for path in glob.glob(os.path.join(glob.escape(migration_dir), f"{glob.escape(run_id)}_island_*")):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+# 以檔案傳送遷出個體
+def send_migrants(migration_dir, run_id, island_id, epoch, ss_migrants, ms_migrants):
+    """將遷出個體寫成 .npz；先寫暫存檔再 os.replace，讀取端不會看到寫到一半的檔案"""
+    path = _migration_path(migration_dir, run_id, island_id, epoch)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as file:
+        np.savez(file, ss=ss_migrants, ms=ms_migrants)
+    os.replace(temp_path, path)
+
+# 以檔案接收遷入個體
+def receive_migrants(migration_dir, run_id, island_id, epoch, timeout=DEFAULT_MIGRATION_TIMEOUT):
+    """等待並讀取指定島嶼在第 epoch 次遷移寫出的個體，回傳 (ss, ms)；逾時回傳 None"""
+    path = _migration_path(migration_dir, run_id, island_id, epoch)
+    deadline = time.time() + timeout
+    while not os.path.exists(path):
+        if time.time() > deadline:
+            return None
+        time.sleep(0.01)
+    with np.load(path) as data:
+        return data['ss'], data['ms']
+
+# 單一島嶼的演化流程
+def run_island(island_id, instance, island_count, topology, migration_dir, run_id, seed_sequence,
+               population_size=DEFAULT_POPULATION_SIZE, generations=DEFAULT_GENERATIONS,
+               migration_interval=DEFAULT_MIGRATION_INTERVAL, migration_rate=DEFAULT_MIGRATION_RATE,
+               crossover_rate=DEFAULT_CROSSOVER_RATE, mutation_rate=DEFAULT_MUTATION_RATE,
+               elite_count=DEFAULT_ELITE_COUNT, tournament_size=DEFAULT_TOURNAMENT_SIZE,
+               migration_timeout=DEFAULT_MIGRATION_TIMEOUT):
+    """在一個島嶼上執行遺傳演算法，每 migration_interval 代與鄰居交換菁英
+    
+    遷移檔案以 run_id 區分，共用同一個目錄的不同次執行不會讀到彼此的檔案。遷入個體取代族群中最差的個體；
+    等待某個來源逾時時只略過該來源這一次的遷移，不會中止整個島嶼。
+    回傳此島嶼最佳的解決方案字典，'missed_migrations' 為逾時略過的次數。
+    """
+    rng = np.random.default_rng(seed_sequence)
+    sources = migration_sources(island_id, island_count, topology)
+    migrant_count = max(1, int(round(migration_rate * population_size)))
+    
+    ss_batch, ms_batch = init_population(instance, population_size, rng)
+    makespans, _, _ = evaluate_population(ss_batch, ms_batch, instance)
+    
+    history = []
+    missed_migrations = 0
+    for generation in range(generations):
+        ss_batch, ms_batch = evolve_generation(ss_batch, ms_batch, makespans, instance, rng, crossover_rate,
+                                               mutation_rate, elite_count, tournament_size)
+        makespans, _, _ = evaluate_population(ss_batch, ms_batch, instance)
+        
+        # 週期性遷移
+        if sources and (generation + 1) % migration_interval == 0 and generation + 1 < generations:
+            epoch = (generation + 1) // migration_interval
+            order = np.argsort(makespans, kind='stable')
+            best = order[:migrant_count]
+            send_migrants(migration_dir, run_id, island_id, epoch, ss_batch[best], ms_batch[best])
+            
+            incoming_ss = []
+            incoming_ms = []
+            for source in sources:
+                migrants = receive_migrants(migration_dir, run_id, source, epoch, migration_timeout)
+                if migrants is None:
+                    missed_migrations += 1
+                    print(f"島嶼 {island_id}: 等待島嶼 {source} 第 {epoch} 次遷移逾時，略過這次遷移")
+                    continue
+                incoming_ss.append(migrants[0])
+                incoming_ms.append(migrants[1])
+            
+            if incoming_ss:
+                incoming_ss = np.concatenate(incoming_ss)[:population_size - elite_count]
+                incoming_ms = np.concatenate(incoming_ms)[:population_size - elite_count]
+                
+                # 以遷入個體取代最差的個體
+                worst = order[::-1][:len(incoming_ss)]
+                ss_batch[worst] = incoming_ss
+                ms_batch[worst] = incoming_ms
+                incoming_makespans, _, _ = evaluate_population(incoming_ss, incoming_ms, instance)
+                makespans[worst] = incoming_makespans
+        
+        history.append(float(makespans.min()))
+    
+    best = int(np.argmin(makespans))
+    best_makespans, best_start, best_end = evaluate_population(ss_batch[best], ms_batch[best], instance)
+    return {
+        'island': island_id,
+        'ss': ss_batch[best].tolist(),
+        'ms': ms_batch[best].tolist(),
+        'start_times': best_start[0].tolist(),
+        'end_times': best_end[0].tolist(),
+        'makespan': float(best_makespans[0]),
+        'history': history,
+        'missed_migrations': missed_migrations,
+    }
+
+def _run_island_star(args):
+    """Pool.map 用的包裝"""
+    island_id, instance, island_count, topology, migration_dir, run_id, seed_sequence, options = args
+    return run_island(island_id, instance, island_count, topology, migration_dir, run_id, seed_sequence, **options)
+
+# 執行島嶼模型
+def run_island_model(instance, island_count=DEFAULT_ISLAND_COUNT, topology='ring', migration_dir=None, seed=None,
+                     verbose=True, run_id=None, **options):
+    """在多個行程上各跑一個島嶼，透過 migration_dir 中的檔案交換菁英
+    
+    migration_dir 省略時使用暫存目錄；若多台機器共用同一個目錄，也可以以相同的 run_id 分別呼叫 run_island。
+    run_id 省略時每次執行產生新的識別碼，開始前與結束後都會清除 migration_dir 中屬於此 run_id 的遷移檔案。
+    其餘參數（population_size、generations、migration_interval、migration_rate 等）傳給 run_island。
+    回傳所有島嶼中最佳的解決方案字典，並附上 'islands'（每個島嶼的結果）。
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"未知的遷移拓撲: {topology}（可用: {', '.join(TOPOLOGIES)}）")
+    
+    seed_sequences = np.random.SeedSequence(seed).spawn(island_count)
+    
+    if run_id is None:
+        run_id = uuid.uuid4().hex
+    
+    with tempfile.TemporaryDirectory(prefix='islands_') as temp_dir:
+        directory = migration_dir if migration_dir is not None else temp_dir
+        os.makedirs(directory, exist_ok=True)
+        clear_migration_files(directory, run_id)
+        tasks = [(i, instance, island_count, topology, directory, run_id, seed_sequences[i], options)
+                 for i in range(island_count)]
+        
+        # 每個島嶼一個行程，所有島嶼必須同時執行才能互相遷移
+        try:
+            with multiprocessing.Pool(processes=island_count) as pool:
+                results = pool.map(_run_island_star, tasks, chunksize=1)
+        finally:
+            clear_migration_files(directory, run_id)
+    
+    if verbose:
+        for result in results:
+            print(f"島嶼 {result['island']}: 最佳總耗時 = {result['makespan']:.2f}")
+    
+    best = dict(min(results, key=lambda result: result['makespan']))
+    best['islands'] = results
+    return best
+
+if __name__ == "__main__":
+    start_time = time.time()
+    
+    # 解析問題案例文件
+    instance = parse_problem_file("HW01-1.txt")
+    
+    # 執行島嶼模型
+    best_solution = run_island_model(instance, seed=0)
+    
+    execution_time = time.time() - start_time
+    print(f"\n最佳島嶼: {best_solution['island']}")
+    print(f"最佳排程 ss = {best_solution['ss']}")
+    print(f"最佳分配 ms = {best_solution['ms']}")
+    print(f"最佳總耗時: {best_solution['makespan']:.2f}")
+    print(f"程式執行耗時: {execution_time:.2f} 秒")
@@ -0,0 +1,182 @@
+import numpy as np
+import heapq
+import time
+
+from scheduler_core import parse_problem_file, get_default_instance, evaluate_solution
+
+# 平均計算與通信成本
+def average_costs(instance):
+    """回傳 (每個任務的平均計算成本, 不同處理器之間的平均通信率)"""
+    mean_comp = instance.comp_cost.mean(axis=1)
+    processor_count = instance.processor_count
+    if processor_count > 1:
+        off_diagonal = ~np.eye(processor_count, dtype=bool)
+        mean_rate = float(instance.comm_rate[off_diagonal].mean())
+    else:
+        mean_rate = 0.0
+    return mean_comp, mean_rate
+
+# 向上排名
+def upward_rank(instance):
+    """rank_u(t) = w̄(t) + max(c̄(t, s) + rank_u(s))，沿反向拓撲順序計算，O(T+E)"""
+    mean_comp, mean_rate = average_costs(instance)
+    succ_ptr = instance.succ_ptr
+    succ_idx = instance.succ_idx
+    succ_vol = instance.succ_vol
+    
+    rank = mean_comp.copy()
+    for task in instance.topo_order[::-1].tolist():
+        lo, hi = succ_ptr[task], succ_ptr[task + 1]
+        if hi > lo:
+            rank[task] += (succ_vol[lo:hi] * mean_rate + rank[succ_idx[lo:hi]]).max()
+    return rank
+
+# 向下排名
+def downward_rank(instance):
+    """rank_d(t) = max(rank_d(p) + w̄(p) + c̄(p, t))，沿拓撲順序計算，O(T+E)"""
+    mean_comp, mean_rate = average_costs(instance)
+    pred_ptr = instance.pred_ptr
+    pred_idx = instance.pred_idx
+    pred_vol = instance.pred_vol
+    
+    rank = np.zeros(instance.task_count)
+    for task in instance.topo_order.tolist():
+        lo, hi = pred_ptr[task], pred_ptr[task + 1]
+        if hi > lo:
+            preds = pred_idx[lo:hi]
+            rank[task] = (rank[preds] + mean_comp[preds] + pred_vol[lo:hi] * mean_rate).max()
+    return rank
+
+def _delay_rates(instance):
+    """同一處理器之間不計通信時間（與 evaluate_solution 相同）的通信率矩陣"""
+    rates = np.array(instance.comm_rate)
+    np.fill_diagonal(rates, 0.0)
+    return rates
+
+def _ready_times(task, instance, delay_rates, task_end_times, assigned):
+    """任務在每個處理器上的資料就緒時間（長度 P 的陣列），O(入度·P)"""
+    lo, hi = instance.pred_ptr[task], instance.pred_ptr[task + 1]
+    if hi == lo:
+        return np.zeros(instance.processor_count)
+    preds = instance.pred_idx[lo:hi]
+    arrivals = task_end_times[preds][:, None] + instance.pred_vol[lo:hi][:, None] * delay_rates[assigned[preds]]
+    return arrivals.max(axis=0)
+
+def _schedule_in_order(order, instance, fixed_processors=None):
+    """依給定順序排入任務，每個任務選擇最早完成時間（EFT）的處理器，回傳含排程結果的解決方案字典
+    
+    處理器上只接在最後一個任務之後（與 evaluate_solution 的規則相同），
+    因此回傳的開始、結束時間與總耗時和把 (ss, ms) 交給 evaluate_solution 的結果完全相同。
+    fixed_processors 為 {任務: 處理器}，指定的任務直接放到該處理器。
+    """
+    delay_rates = _delay_rates(instance)
+    comp_cost = instance.comp_cost
+    processor_finish_time = np.zeros(instance.processor_count)
+    task_start_times = np.zeros(instance.task_count)
+    task_end_times = np.zeros(instance.task_count)
+    assigned = np.zeros(instance.task_count, dtype=np.int64)
+    
+    for task in order:
+        ready = _ready_times(task, instance, delay_rates, task_end_times, assigned)
+        start = np.maximum(ready, processor_finish_time)
+        finish = start + comp_cost[task]
+        if fixed_processors is not None and task in fixed_processors:
+            processor = fixed_processors[task]
+        else:
+            processor = int(np.argmin(finish))
+        assigned[task] = processor
+        task_start_times[task] = start[processor]
+        task_end_times[task] = finish[processor]
+        processor_finish_time[processor] = finish[processor]
+    
+    return {
+        'ss': [int(task) for task in order],
+        'ms': assigned.tolist(),
+        'start_times': task_start_times.tolist(),
+        'end_times': task_end_times.tolist(),
+        'makespan': float(task_end_times.max()),
+    }
+
+# HEFT
+def heft_schedule(instance=None):
+    """HEFT：依向上排名由大到小排序，逐一放到最早完成的處理器，回傳含排程結果與總耗時的解決方案字典"""
+    if instance is None:
+        instance = get_default_instance()
+    
+    rank = upward_rank(instance)
+    
+    # 排名相同時依拓撲排序先後，確保前置任務（排名不小於後繼）排在前面
+    topo_rank = np.empty(instance.task_count, dtype=np.int64)
+    topo_rank[instance.topo_order] = np.arange(instance.task_count)
+    order = np.lexsort((topo_rank, -rank))
+    
+    return _schedule_in_order(order.tolist(), instance)
+
+# CPOP
+def cpop_schedule(instance=None):
+    """CPOP：關鍵路徑上的任務固定放到使其總計算成本最小的處理器，其餘任務用 EFT，回傳含排程結果與總耗時的解決方案字典"""
+    if instance is None:
+        instance = get_default_instance()
+    
+    priority = upward_rank(instance) + downward_rank(instance)
+    pred_ptr = instance.pred_ptr
+    succ_ptr = instance.succ_ptr
+    succ_idx = instance.succ_idx
+    
+    # 從優先權最大的入口任務開始，沿優先權等於關鍵路徑長度的後繼任務找出關鍵路徑
+    in_degree = np.diff(pred_ptr)
+    entries = np.flatnonzero(in_degree == 0)
+    entry = int(entries[np.argmax(priority[entries])])
+    critical_length = priority[entry]
+    tolerance = 1e-9 * max(1.0, abs(critical_length))
+    
+    critical_path = [entry]
+    task = entry
+    while succ_ptr[task + 1] > succ_ptr[task]:
+        succs = succ_idx[succ_ptr[task]:succ_ptr[task + 1]]
+        on_path = succs[np.abs(priority[succs] - critical_length) <= tolerance]
+        if len(on_path) == 0:
+            break
+        task = int(on_path[0])
+        critical_path.append(task)
+    
+    critical_processor = int(np.argmin(instance.comp_cost[critical_path].sum(axis=0)))
+    fixed_processors = {task: critical_processor for task in critical_path}
+    
+    # 就緒列表：每次取出優先權最大的可執行任務
+    remaining = in_degree.tolist()
+    heap = [(-priority[t], int(t)) for t in entries]
+    heapq.heapify(heap)
+    order = []
+    while heap:
+        _, task = heapq.heappop(heap)
+        order.append(task)
+        for succ in succ_idx[succ_ptr[task]:succ_ptr[task + 1]].tolist():
+            remaining[succ] -= 1
+            if remaining[succ] == 0:
+                heapq.heappush(heap, (-priority[succ], succ))
+    
+    return _schedule_in_order(order, instance, fixed_processors)
+
+# 產生啟發式種子
+def heuristic_seeds(instance=None):
+    """回傳 HEFT 與 CPOP 的解決方案，可作為遺傳演算法的初始個體"""
+    if instance is None:
+        instance = get_default_instance()
+    return [heft_schedule(instance), cpop_schedule(instance)]
+
+if __name__ == "__main__":
+    start_time = time.time()
+    
+    # 解析問題案例文件
+    instance = parse_problem_file("HW01-1.txt")
+    
+    for name, scheduler in (('HEFT', heft_schedule), ('CPOP', cpop_schedule)):
+        solution = evaluate_solution(scheduler(instance), instance)
+        print(f"\n{name}:")
+        print(f"ss = {solution['ss']}")
+        print(f"ms = {solution['ms']}")
+        print(f"總耗時: {solution['makespan']:.2f}")
+    
+    execution_time = time.time() - start_time
+    print(f"\n程式執行耗時: {execution_time:.2f} 秒")
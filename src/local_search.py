@@ -0,0 +1,343 @@
+import numpy as np
+import math
+import time
+
+from scheduler_core import parse_problem_file, get_default_instance, reschedule_suffix
+from compiled_kernel import kernel_available, evaluate_arrays
+from list_scheduling import heft_schedule
+from lower_bounds import StoppingRule, makespan_lower_bounds
+
+# 預設的模擬退火參數
+DEFAULT_SA_ITERATIONS = 100000
+DEFAULT_INITIAL_TEMPERATURE_RATIO = 0.05   # 初始溫度為初始總耗時的比例
+DEFAULT_FINAL_TEMPERATURE_RATIO = 1e-4     # 最終溫度為初始總耗時的比例
+DEFAULT_SA_REPORT_INTERVAL = 1000          # 每隔多少次移動記錄最佳總耗時並檢查停止條件
+
+# 預設的禁忌搜尋參數
+DEFAULT_TABU_ITERATIONS = 2000
+DEFAULT_NEIGHBORHOOD_SIZE = 50
+DEFAULT_TABU_TENURE = 20
+DEFAULT_TABU_REPORT_INTERVAL = 100
+
+# 鄰域移動中 ss 相鄰交換所佔的比例（其餘為處理器重新分配）
+DEFAULT_SWAP_PROBABILITY = 0.5
+
+class DeltaEvaluator:
+    """保存目前的 ss/ms 與排程時間，評估鄰域移動時只重算第一個受影響位置之後的排程
+    
+    移動先以 try_swap / try_reassign 暫時套用並回傳新的總耗時，再以 accept 保留或 reject 還原。
+    編譯核心可用時以 NumPy 陣列與 compiled_kernel.evaluate_arrays 計算（嘗試移動時重複使用同一組暫存陣列），
+    否則以 Python 列表與 reschedule_suffix 計算，兩者結果相同。
+    """
+    
+    def __init__(self, instance, ss, ms, use_kernel=None):
+        self.instance = instance
+        self.use_kernel = kernel_available() if use_kernel is None else use_kernel
+        task_count = instance.task_count
+        if self.use_kernel:
+            self.ss = np.array(ss, dtype=np.int64)
+            self.ms = np.array(ms, dtype=np.int64)
+            self.start_times = np.zeros(task_count)
+            self.end_times = np.zeros(task_count)
+            self._processor_finish_time = np.zeros(instance.processor_count)
+            self._scratch = (np.zeros(task_count), np.zeros(task_count))
+        else:
+            self.ss = [int(task) for task in ss]
+            self.ms = [int(processor) for processor in ms]
+            self.start_times = [0] * task_count
+            self.end_times = [0] * task_count
+        
+        self.position = [0] * task_count
+        for k, task in enumerate(self.ss):
+            self.position[int(task)] = k
+        
+        # 依賴邊集合（起點·T + 終點），用於判斷相鄰交換是否違反依賴
+        to_tasks = np.repeat(np.arange(task_count), np.diff(instance.pred_ptr))
+        self._edges = set((instance.pred_idx * task_count + to_tasks).tolist())
+        
+        self.makespan = self._simulate(0, self.start_times, self.end_times)
+        self.moves_evaluated = 0
+        self._pending = None
+    
+    def _simulate(self, first, start_times, end_times):
+        """從位置 first 開始重算，就地更新傳入的時間陣列並回傳總耗時"""
+        if self.use_kernel:
+            makespan, _, _ = evaluate_arrays(self.ss, self.ms, self.instance, start_times, end_times, first,
+                                             self._processor_finish_time)
+            return makespan
+        return reschedule_suffix(self.ss, self.ms, first, start_times, end_times, self.instance)
+    
+    def _try(self, first, move):
+        """在目前時間的副本上重算已套用的移動，並記下以便 accept 或 reject"""
+        if self.use_kernel:
+            start_times, end_times = self._scratch
+            np.copyto(start_times, self.start_times)
+            np.copyto(end_times, self.end_times)
+        else:
+            start_times = self.start_times.copy()
+            end_times = self.end_times.copy()
+        makespan = self._simulate(first, start_times, end_times)
+        self._pending = (move, start_times, end_times, makespan)
+        self.moves_evaluated += 1
+        return makespan
+    
+    def can_swap(self, position):
+        """ss 中位置 position 與 position+1 的任務交換後是否仍符合依賴關係"""
+        if position < 0 or position + 1 >= len(self.ss):
+            return False
+        return int(self.ss[position]) * self.instance.task_count + int(self.ss[position + 1]) not in self._edges
+    
+    def try_swap(self, position):
+        """暫時交換 ss 中位置 position 與 position+1 的任務，回傳新的總耗時"""
+        ss = self.ss
+        ss[position], ss[position + 1] = ss[position + 1], ss[position]
+        return self._try(position, ('swap', position))
+    
+    def try_reassign(self, task, processor):
+        """暫時把任務改到 processor，回傳新的總耗時"""
+        previous = self.ms[task]
+        self.ms[task] = processor
+        return self._try(self.position[task], ('reassign', task, previous))
+    
+    def accept(self):
+        """保留上一次嘗試的移動"""
+        move, start_times, end_times, makespan = self._pending
+        self._pending = None
+        if move[0] == 'swap':
+            position = move[1]
+            self.position[int(self.ss[position])] = position
+            self.position[int(self.ss[position + 1])] = position + 1
+        if self.use_kernel:
+            # 舊的時間陣列改當下一次嘗試的暫存陣列
+            self._scratch = (self.start_times, self.end_times)
+        self.start_times = start_times
+        self.end_times = end_times
+        self.makespan = makespan
+    
+    def reject(self):
+        """還原上一次嘗試的移動"""
+        move = self._pending[0]
+        self._pending = None
+        if move[0] == 'swap':
+            position = move[1]
+            self.ss[position], self.ss[position + 1] = self.ss[position + 1], self.ss[position]
+        else:
+            _, task, previous = move
+            self.ms[task] = previous
+    
+    def solution(self):
+        """目前的解決方案字典（與 evaluate_solution 的輸出格式相同）"""
+        if self.use_kernel:
+            return {
+                'ss': self.ss.tolist(),
+                'ms': self.ms.tolist(),
+                'start_times': self.start_times.tolist(),
+                'end_times': self.end_times.tolist(),
+                'makespan': float(self.makespan),
+            }
+        return {
+            'ss': [int(task) for task in self.ss],
+            'ms': [int(processor) for processor in self.ms],
+            'start_times': [float(t) for t in self.start_times],
+            'end_times': [float(t) for t in self.end_times],
+            'makespan': float(self.makespan),
+        }
+
+def _initial_evaluator(instance, solution):
+    """以指定的初始解（預設為 HEFT 排程）建立 DeltaEvaluator"""
+    if solution is None:
+        solution = heft_schedule(instance)
+    return DeltaEvaluator(instance, solution['ss'], solution['ms'])
+
+# 模擬退火
+def simulated_annealing(instance=None, solution=None, iterations=DEFAULT_SA_ITERATIONS, initial_temperature=None,
+                        final_temperature=None, swap_probability=DEFAULT_SWAP_PROBABILITY, time_limit=None,
+                        seed=None, lower_bound=None, stagnation_limit=None,
+                        report_interval=DEFAULT_SA_REPORT_INTERVAL, verbose=True):
+    """以模擬退火搜尋 ss/ms 排程，回傳最佳解決方案字典（含 'history'、'stop_reason' 與 'moves_evaluated'）
+    
+    每次移動為 ss 中相鄰且沒有依賴關係的兩個任務交換，或把一個任務改到其他處理器，
+    並以 DeltaEvaluator 只重算受影響的後段。溫度由 initial_temperature 等比降到 final_temperature
+    （預設為初始總耗時的 5% 與 0.01%）。history 與 stagnation_limit 都以 report_interval 次移動為單位。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    rng = np.random.default_rng(seed)
+    start_clock = time.time()
+    
+    evaluator = _initial_evaluator(instance, solution)
+    best = evaluator.solution()
+    scale = evaluator.makespan if evaluator.makespan > 0 else 1.0
+    temperature = initial_temperature if initial_temperature is not None else DEFAULT_INITIAL_TEMPERATURE_RATIO * scale
+    final_temperature = final_temperature if final_temperature is not None else DEFAULT_FINAL_TEMPERATURE_RATIO * scale
+    cooling = (final_temperature / temperature) ** (1.0 / max(iterations, 1))
+    
+    task_count = instance.task_count
+    processor_count = instance.processor_count
+    stopping_rule = StoppingRule(lower_bound, stagnation_limit)
+    stop_reason = stopping_rule.update(best['makespan'])
+    history = []
+    
+    for chunk_start in range(0, iterations if stop_reason is None else 0, report_interval):
+        count = min(report_interval, iterations - chunk_start)
+        
+        # 整段預先抽好亂數，避免每次移動都呼叫亂數產生器
+        move_draws = rng.random(count).tolist()
+        positions = rng.integers(0, max(task_count - 1, 1), count).tolist()
+        tasks = rng.integers(0, task_count, count).tolist()
+        shifts = rng.integers(1, max(processor_count, 2), count).tolist()
+        accept_draws = rng.random(count).tolist()
+        
+        for k in range(count):
+            if move_draws[k] < swap_probability:
+                if not evaluator.can_swap(positions[k]):
+                    temperature *= cooling
+                    continue
+                makespan = evaluator.try_swap(positions[k])
+            else:
+                if processor_count < 2:
+                    temperature *= cooling
+                    continue
+                task = tasks[k]
+                makespan = evaluator.try_reassign(task, (int(evaluator.ms[task]) + shifts[k]) % processor_count)
+            
+            delta = makespan - evaluator.makespan
+            if delta <= 0 or accept_draws[k] < math.exp(-delta / temperature):
+                evaluator.accept()
+                if makespan < best['makespan']:
+                    best = evaluator.solution()
+            else:
+                evaluator.reject()
+            temperature *= cooling
+        
+        history.append(best['makespan'])
+        if verbose:
+            print(f"第 {chunk_start + count} 次移動: 最佳總耗時 = {best['makespan']:.2f}，溫度 = {temperature:.4f}")
+        
+        if time_limit is not None and time.time() - start_clock >= time_limit:
+            stop_reason = 'time_limit'
+            if verbose:
+                print(f"已達時間上限 {time_limit} 秒，於第 {chunk_start + count} 次移動停止")
+            break
+        stop_reason = stopping_rule.update(best['makespan'])
+        if stop_reason is not None:
+            if verbose:
+                print(f"停止條件 {stop_reason} 成立，於第 {chunk_start + count} 次移動停止")
+            break
+    
+    best['history'] = history
+    best['stop_reason'] = stop_reason or 'iterations'
+    best['moves_evaluated'] = evaluator.moves_evaluated
+    return best
+
+# 禁忌搜尋
+def tabu_search(instance=None, solution=None, iterations=DEFAULT_TABU_ITERATIONS,
+                neighborhood_size=DEFAULT_NEIGHBORHOOD_SIZE, tabu_tenure=DEFAULT_TABU_TENURE,
+                swap_probability=DEFAULT_SWAP_PROBABILITY, time_limit=None, seed=None, lower_bound=None,
+                stagnation_limit=None, verbose=True):
+    """以禁忌搜尋搜尋 ss/ms 排程，回傳最佳解決方案字典（含每次迭代最佳總耗時 'history'）
+    
+    每次迭代隨機抽 neighborhood_size 個鄰域移動並以 DeltaEvaluator 評估，移到其中最好的非禁忌移動
+    （可比目前最佳解更好時無視禁忌）。移動後 tabu_tenure 次迭代內禁止把任務改回原處理器，
+    或再次交換同一對任務。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    rng = np.random.default_rng(seed)
+    start_clock = time.time()
+    
+    evaluator = _initial_evaluator(instance, solution)
+    best = evaluator.solution()
+    task_count = instance.task_count
+    processor_count = instance.processor_count
+    tabu_until = {}
+    
+    stopping_rule = StoppingRule(lower_bound, stagnation_limit)
+    stop_reason = stopping_rule.update(best['makespan'])
+    history = []
+    
+    for iteration in range(iterations if stop_reason is None else 0):
+        move_draws = rng.random(neighborhood_size).tolist()
+        positions = rng.integers(0, max(task_count - 1, 1), neighborhood_size).tolist()
+        tasks = rng.integers(0, task_count, neighborhood_size).tolist()
+        shifts = rng.integers(1, max(processor_count, 2), neighborhood_size).tolist()
+        
+        # 評估鄰域，找出最好的可行移動
+        chosen = None
+        chosen_makespan = float('inf')
+        for k in range(neighborhood_size):
+            if move_draws[k] < swap_probability:
+                position = positions[k]
+                if not evaluator.can_swap(position):
+                    continue
+                a, b = int(evaluator.ss[position]), int(evaluator.ss[position + 1])
+                move = ('swap', position)
+                attribute = ('ss', min(a, b), max(a, b))
+                makespan = evaluator.try_swap(position)
+            else:
+                if processor_count < 2:
+                    continue
+                task = tasks[k]
+                processor = (int(evaluator.ms[task]) + shifts[k]) % processor_count
+                move = ('reassign', task, processor)
+                attribute = ('ms', task, processor)
+                makespan = evaluator.try_reassign(task, processor)
+            evaluator.reject()
+            
+            is_tabu = tabu_until.get(attribute, -1) > iteration
+            if (not is_tabu or makespan < best['makespan']) and makespan < chosen_makespan:
+                chosen = move
+                chosen_makespan = makespan
+        
+        # 執行選中的移動，並禁止在一段時間內把它復原
+        if chosen is not None:
+            if chosen[0] == 'swap':
+                position = chosen[1]
+                a, b = int(evaluator.ss[position]), int(evaluator.ss[position + 1])
+                evaluator.try_swap(position)
+                tabu_until[('ss', min(a, b), max(a, b))] = iteration + tabu_tenure
+            else:
+                _, task, processor = chosen
+                previous = int(evaluator.ms[task])
+                evaluator.try_reassign(task, processor)
+                tabu_until[('ms', task, previous)] = iteration + tabu_tenure
+            evaluator.accept()
+            if evaluator.makespan < best['makespan']:
+                best = evaluator.solution()
+        
+        history.append(best['makespan'])
+        if verbose and (iteration + 1) % DEFAULT_TABU_REPORT_INTERVAL == 0:
+            print(f"第 {iteration+1} 次迭代: 最佳總耗時 = {best['makespan']:.2f}，目前總耗時 = {evaluator.makespan:.2f}")
+        
+        if time_limit is not None and time.time() - start_clock >= time_limit:
+            stop_reason = 'time_limit'
+            if verbose:
+                print(f"已達時間上限 {time_limit} 秒，於第 {iteration+1} 次迭代停止")
+            break
+        stop_reason = stopping_rule.update(best['makespan'])
+        if stop_reason is not None:
+            if verbose:
+                print(f"停止條件 {stop_reason} 成立，於第 {iteration+1} 次迭代停止")
+            break
+    
+    best['history'] = history
+    best['stop_reason'] = stop_reason or 'iterations'
+    best['moves_evaluated'] = evaluator.moves_evaluated
+    return best
+
+if __name__ == "__main__":
+    # 解析問題案例文件
+    instance = parse_problem_file("HW01-1.txt")
+    lower_bound = makespan_lower_bounds(instance)['lower_bound']
+    print(f"總耗時下界: {lower_bound:.2f}，評估核心: {'compiled' if kernel_available() else 'python'}")
+    
+    for name, search in (('模擬退火', simulated_annealing), ('禁忌搜尋', tabu_search)):
+        start_time = time.time()
+        best_solution = search(instance, seed=0, lower_bound=lower_bound, verbose=False)
+        execution_time = time.time() - start_time
+        print(f"\n{name}:")
+        print(f"最佳排程 ss = {best_solution['ss']}")
+        print(f"最佳分配 ms = {best_solution['ms']}")
+        print(f"最佳總耗時: {best_solution['makespan']:.2f}（停止原因: {best_solution['stop_reason']}）")
+        print(f"評估移動數: {best_solution['moves_evaluated']}，每秒 {best_solution['moves_evaluated'] / execution_time:.0f} 次")
+        print(f"程式執行耗時: {execution_time:.2f} 秒")
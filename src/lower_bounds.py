@@ -0,0 +1,131 @@
+import numpy as np
+import time
+
+from scheduler_core import parse_problem_file, parse_solutions_file, get_default_instance, evaluate_solution
+from critical_path import dag_lower_bound
+
+# 工作量下界
+def work_lower_bound(instance=None):
+    """所有任務以最快處理器執行時的總計算量平均分給 P 個處理器，O(T·P)"""
+    if instance is None:
+        instance = get_default_instance()
+    return float(instance.comp_cost.min(axis=1).sum()) / instance.processor_count
+
+# 考慮最小通信量的關鍵路徑下界
+def communication_lower_bound(instance=None):
+    """與 dag_lower_bound 相同沿拓撲順序計算最長路徑，但在有多個前置任務的匯合點加入最小通信成本，O(T+E)
+    
+    任務 t 的前置任務若全部與 t 放在同一處理器，它們必須依序執行，
+    t 最早在 min(前置最早開始) + Σ(前置最小計算成本) 之後才能開始；
+    否則至少有一個前置任務 p 跨處理器，t 最早在 p 的最早完成時間 + 資料量·最小通信率 之後開始。
+    取兩種情況的較小值，再與所有前置任務的最早完成時間取最大值。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    processor_count = instance.processor_count
+    if processor_count > 1:
+        min_rate = float(instance.comm_rate[~np.eye(processor_count, dtype=bool)].min())
+    else:
+        min_rate = 0.0
+    min_costs = instance.comp_cost.min(axis=1).tolist()
+    predecessors = instance.predecessors
+    earliest_start = [0.0] * instance.task_count
+    earliest_finish = [0.0] * instance.task_count
+    
+    for task in instance.topo_order.tolist():
+        preds = predecessors[task]
+        if len(preds) == 1:
+            earliest_start[task] = earliest_finish[preds[0][0]]
+        elif preds:
+            latest_finish = max(earliest_finish[pred] for pred, _ in preds)
+            co_located = (min(earliest_start[pred] for pred, _ in preds)
+                          + sum(min_costs[pred] for pred, _ in preds))
+            if processor_count > 1:
+                remote = min(earliest_finish[pred] + data_vol * min_rate for pred, data_vol in preds)
+                co_located = min(co_located, remote)
+            earliest_start[task] = max(latest_finish, co_located)
+        earliest_finish[task] = earliest_start[task] + min_costs[task]
+    
+    return max(earliest_finish) if earliest_finish else 0.0
+
+# 總耗時下界
+def makespan_lower_bounds(instance=None):
+    """回傳各種下界與其中最大者 {'critical_path', 'communication', 'work', 'lower_bound'}"""
+    if instance is None:
+        instance = get_default_instance()
+    
+    critical_path, _ = dag_lower_bound(instance)
+    communication = communication_lower_bound(instance)
+    work = work_lower_bound(instance)
+    return {
+        'critical_path': critical_path,
+        'communication': communication,
+        'work': work,
+        'lower_bound': max(critical_path, communication, work),
+    }
+
+# 評估並附上下界
+def evaluate_solution_with_bound(solution, instance=None, bounds=None, insertion=False):
+    """與 evaluate_solution 相同，另外加入 'lower_bound' 與 'optimality_gap'（(總耗時 - 下界) / 下界）
+    
+    評估多個解決方案時可傳入同一份 makespan_lower_bounds 的結果，避免重複計算。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    if bounds is None:
+        bounds = makespan_lower_bounds(instance)
+    
+    evaluate_solution(solution, instance, insertion=insertion)
+    lower_bound = bounds['lower_bound']
+    solution['lower_bound'] = lower_bound
+    solution['optimality_gap'] = (solution['makespan'] - lower_bound) / lower_bound if lower_bound > 0 else 0.0
+    return solution
+
+class StoppingRule:
+    """搜尋的提前停止條件：最佳總耗時達到下界，或連續 stagnation_limit 代沒有改進
+    
+    每代呼叫一次 update(最佳總耗時)，需要停止時回傳原因（'lower_bound' 或 'stagnation'），否則回傳 None。
+    lower_bound 或 stagnation_limit 為 None 時不檢查該條件。
+    """
+    
+    def __init__(self, lower_bound=None, stagnation_limit=None, tolerance=1e-9):
+        self.lower_bound = lower_bound
+        self.stagnation_limit = stagnation_limit
+        self.tolerance = tolerance
+        self.best = float('inf')
+        self.stagnant_generations = 0
+    
+    def update(self, best_makespan):
+        """記錄本代的最佳總耗時並判斷是否停止"""
+        if best_makespan < self.best - self.tolerance * max(1.0, abs(best_makespan)):
+            self.best = best_makespan
+            self.stagnant_generations = 0
+        else:
+            self.stagnant_generations += 1
+        
+        if self.lower_bound is not None and self.best <= self.lower_bound + self.tolerance * max(1.0, self.lower_bound):
+            return 'lower_bound'
+        if self.stagnation_limit is not None and self.stagnant_generations >= self.stagnation_limit:
+            return 'stagnation'
+        return None
+
+if __name__ == "__main__":
+    start_time = time.time()
+    
+    # 解析問題案例文件與解決方案文件
+    instance = parse_problem_file("HW01-1.txt")
+    all_solutions = parse_solutions_file("HW01-2.txt")
+    
+    bounds = makespan_lower_bounds(instance)
+    print(f"\n關鍵路徑下界: {bounds['critical_path']:.2f}")
+    print(f"最小通信下界: {bounds['communication']:.2f}")
+    print(f"工作量下界: {bounds['work']:.2f}")
+    print(f"總耗時下界: {bounds['lower_bound']:.2f}")
+    
+    for i, solution in enumerate(all_solutions):
+        evaluate_solution_with_bound(solution, instance, bounds)
+        print(f"解決方案 {i+1}: 總耗時 {solution['makespan']:.2f}，與下界差距 {solution['optimality_gap']:.1%}")
+    
+    execution_time = time.time() - start_time
+    print(f"\n程式執行耗時: {execution_time:.2f} 秒")
@@ -0,0 +1,262 @@
+import numpy as np
+import time
+import traceback
+
+from scheduler_core import parse_problem_file, get_default_instance, evaluate_solution, evaluate_population
+from genetic_algorithm import init_population, crossover, mutate_ms
+from list_scheduling import heuristic_seeds
+
+# 預設的功率模型（每單位時間的耗能；可改為長度 P 的陣列表示異質處理器）
+DEFAULT_BUSY_POWER = 1.0
+DEFAULT_IDLE_POWER = 0.3
+
+# 可用的目標（皆為越小越好）與 NSGA-II 預設使用的目標
+OBJECTIVE_NAMES = ('makespan', 'communication_volume', 'energy')
+DEFAULT_OBJECTIVES = OBJECTIVE_NAMES
+
+# 預設的 NSGA-II 參數
+DEFAULT_POPULATION_SIZE = 100
+DEFAULT_GENERATIONS = 200
+DEFAULT_CROSSOVER_RATE = 0.9
+DEFAULT_MUTATION_RATE = 0.1
+
+def _processor_powers(power, processor_count):
+    """將純量或長度 P 的功率轉為長度 P 的陣列"""
+    return np.broadcast_to(np.asarray(power, dtype=np.float64), (processor_count,))
+
+# 批次計算族群的各項目標
+def population_objectives(ss_batch, ms_batch, instance=None, busy_power=DEFAULT_BUSY_POWER,
+                          idle_power=DEFAULT_IDLE_POWER, makespans=None):
+    """計算 N 個個體的總耗時、跨處理器通信量、各處理器忙碌/閒置時間與耗能，回傳陣列字典
+    
+    通信量為兩端分配到不同處理器的依賴邊資料量總和；處理器在總耗時內未執行任務的時間為閒置時間，
+    耗能 = Σ(忙碌時間·忙碌功率 + 閒置時間·閒置功率)。makespans 已知時可傳入以省去重新評估。
+    回傳 'makespan'、'communication_volume'、'energy'（長度 N）與 'busy_time'、'idle_time'（N×P）。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    ss_batch = np.atleast_2d(np.asarray(ss_batch, dtype=np.int64))
+    ms_batch = np.atleast_2d(np.asarray(ms_batch, dtype=np.int64))
+    if makespans is None:
+        makespans, _, _ = evaluate_population(ss_batch, ms_batch, instance)
+    
+    # 跨處理器的依賴邊（N×E）
+    to_tasks = np.repeat(np.arange(instance.task_count), np.diff(instance.pred_ptr))
+    remote = ms_batch[:, instance.pred_idx] != ms_batch[:, to_tasks]
+    communication_volume = remote.astype(np.float64) @ instance.pred_vol.astype(np.float64)
+    
+    # 各處理器的忙碌時間（N×P）
+    task_costs = instance.comp_cost[np.arange(instance.task_count), ms_batch]
+    busy_time = np.stack([np.where(ms_batch == p, task_costs, 0.0).sum(axis=1)
+                          for p in range(instance.processor_count)], axis=1)
+    idle_time = makespans[:, None] - busy_time
+    
+    energy = (busy_time @ _processor_powers(busy_power, instance.processor_count)
+              + idle_time @ _processor_powers(idle_power, instance.processor_count))
+    
+    return {
+        'makespan': makespans,
+        'communication_volume': communication_volume,
+        'energy': energy,
+        'busy_time': busy_time,
+        'idle_time': idle_time,
+    }
+
+# 評估並附上各項目標
+def evaluate_solution_objectives(solution, instance=None, busy_power=DEFAULT_BUSY_POWER,
+                                 idle_power=DEFAULT_IDLE_POWER, insertion=False):
+    """與 evaluate_solution 相同，另外加入 'communication_volume'、'busy_time'、'idle_time'（各處理器）與 'energy'"""
+    if instance is None:
+        instance = get_default_instance()
+    
+    evaluate_solution(solution, instance, insertion=insertion)
+    objectives = population_objectives([solution['ss']], [solution['ms']], instance, busy_power, idle_power,
+                                       makespans=np.array([solution['makespan']], dtype=np.float64))
+    solution['communication_volume'] = float(objectives['communication_volume'][0])
+    solution['busy_time'] = objectives['busy_time'][0].tolist()
+    solution['idle_time'] = objectives['idle_time'][0].tolist()
+    solution['energy'] = float(objectives['energy'][0])
+    return solution
+
+# 快速非支配排序
+def fast_non_dominated_sort(objectives):
+    """回傳每個個體所在的前緣編號（0 為 Pareto 前緣），objectives 為 N×M 陣列（越小越好）
+    
+    先以廣播一次算出 N×N 的支配矩陣（O(M·N²)），再逐層剝除被支配次數為 0 的個體。
+    """
+    objectives = np.asarray(objectives, dtype=np.float64)
+    population_size = len(objectives)
+    less_equal = np.all(objectives[:, None, :] <= objectives[None, :, :], axis=2)
+    less = np.any(objectives[:, None, :] < objectives[None, :, :], axis=2)
+    dominates = less_equal & less   # dominates[i, j]：i 支配 j
+    
+    ranks = np.full(population_size, -1, dtype=np.int64)
+    dominated_count = dominates.sum(axis=0)
+    remaining = np.ones(population_size, dtype=bool)
+    rank = 0
+    while remaining.any():
+        front = remaining & (dominated_count == 0)
+        ranks[front] = rank
+        remaining &= ~front
+        dominated_count -= dominates[front].sum(axis=0)
+        rank += 1
+    return ranks
+
+# 擁擠距離
+def crowding_distance(objectives, ranks):
+    """回傳每個個體在所屬前緣中的擁擠距離（前緣兩端為無限大），各目標以前緣內的範圍正規化"""
+    objectives = np.asarray(objectives, dtype=np.float64)
+    distance = np.zeros(len(objectives))
+    for rank in np.unique(ranks):
+        members = np.flatnonzero(ranks == rank)
+        values = objectives[members]
+        order = np.argsort(values, axis=0, kind='stable')
+        sorted_values = np.take_along_axis(values, order, axis=0)
+        span = sorted_values[-1] - sorted_values[0]
+        span[span == 0] = 1.0
+        
+        contribution = np.zeros_like(values)
+        contribution[1:-1] = (sorted_values[2:] - sorted_values[:-2]) / span
+        contribution[0] = np.inf
+        contribution[-1] = np.inf
+        
+        # 將依各目標排序的貢獻放回原本的順序後加總
+        member_distance = np.zeros_like(values)
+        np.put_along_axis(member_distance, order, contribution, axis=0)
+        distance[members] = member_distance.sum(axis=1)
+    return distance
+
+# 擁擠比較錦標賽
+def crowded_tournament(ranks, distance, count, rng):
+    """二元錦標賽：前緣編號較小者勝，相同時擁擠距離較大者勝，共選出 count 個索引"""
+    a = rng.integers(len(ranks), size=count)
+    b = rng.integers(len(ranks), size=count)
+    a_wins = (ranks[a] < ranks[b]) | ((ranks[a] == ranks[b]) & (distance[a] >= distance[b]))
+    return np.where(a_wins, a, b)
+
+# 依前緣與擁擠距離挑出下一代
+def select_survivors(objectives, count):
+    """回傳 (保留的索引, 其前緣編號, 其擁擠距離)：依前緣編號、再依擁擠距離由大到小取前 count 個"""
+    ranks = fast_non_dominated_sort(objectives)
+    distance = crowding_distance(objectives, ranks)
+    survivors = np.lexsort((-distance, ranks))[:count]
+    return survivors, ranks[survivors], distance[survivors]
+
+# 執行 NSGA-II
+def run_nsga2(instance, population_size=DEFAULT_POPULATION_SIZE, generations=DEFAULT_GENERATIONS, time_limit=None,
+              objective_names=DEFAULT_OBJECTIVES, busy_power=DEFAULT_BUSY_POWER, idle_power=DEFAULT_IDLE_POWER,
+              crossover_rate=DEFAULT_CROSSOVER_RATE, mutation_rate=DEFAULT_MUTATION_RATE, seed=None, verbose=True,
+              seed_solutions=None):
+    """以 NSGA-II 同時最小化 objective_names 中的目標，回傳結果字典
+    
+    交配與突變沿用 genetic_algorithm（保持依賴關係的單點交配與處理器突變），
+    父代以擁擠比較錦標賽選出，父代與子代合併後依非支配排序與擁擠距離保留 population_size 個。
+    回傳 'front'（Pareto 前緣的解決方案字典列表，依總耗時排序、已去除重複目標值）、
+    'history'（每代前緣大小）與 'stop_reason'（'generations' 或 'time_limit'）。
+    """
+    rng = np.random.default_rng(seed)
+    start_clock = time.time()
+    
+    def objective_matrix(ss_batch, ms_batch):
+        values = population_objectives(ss_batch, ms_batch, instance, busy_power, idle_power)
+        return np.column_stack([values[name] for name in objective_names])
+    
+    ss_batch, ms_batch = init_population(instance, population_size, rng)
+    if seed_solutions:
+        for i, solution in enumerate(seed_solutions[:population_size]):
+            ss_batch[i] = solution['ss']
+            ms_batch[i] = solution['ms']
+    objectives = objective_matrix(ss_batch, ms_batch)
+    ranks = fast_non_dominated_sort(objectives)
+    distance = crowding_distance(objectives, ranks)
+    
+    history = []
+    stop_reason = 'generations'
+    for generation in range(generations):
+        # 產生子代
+        parents = crowded_tournament(ranks, distance, 2 * population_size, rng)
+        child_ss = np.empty_like(ss_batch)
+        child_ms = np.empty_like(ms_batch)
+        for k in range(population_size):
+            a = parents[2 * k]
+            b = parents[2 * k + 1]
+            if rng.random() < crossover_rate:
+                child_ss[k], child_ms[k] = crossover(ss_batch[a], ms_batch[a], ss_batch[b], ms_batch[b], rng)
+            else:
+                child_ss[k], child_ms[k] = ss_batch[a], ms_batch[a]
+        mutate_ms(child_ms, instance.processor_count, mutation_rate, rng)
+        
+        # 父代與子代合併後挑出下一代
+        combined_ss = np.concatenate((ss_batch, child_ss))
+        combined_ms = np.concatenate((ms_batch, child_ms))
+        combined_objectives = np.concatenate((objectives, objective_matrix(child_ss, child_ms)))
+        survivors, ranks, distance = select_survivors(combined_objectives, population_size)
+        ss_batch = combined_ss[survivors]
+        ms_batch = combined_ms[survivors]
+        objectives = combined_objectives[survivors]
+        
+        front_size = int((ranks == 0).sum())
+        history.append(front_size)
+        if verbose:
+            best = objectives[ranks == 0].min(axis=0)
+            print(f"第 {generation+1} 代: 前緣大小 = {front_size}，各目標最小值 = "
+                  + "，".join(f"{name} {value:.2f}" for name, value in zip(objective_names, best)))
+        
+        if time_limit is not None and time.time() - start_clock >= time_limit:
+            stop_reason = 'time_limit'
+            if verbose:
+                print(f"已達時間上限 {time_limit} 秒，於第 {generation+1} 代停止")
+            break
+    
+    # 取出 Pareto 前緣（相同目標值只保留一個）並依總耗時排序
+    front = np.flatnonzero(ranks == 0)
+    _, unique = np.unique(objectives[front], axis=0, return_index=True)
+    front = front[unique]
+    front = front[np.lexsort(objectives[front].T[::-1])]
+    
+    solutions = []
+    for i in front.tolist():
+        solution = {'ss': ss_batch[i].tolist(), 'ms': ms_batch[i].tolist()}
+        evaluate_solution_objectives(solution, instance, busy_power, idle_power)
+        solutions.append(solution)
+    
+    return {'front': solutions, 'objective_names': tuple(objective_names), 'history': history,
+            'stop_reason': stop_reason}
+
+# 輸出 Pareto 前緣
+def write_pareto_front(front, filename):
+    """將 Pareto 前緣的每個解決方案與其目標值寫入文字檔"""
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write(f"Pareto 前緣共 {len(front)} 個解決方案\n\n")
+        for i, solution in enumerate(front):
+            file.write(f"解決方案 {i+1}:\n")
+            file.write(f"ss = {solution['ss']}\n")
+            file.write(f"ms = {solution['ms']}\n")
+            file.write(f"總耗時: {solution['makespan']:.2f}\n")
+            file.write(f"跨處理器通信量: {solution['communication_volume']:.2f}\n")
+            file.write(f"耗能: {solution['energy']:.2f}\n")
+            file.write(f"各處理器忙碌時間: {[round(t, 2) for t in solution['busy_time']]}\n")
+            file.write(f"各處理器閒置時間: {[round(t, 2) for t in solution['idle_time']]}\n\n")
+
+if __name__ == "__main__":
+    start_time = time.time()
+    
+    # 解析問題案例文件
+    instance = parse_problem_file("HW01-1.txt")
+    
+    result = run_nsga2(instance, seed=0, verbose=False, seed_solutions=heuristic_seeds(instance))
+    print(f"\nPareto 前緣（{', '.join(result['objective_names'])}）共 {len(result['front'])} 個解決方案:")
+    for solution in result['front']:
+        print(f"總耗時 {solution['makespan']:8.2f}  通信量 {solution['communication_volume']:8.2f}  "
+              f"耗能 {solution['energy']:8.2f}")
+    
+    try:
+        write_pareto_front(result['front'], 'pareto_front.txt')
+        print("\n已保存 Pareto 前緣為 'pareto_front.txt'")
+    except Exception as e:
+        print(f"保存 Pareto 前緣時出錯: {e}")
+        traceback.print_exc()
+    
+    execution_time = time.time() - start_time
+    print(f"程式執行耗時: {execution_time:.2f} 秒")
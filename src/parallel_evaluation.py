@@ -0,0 +1,111 @@
+import numpy as np
+import multiprocessing
+import os
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+from scheduler_core import INSTANCE_ARRAY_FIELDS, ProblemInstance, evaluate_population
+
+# 評估用的行程池：pool 為 multiprocessing.Pool，shared_blocks 為存放問題實例的共享記憶體區塊
+EvaluationPool = namedtuple('EvaluationPool', ['pool', 'shared_blocks', 'workers'])
+
+# 各工作行程中的問題實例（直接使用共享記憶體上的陣列，只建立一次）
+_worker_instance = None
+_worker_blocks = None
+
+# 將問題實例放入共享記憶體
+def share_instance(instance):
+    """把問題實例的所有陣列複製到共享記憶體，回傳 (描述資料, 共享記憶體區塊列表)
+    
+    描述資料只包含區塊名稱、形狀與型別，傳給工作行程的成本與實例大小無關。
+    """
+    blocks = []
+    arrays = {}
+    for field in INSTANCE_ARRAY_FIELDS:
+        array = getattr(instance, field)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        blocks.append(block)
+        arrays[field] = (block.name, array.shape, array.dtype.str)
+    
+    descriptor = (instance.processor_count, instance.task_count, instance.edge_count, arrays)
+    return descriptor, blocks
+
+# 工作行程初始化
+def _init_worker(descriptor):
+    """連接共享記憶體並還原只含陣列的問題實例
+    
+    evaluate_population 只讀取 CSR 陣列，單一評估用的 tuple 版本在工作行程中不會建立，
+    每個工作行程只多出共享記憶體上的陣列視圖，而不是一份以 Python 物件表示的實例。
+    """
+    global _worker_instance, _worker_blocks
+    processor_count, task_count, edge_count, array_specs = descriptor
+    
+    _worker_blocks = []
+    arrays = {}
+    for field, (name, shape, dtype) in array_specs.items():
+        # 區塊由主行程負責釋放，工作行程只連接、不刪除
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        arrays[field] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    
+    _worker_instance = ProblemInstance(processor_count, task_count, edge_count, arrays)
+
+# 工作行程評估一個區塊的族群
+def _evaluate_chunk(chunk):
+    """評估一段族群，回傳 (makespans, start_times, end_times)"""
+    ss_chunk, ms_chunk = chunk
+    return evaluate_population(ss_chunk, ms_chunk, _worker_instance)
+
+# 建立評估用行程池
+def create_evaluation_pool(instance, workers=None):
+    """建立行程池，問題實例只放入共享記憶體一次；workers 預設為 CPU 核心數"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    descriptor, blocks = share_instance(instance)
+    try:
+        pool = multiprocessing.Pool(processes=workers, initializer=_init_worker, initargs=(descriptor,))
+    except Exception:
+        _release_blocks(blocks)
+        raise
+    
+    return EvaluationPool(pool=pool, shared_blocks=blocks, workers=workers)
+
+def _release_blocks(blocks):
+    """關閉並刪除共享記憶體區塊"""
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+# 關閉評估用行程池
+def close_evaluation_pool(evaluation_pool):
+    """結束所有工作行程並釋放共享記憶體"""
+    evaluation_pool.pool.close()
+    evaluation_pool.pool.join()
+    _release_blocks(evaluation_pool.shared_blocks)
+
+# 平行批次評估
+def parallel_evaluate_population(evaluation_pool, ss_batch, ms_batch, chunk_size=None):
+    """把族群切成多個區塊交給行程池評估，結果依原本的個體順序合併
+    
+    回傳值與 evaluate_population 相同：(makespans, start_times, end_times)。
+    """
+    ss_batch = np.atleast_2d(np.asarray(ss_batch, dtype=np.int64))
+    ms_batch = np.atleast_2d(np.asarray(ms_batch, dtype=np.int64))
+    pop_size = ss_batch.shape[0]
+    
+    if chunk_size is None:
+        # 每個工作行程約分到 4 個區塊，兼顧負載平衡與傳輸成本
+        chunk_size = max(1, -(-pop_size // (evaluation_pool.workers * 4)))
+    
+    chunks = [(ss_batch[i:i + chunk_size], ms_batch[i:i + chunk_size])
+              for i in range(0, pop_size, chunk_size)]
+    
+    # Pool.map 保證結果順序與輸入順序一致
+    results = evaluation_pool.pool.map(_evaluate_chunk, chunks)
+    
+    makespans = np.concatenate([result[0] for result in results])
+    task_start_times = np.concatenate([result[1] for result in results])
+    task_end_times = np.concatenate([result[2] for result in results])
+    return makespans, task_start_times, task_end_times
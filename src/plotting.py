@@ -0,0 +1,184 @@
+import numpy as np
+
+# 延遲載入的 matplotlib.pyplot（第一次繪圖時才載入）
+_pyplot = None
+
+# 載入 matplotlib
+def load_pyplot():
+    """第一次呼叫時才載入 matplotlib 並設定非互動式後端，之後直接回傳同一個 pyplot 模組
+    
+    只做評估或搜尋的程式（例如平行評估的工作行程）不會呼叫它，因此不必付出載入 matplotlib 的時間。
+    """
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')  # 使用非互動式後端，確保在無GUI環境下也能運行
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+# 取得色彩映射
+def matplotlib_colormap(name):
+    """取得 matplotlib 的色彩映射（新版以 matplotlib.colormaps 取代已移除的 cm.get_cmap）"""
+    load_pyplot()
+    import matplotlib
+    return matplotlib.colormaps[name]
+
+# 甘特圖預設參數
+GANTT_FIGSIZE = (16, 8)
+GANTT_DPI = 100
+GANTT_LABEL_LIMIT = 60     # 任務數不超過此值時才標示任務編號、結束時間與圖例
+GANTT_LEGEND_LIMIT = 20    # 圖例最多列出的任務數
+GANTT_TICK_LIMIT = 15      # x 軸最多標示的結束時間數
+
+# 整理甘特圖的任務條
+def gantt_bars(start_times, end_times, ms):
+    """回傳執行時間大於 0 的任務條 (任務編號, 開始時間, 結束時間, 處理器)，皆為 NumPy 陣列"""
+    start_times = np.asarray(start_times, dtype=np.float64)
+    end_times = np.asarray(end_times, dtype=np.float64)
+    processors = np.asarray(ms, dtype=np.int64)
+    tasks = np.flatnonzero(end_times - start_times > 0)
+    return tasks, start_times[tasks], end_times[tasks], processors[tasks]
+
+class GanttRenderer:
+    """重複使用同一個 Figure 繪製多張甘特圖
+    
+    所有任務條以一個 PolyCollection 一次加入，繪製成本與任務數幾乎無關；
+    任務數超過 label_limit 時不加文字標籤與圖例。輸出格式依檔名副檔名決定（.png、.svg 等）。
+    """
+    
+    def __init__(self, processor_count, figsize=GANTT_FIGSIZE, dpi=GANTT_DPI, label_limit=GANTT_LABEL_LIMIT):
+        plt = load_pyplot()
+        self.processor_count = processor_count
+        self.dpi = dpi
+        self.label_limit = label_limit
+        self.figure, self.ax = plt.subplots(figsize=figsize)
+        self._colors = matplotlib_colormap('tab20')
+    
+    def draw(self, solution, title=None):
+        """在重複使用的座標軸上畫出解決方案的甘特圖，回傳座標軸"""
+        from matplotlib.collections import PolyCollection
+        from matplotlib.patches import Patch
+        
+        ax = self.ax
+        ax.clear()
+        tasks, starts, ends, processors = gantt_bars(solution['start_times'], solution['end_times'], solution['ms'])
+        makespan = solution['makespan']
+        
+        # 每個任務條為一個矩形，全部放進同一個集合
+        verts = np.empty((len(tasks), 4, 2))
+        verts[:, [0, 1], 0] = starts[:, None]
+        verts[:, [2, 3], 0] = ends[:, None]
+        verts[:, [0, 3], 1] = processors[:, None] - 0.4
+        verts[:, [1, 2], 1] = processors[:, None] + 0.4
+        show_labels = len(solution['start_times']) <= self.label_limit
+        bars = PolyCollection(verts, facecolors=self._colors(tasks % 20),
+                              edgecolors='black' if show_labels else 'face', linewidths=1.0, alpha=0.8)
+        ax.add_collection(bars)
+        
+        if show_labels:
+            middles = (starts + ends) / 2
+            for task, middle, end, processor in zip(tasks.tolist(), middles.tolist(), ends.tolist(),
+                                                    processors.tolist()):
+                # 任務ID標籤在中間位置，結束時間標記在任務下方
+                ax.text(middle, processor, f't{task}', ha='center', va='center', fontsize=11, fontweight='bold',
+                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.2'))
+                ax.text(middle, processor - 0.3, f'{end:.1f}', ha='center', va='center', fontsize=9,
+                        color='black', fontweight='bold',
+                        bbox=dict(facecolor='lightyellow', alpha=0.9, edgecolor='gray', boxstyle='round,pad=0.1'))
+            
+            # 添加圖例顯示任務對應顏色
+            legend_count = min(GANTT_LEGEND_LIMIT, len(solution['start_times']))
+            legend_elements = [Patch(facecolor=self._colors(task % 20), edgecolor='black', label=f'task {task}')
+                               for task in range(legend_count)]
+            ax.legend(handles=legend_elements, loc='center left', bbox_to_anchor=(1, 0.5),
+                      title="task legend", fontsize=9)
+        
+        # 設置軸標籤、標題與範圍
+        ax.set_yticks(range(self.processor_count))
+        ax.set_yticklabels([f'P{processor}' for processor in range(self.processor_count)])
+        ax.set_ylim(-0.6, self.processor_count - 0.4)
+        ax.set_xlim(-0.5, makespan * 1.1 if makespan > 0 else 1.0)
+        ax.set_xlabel('time', fontsize=12)
+        ax.set_ylabel('processor', fontsize=12)
+        if title is None:
+            title = f'task scheduling gantt chart\ntotal time: {makespan:.2f}'
+        ax.set_title(title, fontsize=16)
+        ax.grid(axis='x', linestyle='--', alpha=0.6)
+        
+        # 任務不多時以任務結束時間作為 x 軸刻度，太多時平均挑選一部分；任務很多時使用預設刻度
+        if show_labels:
+            end_ticks = np.unique(ends)
+            if len(end_ticks) > GANTT_TICK_LIMIT:
+                step = max(1, len(end_ticks) // GANTT_TICK_LIMIT)
+                end_ticks = np.union1d(end_ticks[::step], end_ticks[-1:])
+            ax.set_xticks(np.concatenate(([0.0], end_ticks)))
+        
+        self.figure.subplots_adjust(left=0.06, right=0.86 if show_labels else 0.98, top=0.88, bottom=0.08)
+        return ax
+    
+    def save(self, solution, filename, title=None):
+        """畫出並儲存甘特圖"""
+        self.draw(solution, title)
+        self.figure.savefig(filename, dpi=self.dpi)
+    
+    def close(self):
+        """關閉 Figure，釋放記憶體"""
+        load_pyplot().close(self.figure)
+
+# 背景繪圖行程中的繪圖器（依 (處理器個數, 設定) 重複使用）
+_worker_renderers = {}
+
+def _render_in_background(job):
+    """背景行程執行的繪圖工作"""
+    processor_count, settings, solution, filename, title = job
+    key = (processor_count, settings)
+    renderer = _worker_renderers.get(key)
+    if renderer is None:
+        figsize, dpi, label_limit = settings
+        renderer = GanttRenderer(processor_count, figsize, dpi, label_limit)
+        _worker_renderers[key] = renderer
+    renderer.save(solution, filename, title)
+    return filename
+
+class BackgroundGanttRenderer:
+    """在背景行程池中繪製甘特圖，submit 立即返回，搜尋不必等待繪圖
+    
+    只把 ms、開始與結束時間和總耗時傳給工作行程，不需要整個問題實例。
+    """
+    
+    def __init__(self, workers=1, figsize=GANTT_FIGSIZE, dpi=GANTT_DPI, label_limit=GANTT_LABEL_LIMIT):
+        import multiprocessing
+        self.settings = (tuple(figsize), dpi, label_limit)
+        self.pool = multiprocessing.Pool(workers)
+        self.pending = []
+    
+    def submit(self, solution, processor_count, filename, title=None):
+        """送出一張甘特圖的繪製工作，回傳 AsyncResult"""
+        payload = {
+            'ms': np.asarray(solution['ms'], dtype=np.int64),
+            'start_times': np.asarray(solution['start_times'], dtype=np.float64),
+            'end_times': np.asarray(solution['end_times'], dtype=np.float64),
+            'makespan': float(solution['makespan']),
+        }
+        result = self.pool.apply_async(_render_in_background,
+                                       ((processor_count, self.settings, payload, filename, title),))
+        self.pending.append(result)
+        return result
+    
+    def close(self, wait=True):
+        """關閉行程池；wait 為 True 時等待所有圖表完成，並回傳成功寫出的檔名列表"""
+        finished = []
+        if not wait:
+            self.pool.terminate()
+            self.pool.join()
+            return finished
+        self.pool.close()
+        for result in self.pending:
+            try:
+                finished.append(result.get())
+            except Exception as e:
+                print(f"背景繪製甘特圖時出錯: {e}")
+        self.pool.join()
+        self.pending = []
+        return finished
@@ -0,0 +1,85 @@
+import numpy as np
+
+from scheduler_core import get_default_instance, evaluate_population
+
+# 處理器鍵值解碼
+def decode_processor_keys(ms_keys, processor_count):
+    """將 [0, 1) 的浮點處理器鍵值對應到 0 ~ processor_count-1 的處理器編號
+    
+    區間平均分成 processor_count 段，例如 4 個處理器時 0~0.25=P0、0.25~0.5=P1、0.5~0.75=P2、0.75~1=P3。
+    可接受任意形狀的陣列（單一個體或 N×T 族群）。
+    """
+    ms_keys = np.asarray(ms_keys, dtype=np.float64)
+    processors = np.floor(ms_keys * processor_count).astype(np.int64)
+    return np.clip(processors, 0, processor_count - 1)
+
+# 優先權鍵值解碼
+def decode_priority_keys(priority_keys, instance=None):
+    """將 N×T 的優先權鍵值解碼為符合依賴關係的排程順序 ss（鍵值越小越早排）
+    
+    每個任務的有效鍵值為自身鍵值與所有前置任務有效鍵值的最大值，
+    再依有效鍵值由小到大排序；相同時依拓撲排序先後決定，因此前置任務一定排在前面。
+    整個族群一起沿拓撲順序計算，成本為 O(N·(E + T log T))。每個個體的鍵值個數不等於任務數時拋出 ValueError。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    priority_keys = np.atleast_2d(np.asarray(priority_keys, dtype=np.float64))
+    if priority_keys.ndim != 2 or priority_keys.shape[1] != instance.task_count:
+        raise ValueError(f"優先權鍵必須是每列 {instance.task_count} 個鍵值的陣列（實際形狀為 {priority_keys.shape}）")
+    pred_ptr = instance.pred_ptr.tolist()
+    pred_idx = instance.pred_idx
+    
+    # 沿拓撲順序傳遞前置任務的有效鍵值
+    effective_keys = priority_keys.copy()
+    for task in instance.topo_order.tolist():
+        lo, hi = pred_ptr[task], pred_ptr[task + 1]
+        if hi > lo:
+            inherited = effective_keys[:, pred_idx[lo:hi]].max(axis=1)
+            effective_keys[:, task] = np.maximum(effective_keys[:, task], inherited)
+    
+    # 主鍵為有效鍵值，次鍵為任務在拓撲排序中的位置
+    topo_rank = np.empty(instance.task_count, dtype=np.int64)
+    topo_rank[instance.topo_order] = np.arange(instance.task_count)
+    tie_break = np.broadcast_to(topo_rank, effective_keys.shape)
+    return np.lexsort((tie_break, effective_keys), axis=-1)
+
+# 解碼整個亂數鍵族群
+def decode_random_keys(priority_keys, ms_keys, instance=None):
+    """將亂數鍵族群（優先權鍵 ps 與處理器鍵 ms，皆為 N×T 的 [0, 1) 陣列）解碼為 (ss_batch, ms_batch)
+    
+    兩者形狀不同或鍵值個數不等於任務數時拋出 ValueError。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    ss_batch = decode_priority_keys(priority_keys, instance)
+    ms_keys = np.atleast_2d(np.asarray(ms_keys, dtype=np.float64))
+    if ms_keys.shape != ss_batch.shape:
+        raise ValueError(f"處理器鍵的形狀 {ms_keys.shape} 與優先權鍵的形狀 {ss_batch.shape} 不符")
+    ms_batch = decode_processor_keys(ms_keys, instance.processor_count)
+    return ss_batch, ms_batch
+
+# 評估亂數鍵族群
+def evaluate_random_keys(priority_keys, ms_keys, instance=None):
+    """解碼並批次評估亂數鍵族群，回傳 (makespans, ss_batch, ms_batch)"""
+    if instance is None:
+        instance = get_default_instance()
+    
+    ss_batch, ms_batch = decode_random_keys(priority_keys, ms_keys, instance)
+    makespans, _, _ = evaluate_population(ss_batch, ms_batch, instance)
+    return makespans, ss_batch, ms_batch
+
+# 將排程編碼為亂數鍵
+def encode_random_keys(ss, ms, processor_count):
+    """將符合依賴關係的 ss 與處理器分配 ms 編碼為 (priority_keys, ms_keys)，解碼後可得到相同的 ss/ms
+    
+    ss 中第 k 個任務的優先權鍵為 (k+0.5)/T，處理器 p 的鍵為所屬區段的中點 (p+0.5)/P。
+    可用來把啟發式解（例如 HEFT）放入粒子群或差分演化的初始族群。
+    """
+    ss = np.asarray(ss, dtype=np.int64)
+    task_count = len(ss)
+    priority_keys = np.empty(task_count)
+    priority_keys[ss] = (np.arange(task_count) + 0.5) / task_count
+    ms_keys = (np.asarray(ms, dtype=np.float64) + 0.5) / processor_count
+    return priority_keys, ms_keys
@@ -0,0 +1,207 @@
+import numpy as np
+import time
+
+from scheduler_core import parse_problem_file, evaluate_population
+from random_key import decode_random_keys, encode_random_keys
+from lower_bounds import StoppingRule, makespan_lower_bounds
+
+# 鍵值上限（小於 1，使處理器鍵解碼後不超出範圍）
+KEY_UPPER = np.nextafter(1.0, 0.0)
+
+# 預設的粒子群最佳化參數（Clerc 收縮係數）
+DEFAULT_SWARM_SIZE = 100
+DEFAULT_PSO_ITERATIONS = 200
+DEFAULT_INERTIA = 0.7298
+DEFAULT_COGNITIVE = 1.49618
+DEFAULT_SOCIAL = 1.49618
+DEFAULT_MAX_VELOCITY = 0.2
+
+# 預設的差分演化參數（DE/rand/1/bin）
+DEFAULT_DE_POPULATION_SIZE = 100
+DEFAULT_DE_GENERATIONS = 200
+DEFAULT_DIFFERENTIAL_WEIGHT = 0.5
+DEFAULT_DE_CROSSOVER_RATE = 0.9
+
+# 評估鍵值矩陣
+def evaluate_keys(keys, instance):
+    """將 N×2T 的鍵值矩陣（前 T 欄為優先權鍵 ps，後 T 欄為處理器鍵 ms）解碼並批次評估，回傳 N 個總耗時"""
+    task_count = instance.task_count
+    ss_batch, ms_batch = decode_random_keys(keys[:, :task_count], keys[:, task_count:], instance)
+    makespans, _, _ = evaluate_population(ss_batch, ms_batch, instance)
+    return makespans
+
+# 初始化鍵值矩陣
+def init_keys(instance, population_size, rng, seed_solutions=None):
+    """產生 N×2T 的均勻亂數鍵值矩陣；seed_solutions（{'ss', 'ms'} 字典列表）會編碼後取代前幾列"""
+    keys = rng.random((population_size, 2 * instance.task_count))
+    for i, solution in enumerate((seed_solutions or [])[:population_size]):
+        priority_keys, ms_keys = encode_random_keys(solution['ss'], solution['ms'], instance.processor_count)
+        keys[i] = np.concatenate((priority_keys, ms_keys))
+    return keys
+
+# 隨機選出互不相同的個體索引
+def distinct_indices(population_size, count, rng):
+    """回傳 N×count 的索引矩陣，每列的索引互不相同且不等於列號（需要 population_size > count）
+    
+    先整批抽樣，再只對有衝突的列重新抽樣，避免建立 N×N 的排列矩陣。
+    """
+    rows = np.arange(population_size)
+    indices = rng.integers(population_size, size=(population_size, count))
+    while True:
+        conflict = np.zeros(population_size, dtype=bool)
+        for a in range(count):
+            conflict |= indices[:, a] == rows
+            for b in range(a):
+                conflict |= indices[:, a] == indices[:, b]
+        if not conflict.any():
+            return indices
+        indices[conflict] = rng.integers(population_size, size=(int(conflict.sum()), count))
+
+def _best_solution(keys, instance, history, stop_reason):
+    """將最佳鍵值解碼並評估為與 run_genetic_algorithm 相同格式的結果字典"""
+    task_count = instance.task_count
+    ss_batch, ms_batch = decode_random_keys(keys[:task_count], keys[task_count:], instance)
+    makespans, start_times, end_times = evaluate_population(ss_batch, ms_batch, instance)
+    return {
+        'ss': ss_batch[0].tolist(),
+        'ms': ms_batch[0].tolist(),
+        'start_times': start_times[0].tolist(),
+        'end_times': end_times[0].tolist(),
+        'makespan': float(makespans[0]),
+        'history': history,
+        'stop_reason': stop_reason,
+    }
+
+# 粒子群最佳化
+def run_particle_swarm(instance, swarm_size=DEFAULT_SWARM_SIZE, iterations=DEFAULT_PSO_ITERATIONS, time_limit=None,
+                       inertia=DEFAULT_INERTIA, cognitive=DEFAULT_COGNITIVE, social=DEFAULT_SOCIAL,
+                       max_velocity=DEFAULT_MAX_VELOCITY, seed=None, verbose=True, seed_solutions=None,
+                       lower_bound=None, stagnation_limit=None):
+    """以全域最佳粒子群最佳化搜尋亂數鍵，回傳最佳解決方案字典（格式同 run_genetic_algorithm）
+    
+    整個粒子群以 N×2T 的位置與速度矩陣表示，每次迭代的速度更新、限速、邊界裁切與批次評估都是陣列運算。
+    停止條件的參數與 run_genetic_algorithm 相同（stagnation_limit 以迭代次數計）。
+    """
+    rng = np.random.default_rng(seed)
+    start_clock = time.time()
+    
+    positions = init_keys(instance, swarm_size, rng, seed_solutions)
+    velocities = rng.uniform(-max_velocity, max_velocity, positions.shape)
+    makespans = evaluate_keys(positions, instance)
+    
+    personal_best = positions.copy()
+    personal_best_makespans = makespans.copy()
+    best = int(np.argmin(personal_best_makespans))
+    
+    stopping_rule = StoppingRule(lower_bound, stagnation_limit)
+    stop_reason = stopping_rule.update(float(personal_best_makespans[best]))
+    
+    history = []
+    for iteration in range(iterations if stop_reason is None else 0):
+        r1 = rng.random(positions.shape)
+        r2 = rng.random(positions.shape)
+        velocities *= inertia
+        velocities += cognitive * r1 * (personal_best - positions)
+        velocities += social * r2 * (personal_best[best] - positions)
+        np.clip(velocities, -max_velocity, max_velocity, out=velocities)
+        positions += velocities
+        np.clip(positions, 0.0, KEY_UPPER, out=positions)
+        
+        makespans = evaluate_keys(positions, instance)
+        improved = makespans < personal_best_makespans
+        personal_best[improved] = positions[improved]
+        personal_best_makespans[improved] = makespans[improved]
+        best = int(np.argmin(personal_best_makespans))
+        best_makespan = float(personal_best_makespans[best])
+        history.append(best_makespan)
+        
+        if verbose:
+            print(f"第 {iteration+1} 次迭代: 最佳總耗時 = {best_makespan:.2f}")
+        
+        if time_limit is not None and time.time() - start_clock >= time_limit:
+            stop_reason = 'time_limit'
+            if verbose:
+                print(f"已達時間上限 {time_limit} 秒，於第 {iteration+1} 次迭代停止")
+            break
+        stop_reason = stopping_rule.update(best_makespan)
+        if stop_reason is not None:
+            if verbose:
+                print(f"停止條件 {stop_reason} 成立，於第 {iteration+1} 次迭代停止")
+            break
+    
+    return _best_solution(personal_best[best], instance, history, stop_reason or 'generations')
+
+# 差分演化
+def run_differential_evolution(instance, population_size=DEFAULT_DE_POPULATION_SIZE, generations=DEFAULT_DE_GENERATIONS,
+                               time_limit=None, differential_weight=DEFAULT_DIFFERENTIAL_WEIGHT,
+                               crossover_rate=DEFAULT_DE_CROSSOVER_RATE, seed=None, verbose=True,
+                               seed_solutions=None, lower_bound=None, stagnation_limit=None):
+    """以 DE/rand/1/bin 差分演化搜尋亂數鍵，回傳最佳解決方案字典（格式同 run_genetic_algorithm）
+    
+    突變向量 x[r1] + F·(x[r2] - x[r3])、二項式交配與邊界裁切對整個 N×2T 族群一次計算，
+    再批次評估所有試驗向量，並逐列保留較好（或相同）的一方。population_size 至少為 4。
+    """
+    if population_size < 4:
+        raise ValueError("差分演化的族群大小至少為 4")
+    rng = np.random.default_rng(seed)
+    start_clock = time.time()
+    
+    population = init_keys(instance, population_size, rng, seed_solutions)
+    makespans = evaluate_keys(population, instance)
+    rows = np.arange(population_size)
+    dimension = population.shape[1]
+    
+    stopping_rule = StoppingRule(lower_bound, stagnation_limit)
+    stop_reason = stopping_rule.update(float(makespans.min()))
+    
+    history = []
+    for generation in range(generations if stop_reason is None else 0):
+        donors = distinct_indices(population_size, 3, rng)
+        mutants = population[donors[:, 0]] + differential_weight * (population[donors[:, 1]] - population[donors[:, 2]])
+        
+        # 二項式交配：每列至少保留一個突變基因
+        cross = rng.random(population.shape) < crossover_rate
+        cross[rows, rng.integers(dimension, size=population_size)] = True
+        trials = np.where(cross, mutants, population)
+        np.clip(trials, 0.0, KEY_UPPER, out=trials)
+        
+        trial_makespans = evaluate_keys(trials, instance)
+        improved = trial_makespans <= makespans
+        population[improved] = trials[improved]
+        makespans[improved] = trial_makespans[improved]
+        best_makespan = float(makespans.min())
+        history.append(best_makespan)
+        
+        if verbose:
+            print(f"第 {generation+1} 代: 最佳總耗時 = {best_makespan:.2f}")
+        
+        if time_limit is not None and time.time() - start_clock >= time_limit:
+            stop_reason = 'time_limit'
+            if verbose:
+                print(f"已達時間上限 {time_limit} 秒，於第 {generation+1} 代停止")
+            break
+        stop_reason = stopping_rule.update(best_makespan)
+        if stop_reason is not None:
+            if verbose:
+                print(f"停止條件 {stop_reason} 成立，於第 {generation+1} 代停止")
+            break
+    
+    best = int(np.argmin(makespans))
+    return _best_solution(population[best], instance, history, stop_reason or 'generations')
+
+if __name__ == "__main__":
+    # 解析問題案例文件
+    instance = parse_problem_file("HW01-1.txt")
+    lower_bound = makespan_lower_bounds(instance)['lower_bound']
+    print(f"總耗時下界: {lower_bound:.2f}")
+    
+    for name, optimize in (('粒子群最佳化', run_particle_swarm), ('差分演化', run_differential_evolution)):
+        start_time = time.time()
+        best_solution = optimize(instance, seed=0, verbose=False, lower_bound=lower_bound, stagnation_limit=50)
+        execution_time = time.time() - start_time
+        print(f"\n{name}:")
+        print(f"最佳排程 ss = {best_solution['ss']}")
+        print(f"最佳分配 ms = {best_solution['ms']}")
+        print(f"最佳總耗時: {best_solution['makespan']:.2f}（停止原因: {best_solution['stop_reason']}，"
+              f"{len(best_solution['history'])} 代）")
+        print(f"程式執行耗時: {execution_time:.2f} 秒")
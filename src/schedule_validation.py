@@ -0,0 +1,91 @@
+import numpy as np
+
+from scheduler_core import get_default_instance
+from random_key import decode_priority_keys
+
+# 計算每個任務在排程中的位置
+def schedule_positions(ss_batch, task_count):
+    """回傳 N×T 陣列，positions[i, t] 為任務 t 在第 i 個 ss 中的位置（未出現的任務為 -1）"""
+    ss_batch = np.atleast_2d(np.asarray(ss_batch, dtype=np.int64))
+    pop_size, length = ss_batch.shape
+    positions = np.full((pop_size, task_count), -1, dtype=np.int64)
+    positions[np.arange(pop_size)[:, None], ss_batch] = np.arange(length)
+    return positions
+
+# 檢查排程順序
+def check_schedule_orders(ss_batch, instance=None):
+    """檢查整個族群的 ss，回傳長度 N 的布林陣列（True 表示可行）
+    
+    ss 必須是所有任務的排列，且每條依賴邊的前置任務位置都小於後繼任務位置。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    ss_batch = np.atleast_2d(np.asarray(ss_batch, dtype=np.int64))
+    task_count = instance.task_count
+    if ss_batch.shape[1] != task_count:
+        return np.zeros(ss_batch.shape[0], dtype=bool)
+    
+    # 任務編號都在範圍內，且每個任務恰好出現一次
+    in_range = ((ss_batch >= 0) & (ss_batch < task_count)).all(axis=1)
+    ss_batch = np.clip(ss_batch, 0, task_count - 1)
+    counts = np.zeros((ss_batch.shape[0], task_count), dtype=np.int64)
+    np.add.at(counts, (np.arange(ss_batch.shape[0])[:, None], ss_batch), 1)
+    is_permutation = in_range & (counts == 1).all(axis=1)
+    
+    # 每條邊的位置比較
+    positions = schedule_positions(ss_batch, task_count)
+    to_tasks = np.repeat(np.arange(task_count), np.diff(instance.pred_ptr))
+    from_tasks = instance.pred_idx
+    respects_edges = (positions[:, from_tasks] < positions[:, to_tasks]).all(axis=1)
+    
+    return is_permutation & respects_edges
+
+# 檢查處理器分配
+def check_processor_assignments(ms_batch, instance=None):
+    """檢查整個族群的 ms，回傳長度 N 的布林陣列（長度正確且處理器編號都在範圍內為 True）"""
+    if instance is None:
+        instance = get_default_instance()
+    
+    ms_batch = np.atleast_2d(np.asarray(ms_batch, dtype=np.int64))
+    if ms_batch.shape[1] != instance.task_count:
+        return np.zeros(ms_batch.shape[0], dtype=bool)
+    return ((ms_batch >= 0) & (ms_batch < instance.processor_count)).all(axis=1)
+
+# 修復排程順序
+def repair_schedule_orders(ss_batch, instance=None):
+    """將不符合依賴關係的 ss 修正為可行的拓撲排序，並盡量保留原本的相對順序
+    
+    以任務在原 ss 中的位置當作優先權鍵值，經 random_key.decode_priority_keys 解碼：
+    已經可行的 ss 會原樣保留，違反依賴的任務則被往後移到其前置任務之後。
+    ss 必須是所有任務的排列。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    ss_batch = np.atleast_2d(np.asarray(ss_batch, dtype=np.int64))
+    positions = schedule_positions(ss_batch, instance.task_count)
+    return decode_priority_keys(positions.astype(np.float64), instance)
+
+# 驗證並修復族群
+def validate_population(ss_batch, ms_batch, instance=None, repair=True):
+    """評估前的驗證步驟，回傳 (ss_batch, valid)
+    
+    repair 為 True 時，排列正確但違反依賴的 ss 會被修復，valid 表示修復後是否可行；
+    repair 為 False 時不修改 ss，valid 直接表示原本是否可行。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    ss_batch = np.array(np.atleast_2d(ss_batch), dtype=np.int64)
+    valid = check_schedule_orders(ss_batch, instance) & check_processor_assignments(ms_batch, instance)
+    
+    if repair and not valid.all() and ss_batch.shape[1] == instance.task_count:
+        # 只修復「是排列但違反依賴」的個體
+        is_permutation = (np.sort(ss_batch, axis=1) == np.arange(instance.task_count)).all(axis=1)
+        fixable = ~valid & is_permutation
+        if fixable.any():
+            ss_batch[fixable] = repair_schedule_orders(ss_batch[fixable], instance)
+            valid = check_schedule_orders(ss_batch, instance) & check_processor_assignments(ms_batch, instance)
+    
+    return ss_batch, valid
@@ -0,0 +1,278 @@
+import argparse
+import os
+import sys
+import time
+import traceback
+
+from scheduler_core import parse_problem_file, parse_solutions_file, evaluate_solution, solutions_to_arrays
+from lower_bounds import makespan_lower_bounds
+
+# 可選用的引擎：evaluate 評估解決方案文件，其餘為搜尋演算法
+ENGINES = ('evaluate', 'heft', 'cpop', 'ga', 'islands', 'sa', 'tabu', 'pso', 'de', 'nsga2')
+
+# 解決方案文件格式與各格式的預設文件
+SOLUTION_FORMATS = ('hw01-2', 'hw01-3')
+DEFAULT_SOLUTION_FILES = {'hw01-2': "HW01-2.txt", 'hw01-3': "HW01-3.txt"}
+
+DEFAULT_REPORT_NAME = 'solutions_and_execution_time.txt'
+
+# 各引擎會使用的命令列參數；指定了所選引擎不使用的參數時以 parser.error 拒絕，而不是默默忽略
+ENGINE_OPTIONS = {
+    'evaluate': ('solutions', 'insertion', 'workers'),
+    'heft': (),
+    'cpop': (),
+    'ga': ('time_limit', 'iterations', 'population', 'stagnation', 'workers'),
+    'islands': ('iterations', 'population', 'workers'),
+    'sa': ('time_limit', 'iterations', 'stagnation'),
+    'tabu': ('time_limit', 'iterations', 'stagnation'),
+    'pso': ('time_limit', 'iterations', 'population', 'stagnation'),
+    'de': ('time_limit', 'iterations', 'population', 'stagnation'),
+    'nsga2': ('time_limit', 'iterations', 'population'),
+}
+
+def _resolve_path(path):
+    """相對路徑優先以目前目錄解析；不存在時保留原樣，由 parse_* 以腳本所在目錄解析"""
+    return os.path.abspath(path) if os.path.exists(path) else path
+
+# 讀取解決方案文件
+def load_solutions(path, solution_format, instance):
+    """依格式讀取解決方案文件，回傳 {'ss', 'ms'} 字典列表；文件不存在或格式錯誤時拋出例外"""
+    if solution_format == 'hw01-3':
+        from hw01_3_scheduler import parse_hw01_3_file
+        return parse_hw01_3_file(_resolve_path(path), instance)
+    return parse_solutions_file(_resolve_path(path))
+
+# 評估解決方案文件中的所有解決方案
+def evaluate_solutions(solutions, instance, workers=1, insertion=False):
+    """檢查並評估所有解決方案，回傳可行的已評估解決方案列表
+    
+    違反依賴的順序以拓撲排序修復，無法修復的解決方案略過；workers 大於 1 時以行程池平行評估
+    （行程池只做附加式排程，insertion 為 True 時一律以單一行程評估）。
+    """
+    from schedule_validation import validate_population
+    
+    if not solutions:
+        return []
+    ss_batch, ms_batch = solutions_to_arrays(solutions)
+    repaired_ss, valid = validate_population(ss_batch, ms_batch, instance)
+    feasible_solutions = []
+    for i, solution in enumerate(solutions):
+        if not valid[i]:
+            print(f"警告: 解決方案 {i+1} 不是可行的排程，已略過")
+            continue
+        if repaired_ss[i].tolist() != solution['ss']:
+            solution['ss'] = repaired_ss[i].tolist()
+            print(f"解決方案 {i+1} 的排程順序違反依賴關係，已修復為: {solution['ss']}")
+        feasible_solutions.append(solution)
+    
+    if workers > 1 and not insertion and feasible_solutions:
+        from parallel_evaluation import create_evaluation_pool, close_evaluation_pool, parallel_evaluate_population
+        evaluation_pool = create_evaluation_pool(instance, workers)
+        try:
+            ss_batch, ms_batch = solutions_to_arrays(feasible_solutions)
+            makespans, start_times, end_times = parallel_evaluate_population(evaluation_pool, ss_batch, ms_batch)
+        finally:
+            close_evaluation_pool(evaluation_pool)
+        for i, solution in enumerate(feasible_solutions):
+            solution['start_times'] = start_times[i].tolist()
+            solution['end_times'] = end_times[i].tolist()
+            solution['makespan'] = float(makespans[i])
+    else:
+        for solution in feasible_solutions:
+            evaluate_solution(solution, instance, insertion=insertion)
+    return feasible_solutions
+
+# 執行搜尋引擎
+def run_engine(engine, instance, args, lower_bound):
+    """依命令列參數執行搜尋引擎，回傳已評估的解決方案列表（NSGA-II 為整個 Pareto 前緣）"""
+    from list_scheduling import heft_schedule, cpop_schedule, heuristic_seeds
+    
+    if engine in ('heft', 'cpop'):
+        schedule = heft_schedule if engine == 'heft' else cpop_schedule
+        return [evaluate_solution(schedule(instance), instance)]
+    
+    # 只傳入命令列有指定的參數，其餘使用各引擎的預設值
+    stopping = {'lower_bound': lower_bound, 'stagnation_limit': args.stagnation}
+    options = {'seed': args.seed, 'verbose': args.verbose}
+    
+    if engine == 'ga':
+        from genetic_algorithm import run_genetic_algorithm
+        if args.iterations is not None:
+            options['generations'] = args.iterations
+        if args.population is not None:
+            options['population_size'] = args.population
+        evaluation_pool = None
+        if args.workers > 1:
+            from parallel_evaluation import create_evaluation_pool
+            evaluation_pool = create_evaluation_pool(instance, args.workers)
+        try:
+            return [run_genetic_algorithm(instance, time_limit=args.time_limit, evaluation_pool=evaluation_pool,
+                                          seed_solutions=heuristic_seeds(instance), checkpoint_path=args.checkpoint,
+                                          checkpoint_interval=args.checkpoint_interval, resume=args.resume,
+                                          **stopping, **options)]
+        finally:
+            if evaluation_pool is not None:
+                from parallel_evaluation import close_evaluation_pool
+                close_evaluation_pool(evaluation_pool)
+    
+    if engine == 'islands':
+        # 島嶼模型沒有時間上限與提前停止（main 會拒絕 --time-limit 與 --stagnation），每個工作行程跑一個島嶼
+        from island_model import run_island_model, DEFAULT_ISLAND_COUNT
+        if args.iterations is not None:
+            options['generations'] = args.iterations
+        if args.population is not None:
+            options['population_size'] = args.population
+        island_count = args.workers if args.workers > 1 else DEFAULT_ISLAND_COUNT
+        return [run_island_model(instance, island_count, **options)]
+    
+    if engine in ('sa', 'tabu'):
+        from local_search import simulated_annealing, tabu_search
+        if args.iterations is not None:
+            options['iterations'] = args.iterations
+        search = simulated_annealing if engine == 'sa' else tabu_search
+        return [search(instance, time_limit=args.time_limit, **stopping, **options)]
+    
+    if engine in ('pso', 'de'):
+        from random_key_search import run_particle_swarm, run_differential_evolution
+        if engine == 'pso':
+            optimize, size_name, count_name = run_particle_swarm, 'swarm_size', 'iterations'
+        else:
+            optimize, size_name, count_name = run_differential_evolution, 'population_size', 'generations'
+        if args.iterations is not None:
+            options[count_name] = args.iterations
+        if args.population is not None:
+            options[size_name] = args.population
+        return [optimize(instance, time_limit=args.time_limit, seed_solutions=heuristic_seeds(instance),
+                         **stopping, **options)]
+    
+    if engine == 'nsga2':
+        from multi_objective import run_nsga2
+        if args.iterations is not None:
+            options['generations'] = args.iterations
+        if args.population is not None:
+            options['population_size'] = args.population
+        result = run_nsga2(instance, time_limit=args.time_limit, seed_solutions=heuristic_seeds(instance), **options)
+        return result['front']
+    
+    raise ValueError(f"未知的引擎: {engine}（可用: {', '.join(ENGINES)}）")
+
+# 輸出圖表與報告
+def write_outputs(solutions, instance, engine, execution_time, args):
+    """依命令列參數繪製甘特圖、總耗時比較圖並寫出文字報告（全部關閉時不會載入 matplotlib）"""
+    if not solutions or (args.no_charts and args.no_report):
+        return
+    from hw01_2_scheduler import draw_gantt_chart, draw_makespan_comparison, export_solutions_and_execution_time_to_text
+    
+    os.makedirs(args.output_dir, exist_ok=True)
+    if not args.no_charts:
+        from plotting import GanttRenderer
+        renderer = GanttRenderer(instance.processor_count)
+        try:
+            for i, solution in enumerate(solutions):
+                draw_gantt_chart(i, solution, instance, renderer, output_dir=args.output_dir)
+        finally:
+            renderer.close()
+        if len(solutions) > 1:
+            draw_makespan_comparison(solutions, output_dir=args.output_dir)
+    
+    if not args.no_report:
+        export_solutions_and_execution_time_to_text(solutions, execution_time,
+                                                    os.path.join(args.output_dir, args.report_name))
+        if engine == 'nsga2':
+            from multi_objective import write_pareto_front
+            write_pareto_front(solutions, os.path.join(args.output_dir, 'pareto_front.txt'))
+
+# 找出所選引擎不使用的參數
+def unsupported_options(args):
+    """回傳命令列有指定、但 args.engine 不會使用的參數旗標列表"""
+    given = {
+        'solutions': ('--solutions', args.solutions is not None),
+        'insertion': ('--insertion', args.insertion),
+        'workers': ('--workers', args.workers > 1),
+        'time_limit': ('--time-limit', args.time_limit is not None),
+        'iterations': ('--iterations', args.iterations is not None),
+        'population': ('--population', args.population is not None),
+        'stagnation': ('--stagnation', args.stagnation is not None),
+    }
+    supported = ENGINE_OPTIONS[args.engine]
+    return [flag for name, (flag, is_given) in given.items() if is_given and name not in supported]
+
+def build_parser():
+    """建立命令列參數解析器"""
+    parser = argparse.ArgumentParser(description="任務排程：評估解決方案文件或以指定的搜尋引擎求解")
+    parser.add_argument('instance', nargs='?', default="HW01-1.txt", help="問題案例文件（預設 HW01-1.txt）")
+    parser.add_argument('-s', '--solutions', default=None,
+                        help="解決方案文件（engine 為 evaluate 時使用，預設依格式為 HW01-2.txt 或 HW01-3.txt）")
+    parser.add_argument('--solutions-format', choices=SOLUTION_FORMATS, default='hw01-2', help="解決方案文件格式")
+    parser.add_argument('-e', '--engine', choices=ENGINES, default='evaluate', help="評估或搜尋引擎")
+    parser.add_argument('--insertion', action='store_true', help="評估時使用插入式排程（engine 為 evaluate 時，不能與 --workers 一起使用）")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="工作行程數（evaluate 與 ga 為評估行程池，islands 為島嶼數）")
+    parser.add_argument('-t', '--time-limit', type=float, default=None, help="搜尋的時間上限（秒，islands 不支援）")
+    parser.add_argument('--seed', type=int, default=None, help="亂數種子")
+    parser.add_argument('-n', '--iterations', type=int, default=None, help="代數或迭代次數（預設依引擎而定）")
+    parser.add_argument('-p', '--population', type=int, default=None, help="族群或粒子群大小（預設依引擎而定，sa 與 tabu 不使用）")
+    parser.add_argument('--stagnation', type=int, default=None, help="連續多少代（或回報區間）沒有改進即停止（islands 與 nsga2 不支援）")
+    parser.add_argument('--checkpoint', default=None, help="遺傳演算法的檢查點檔名（.npz，只適用於 ga）")
+    parser.add_argument('--checkpoint-interval', type=int, default=10, help="每隔多少代寫一次檢查點")
+    parser.add_argument('--resume', action='store_true', help="檢查點存在時從檢查點接續（需搭配 --checkpoint）")
+    parser.add_argument('-o', '--output-dir', default='.', help="圖表與報告的輸出目錄")
+    parser.add_argument('--report-name', default=DEFAULT_REPORT_NAME, help="文字報告檔名")
+    parser.add_argument('--no-charts', action='store_true', help="不繪製甘特圖與總耗時比較圖")
+    parser.add_argument('--no-report', action='store_true', help="不寫出文字報告")
+    parser.add_argument('-v', '--verbose', action='store_true', help="顯示搜尋過程")
+    return parser
+
+def main(argv=None):
+    """命令列進入點，回傳結束代碼"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.checkpoint_interval < 1:
+        parser.error("--checkpoint-interval 必須至少為 1")
+    if args.engine != 'ga' and (args.checkpoint is not None or args.resume):
+        parser.error("--checkpoint 與 --resume 只適用於 ga 引擎")
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume 必須搭配 --checkpoint 指定檢查點檔名")
+    unsupported = unsupported_options(args)
+    if unsupported:
+        parser.error(f"{args.engine} 引擎不使用 {', '.join(unsupported)}")
+    if args.insertion and args.workers > 1:
+        parser.error("--insertion 只能以單一行程評估，不能與 --workers 一起使用")
+    start_time = time.time()
+    
+    # 輸入文件不存在或格式錯誤時直接報錯，不退回內建數據
+    try:
+        instance = parse_problem_file(_resolve_path(args.instance))
+        if args.engine == 'evaluate':
+            solutions_path = args.solutions or DEFAULT_SOLUTION_FILES[args.solutions_format]
+            all_solutions = load_solutions(solutions_path, args.solutions_format, instance)
+    except (OSError, ValueError) as e:
+        print(f"讀取輸入文件時出錯: {e}")
+        return 2
+    
+    try:
+        lower_bound = makespan_lower_bounds(instance)['lower_bound']
+        
+        if args.engine == 'evaluate':
+            solutions = evaluate_solutions(all_solutions, instance, args.workers, args.insertion)
+        else:
+            solutions = run_engine(args.engine, instance, args, lower_bound)
+        
+        for i, solution in enumerate(solutions):
+            print(f"解決方案 {i+1}: 總耗時 {solution['makespan']:.2f}")
+        if solutions:
+            best = min(solution['makespan'] for solution in solutions)
+            print(f"最佳總耗時: {best:.2f}（下界 {lower_bound:.2f}）")
+        
+        execution_time = time.time() - start_time
+        write_outputs(solutions, instance, args.engine, execution_time, args)
+    except Exception as e:
+        print(f"執行排程時出錯: {e}")
+        traceback.print_exc()
+        return 1
+    
+    print(f"程式執行耗時: {time.time() - start_time:.2f} 秒")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,866 @@
+import numpy as np
+import array
+import bisect
+import random
+import gc
+import os
+import re
+from collections import deque
+
+# 獲取目前腳本所在的目錄路徑
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 定義模擬數據
+PROCESSOR_COUNT = 4
+TASK_COUNT = 20
+EDGE_COUNT = 35
+
+# 默認任務計算時間
+comp_costs = [
+    0.0, 80.0, 40.0, 40.0, 40.0, 40.0, 40.0, 60.0, 30.0, 30.0,
+    30.0, 30.0, 40.0, 20.0, 20.0, 20.0, 20.0, 10.0, 10.0, 0.0
+]
+
+# 默認通信率（None 表示不同處理器之間為1、同一處理器為0）
+comm_rates = None
+
+# 默認任務依賴和通信量
+dependencies = [
+    (0, 1, 0),
+    (1, 2, 120), (1, 3, 120), (1, 4, 120), (1, 5, 120), (1, 6, 120), (1, 7, 120),
+    (2, 19, 0),
+    (3, 7, 80), (3, 8, 80),
+    (4, 9, 80),
+    (5, 10, 80),
+    (6, 11, 80),
+    (7, 8, 120), (7, 9, 120), (7, 10, 120), (7, 11, 120), (7, 12, 120),
+    (8, 19, 0),
+    (9, 12, 80), (9, 13, 80),
+    (10, 14, 80),
+    (11, 15, 80),
+    (12, 13, 120), (12, 14, 120), (12, 15, 120), (12, 16, 120),
+    (13, 19, 0),
+    (14, 16, 80), (14, 17, 80),
+    (15, 18, 80),
+    (16, 17, 120), (16, 18, 120),
+    (17, 19, 0),
+    (18, 19, 0)
+]
+
+# ProblemInstance 中以 NumPy 陣列儲存的欄位
+INSTANCE_ARRAY_FIELDS = (
+    'comp_cost',        # T×P 計算成本矩陣
+    'comm_rate',        # P×P 通信率矩陣
+    'pred_ptr',         # CSR 前置任務索引起點，長度 T+1
+    'pred_idx',         # CSR 前置任務編號
+    'pred_vol',         # CSR 前置邊資料量
+    'succ_ptr',         # CSR 後繼任務索引起點，長度 T+1
+    'succ_idx',         # CSR 後繼任務編號
+    'succ_vol',         # CSR 後繼邊資料量
+    'topo_order',       # 拓撲排序
+)
+
+# 預先編譯的問題實例（不可變），解析一次後即可重複傳給各種評估器
+class ProblemInstance:
+    """問題實例：處理器個數、工作個數、有向邊個數與 INSTANCE_ARRAY_FIELDS 中的唯讀陣列
+    
+    單一評估用的 tuple 版本（predecessors、cost_table、comm_columns）在第一次讀取時才建立，
+    只使用陣列的批次評估與載入快取不必為每條邊建立 Python 物件；序列化時也只傳送陣列。
+    """
+    __slots__ = ('processor_count', 'task_count', 'edge_count') + INSTANCE_ARRAY_FIELDS + ('_scalar_views',)
+    
+    def __init__(self, processor_count, task_count, edge_count, arrays):
+        object.__setattr__(self, 'processor_count', processor_count)
+        object.__setattr__(self, 'task_count', task_count)
+        object.__setattr__(self, 'edge_count', edge_count)
+        for field in INSTANCE_ARRAY_FIELDS:
+            object.__setattr__(self, field, _frozen(arrays[field]))
+        object.__setattr__(self, '_scalar_views', None)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ProblemInstance 不可修改（{name}）")
+    
+    def __reduce__(self):
+        arrays = {field: getattr(self, field) for field in INSTANCE_ARRAY_FIELDS}
+        return ProblemInstance, (self.processor_count, self.task_count, self.edge_count, arrays)
+    
+    def __repr__(self):
+        return (f"ProblemInstance(processor_count={self.processor_count}, task_count={self.task_count}, "
+                f"edge_count={self.edge_count})")
+    
+    @property
+    def scalar_views_built(self):
+        """單一評估用的 tuple 版本是否已經建立"""
+        return self._scalar_views is not None
+    
+    def _views(self):
+        """建立（只建立一次）單一評估用的 tuple 版本"""
+        if self._scalar_views is None:
+            # 建立大量小 tuple 時暫停垃圾回收，避免大型實例反覆觸發完整回收
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                pred_ptr_list = self.pred_ptr.tolist()
+                pairs = list(zip(self.pred_idx.tolist(), self.pred_vol.tolist()))
+                predecessors = tuple(tuple(pairs[pred_ptr_list[t]:pred_ptr_list[t + 1]])
+                                     for t in range(self.task_count))
+                cost_table = tuple(tuple(row) for row in self.comp_cost.tolist())
+                comm_columns = tuple(tuple(column) for column in self.comm_rate.T.tolist())
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            object.__setattr__(self, '_scalar_views', (predecessors, cost_table, comm_columns))
+        return self._scalar_views
+    
+    @property
+    def predecessors(self):
+        """每個任務的 ((前置任務, 資料量), ...)，單一評估用"""
+        return self._views()[0]
+    
+    @property
+    def cost_table(self):
+        """comp_cost 的巢狀 tuple 版本，單一評估用"""
+        return self._views()[1]
+    
+    @property
+    def comm_columns(self):
+        """comm_columns[pTo][pFrom] 為通信率，單一評估用"""
+        return self._views()[2]
+
+def _frozen(array):
+    """將陣列設為唯讀，避免實例在評估過程中被修改"""
+    array.setflags(write=False)
+    return array
+
+def _build_csr(task_count, keys, values, volumes):
+    """依 keys 分組建立 CSR 結構，回傳 (ptr, idx, vol)"""
+    order = np.argsort(keys, kind='stable')
+    ptr = np.zeros(task_count + 1, dtype=np.int64)
+    np.add.at(ptr, keys + 1, 1)
+    ptr = np.cumsum(ptr)
+    return ptr, values[order], volumes[order]
+
+def build_problem_instance(processor_count, task_count, comp_cost, dependencies, comm_rate=None):
+    """由計算成本與依賴關係建立 ProblemInstance
+    
+    comp_cost 可為長度 T 的向量（各處理器相同）或 T×P 矩陣；
+    comm_rate 省略時為對角線 0、其餘為 1 的 P×P 矩陣。
+    """
+    comp_cost = np.asarray(comp_cost, dtype=np.float64)
+    if comp_cost.ndim == 1:
+        comp_cost = np.repeat(comp_cost[:, None], processor_count, axis=1)
+    comp_cost = np.ascontiguousarray(comp_cost)
+    if comm_rate is None:
+        comm_rate = np.ones((processor_count, processor_count)) - np.eye(processor_count)
+    comm_rate = np.ascontiguousarray(comm_rate, dtype=np.float64)
+    
+    edges = np.asarray(dependencies, dtype=np.float64).reshape(-1, 3)
+    from_tasks = edges[:, 0].astype(np.int64)
+    to_tasks = edges[:, 1].astype(np.int64)
+    volumes = edges[:, 2]
+    
+    pred_ptr, pred_idx, pred_vol = _build_csr(task_count, to_tasks, from_tasks, volumes)
+    succ_ptr, succ_idx, succ_vol = _build_csr(task_count, from_tasks, to_tasks, volumes)
+    
+    # Kahn 演算法求拓撲排序
+    in_degree = np.diff(pred_ptr).tolist()
+    queue = deque(task for task in range(task_count) if in_degree[task] == 0)
+    topo_order = []
+    succ_ptr_list = succ_ptr.tolist()
+    succ_idx_list = succ_idx.tolist()
+    while queue:
+        task = queue.popleft()
+        topo_order.append(task)
+        for k in range(succ_ptr_list[task], succ_ptr_list[task + 1]):
+            succ = succ_idx_list[k]
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                queue.append(succ)
+    if len(topo_order) != task_count:
+        raise ValueError("依賴關係中存在環，無法建立拓撲排序")
+    
+    arrays = {
+        'comp_cost': comp_cost,
+        'comm_rate': comm_rate,
+        'pred_ptr': pred_ptr,
+        'pred_idx': pred_idx,
+        'pred_vol': pred_vol,
+        'succ_ptr': succ_ptr,
+        'succ_idx': succ_idx,
+        'succ_vol': succ_vol,
+        'topo_order': np.array(topo_order, dtype=np.int64),
+    }
+    return instance_from_arrays(processor_count, task_count, len(edges), arrays)
+
+def instance_from_arrays(processor_count, task_count, edge_count, arrays):
+    """由已建立好的陣列（INSTANCE_ARRAY_FIELDS）組成 ProblemInstance
+    
+    陣列不會被複製，因此也可以直接使用共享記憶體上的陣列；單一評估用的 tuple 版本延後到第一次使用時才建立。
+    """
+    return ProblemInstance(processor_count, task_count, edge_count, arrays)
+
+# 由模組層級的預設數據建立的實例，parse_problem_file 會更新它
+_default_instance = None
+
+def get_default_instance():
+    """取得目前全域數據對應的問題實例（只建立一次）"""
+    global _default_instance
+    if _default_instance is None:
+        _default_instance = build_problem_instance(PROCESSOR_COUNT, TASK_COUNT, comp_costs, dependencies, comm_rates)
+    return _default_instance
+
+# 解析一行數值
+def _parse_number_row(line):
+    """將一行文字解析為浮點數列表，並拆開像 '40.040.0' 這種黏在一起的數字"""
+    values = []
+    for token in line.split():
+        if token.count('.') > 1:
+            # 以最後一段的小數位數作為每個數字的小數位數
+            decimals = len(token.rsplit('.', 1)[1])
+            parts = re.findall(r'-?\d+\.\d{%d}' % decimals, token)
+            if ''.join(parts) != token:
+                raise ValueError(f"無法拆分數值: {token}")
+            values.extend(float(part) for part in parts)
+        else:
+            values.append(float(token))
+    return values
+
+# 問題檔案二進位快取的格式版本，格式改變時遞增以讓舊快取失效
+PROBLEM_CACHE_VERSION = 2
+
+def _problem_cache_path(file_path):
+    """問題檔案對應的二進位快取路徑"""
+    return file_path + '.cache.npz'
+
+def _source_signature(file_path):
+    """以快取版本、檔案大小與修改時間作為來源檔案的簽章"""
+    stat = os.stat(file_path)
+    return np.array([PROBLEM_CACHE_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+# 串流解析問題檔案
+def _read_problem_text(file_path):
+    """逐行讀取問題檔案（不一次載入整個檔案），回傳 (基本參數, 通信率列, 計算成本列, 邊陣列)
+    
+    邊陣列為 E×3 的浮點陣列（起點、終點、資料量），以 array 模組累積以節省記憶體。
+    非數值開頭的行視為區段標題或說明；數值行無法解析時拋出 ValueError 並指出行號與區段。
+    """
+    counts = []
+    comm_rows = []
+    cost_rows = []
+    from_tasks = array.array('q')
+    to_tasks = array.array('q')
+    volumes = array.array('d')
+    section = None
+    
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            
+            # 依區段標題判斷目前讀到的內容，非數值的說明行一律略過
+            first = stripped[0]
+            if not (first.isdigit() or first in '-.'):
+                if "thePCount" in stripped:
+                    section = 'thePCount'
+                elif "theCommRate" in stripped:
+                    section = 'theCommRate'
+                elif "theCompCost" in stripped:
+                    section = 'theCompCost'
+                elif "TransData" in stripped:
+                    section = 'TransData'
+                continue
+            
+            if section is None:
+                raise ValueError(f"第 {line_number} 行: 數值出現在任何區段標題之前: {stripped!r}")
+            
+            # 邊的數量最多，直接拆欄位解析
+            if section == 'TransData':
+                values = stripped.split()
+                try:
+                    if len(values) != 3:
+                        raise ValueError("應為 起點 終點 資料量 三個欄位")
+                    from_task = int(values[0])
+                    to_task = int(values[1])
+                    data_vol = float(values[2])
+                except ValueError as e:
+                    raise ValueError(f"第 {line_number} 行（TransData）無法解析: {stripped!r}（{e}）") from None
+                from_tasks.append(from_task)
+                to_tasks.append(to_task)
+                volumes.append(data_vol)
+                continue
+            
+            try:
+                values = _parse_number_row(stripped)
+            except ValueError as e:
+                raise ValueError(f"第 {line_number} 行（{section}）無法解析: {stripped!r}（{e}）") from None
+            
+            if section == 'thePCount':
+                counts.extend(int(v) for v in values)
+            elif section == 'theCommRate':
+                comm_rows.append(values)
+            elif section == 'theCompCost':
+                cost_rows.append(values)
+    
+    edges = np.empty((len(volumes), 3), dtype=np.float64)
+    edges[:, 0] = np.frombuffer(from_tasks, dtype=np.int64)
+    edges[:, 1] = np.frombuffer(to_tasks, dtype=np.int64)
+    edges[:, 2] = np.frombuffer(volumes, dtype=np.float64)
+    return counts, comm_rows, cost_rows, edges
+
+# 讀取問題檔案的二進位快取
+def _load_problem_cache(cache_path, signature):
+    """快取存在且簽章相符時回傳 (基本參數, 邊陣列, 實例陣列)，否則回傳 None"""
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if not np.array_equal(data['signature'], signature):
+                return None
+            counts = data['counts'].tolist()
+            edges = data['edges']
+            arrays = {field: data[field] for field in INSTANCE_ARRAY_FIELDS}
+    except (OSError, KeyError, ValueError):
+        return None
+    return counts, edges, arrays
+
+# 寫入問題檔案的二進位快取
+def _write_problem_cache(cache_path, signature, instance, edges):
+    """以未壓縮的 .npz 寫入快取；先寫暫存檔再 os.replace，避免留下寫到一半的快取"""
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as file:
+            np.savez(file, signature=signature,
+                     counts=np.array([instance.processor_count, instance.task_count, instance.edge_count]),
+                     edges=edges,
+                     **{field: getattr(instance, field) for field in INSTANCE_ARRAY_FIELDS})
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"無法寫入問題快取 {cache_path}: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+# 解析HW01-1.txt獲取任務計算時間和依賴數據
+def parse_problem_file(filename, use_cache=True, fallback_to_default=False):
+    """解析問題定義文件，獲取計算成本矩陣、通信率矩陣和依賴關係，回傳 ProblemInstance
+    
+    use_cache 為 True 時，第一次解析後會在檔案旁寫入 '<檔名>.cache.npz'，
+    之後只要來源檔案的大小與修改時間沒有改變，就直接載入快取而不重新解析。
+    內容格式錯誤時拋出 ValueError（指出行號與區段）；文件不存在時拋出 FileNotFoundError，
+    只有 fallback_to_default 為 True 時才改用內建的預設數據。
+    """
+    global PROCESSOR_COUNT, TASK_COUNT, EDGE_COUNT, comp_costs, comm_rates, dependencies, _default_instance
+    
+    # 使用絕對路徑
+    file_path = os.path.join(SCRIPT_DIR, filename)
+    cache_path = _problem_cache_path(file_path)
+    
+    if not os.path.exists(file_path):
+        if not fallback_to_default:
+            raise FileNotFoundError(f"找不到問題文件: {file_path}")
+        print(f"文件 {filename} 不存在，使用內建的預設數據")
+        return get_default_instance()
+    
+    signature = _source_signature(file_path)
+    
+    cached = _load_problem_cache(cache_path, signature) if use_cache else None
+    if cached is not None:
+        (processor_count, task_count, edge_count), edges, arrays = cached
+        instance = instance_from_arrays(processor_count, task_count, edge_count, arrays)
+        PROCESSOR_COUNT = processor_count
+        TASK_COUNT = task_count
+        EDGE_COUNT = edge_count
+        comm_rates = instance.comm_rate
+        comp_costs = instance.comp_cost
+        dependencies = edges
+        _default_instance = instance
+        print(f"從快取讀取: 處理器個數={PROCESSOR_COUNT}, 工作個數={TASK_COUNT}, 有向邊個數={EDGE_COUNT}")
+        return instance
+    
+    counts, comm_rows, cost_rows, edges = _read_problem_text(file_path)
+    
+    if len(counts) != 3:
+        raise ValueError(f"thePCount 區段應有處理器、工作、有向邊個數三個數值，實際讀到 {len(counts)} 個")
+    processor_count, task_count, edge_count = counts
+    print(f"讀取基本參數: 處理器個數={processor_count}, 工作個數={task_count}, 有向邊個數={edge_count}")
+    
+    # 檢查各區段的大小是否與基本參數一致
+    if len(comm_rows) != processor_count or any(len(row) != processor_count for row in comm_rows):
+        raise ValueError(f"theCommRate 應為 {processor_count}×{processor_count} 矩陣")
+    if len(cost_rows) != task_count or any(len(row) != processor_count for row in cost_rows):
+        raise ValueError(f"theCompCost 應為 {task_count}×{processor_count} 矩陣，實際讀到 {len(cost_rows)} 列")
+    if len(edges) != edge_count:
+        raise ValueError(f"TransData 應有 {edge_count} 條邊，實際讀到 {len(edges)} 條")
+    if edge_count and (edges[:, :2].min() < 0 or edges[:, :2].max() >= task_count):
+        raise ValueError(f"TransData 中的工作編號超出 0~{task_count - 1}")
+    
+    # 建立問題實例（依賴關係有環時拋出 ValueError）並寫入快取
+    instance = build_problem_instance(processor_count, task_count, cost_rows, edges, comm_rows)
+    
+    PROCESSOR_COUNT = processor_count
+    TASK_COUNT = task_count
+    EDGE_COUNT = edge_count
+    comm_rates = comm_rows
+    comp_costs = cost_rows
+    dependencies = edges
+    _default_instance = instance
+    
+    print(f"讀取完成: {len(comp_costs)}個任務計算時間和{len(dependencies)}個依賴關係")
+    
+    if use_cache:
+        _write_problem_cache(cache_path, signature, instance, edges)
+    return instance
+
+# 解析HW01-2.txt獲取解決方案
+def _parse_chromosome_line(line, prefix, line_number):
+    """解析 'ss = {...}' 或 'ms = {...}' 這樣的一行，格式錯誤時拋出 ValueError（指出行號）"""
+    text = line[len(prefix):].strip()
+    if not (text.startswith("{") and text.endswith("}")):
+        raise ValueError(f"第 {line_number} 行: {prefix[:2]} 的數值必須以大括號包住: {line!r}")
+    try:
+        return [int(x) for x in text[1:-1].replace(" ", "").split(",")]
+    except ValueError:
+        raise ValueError(f"第 {line_number} 行: {prefix[:2]} 含有無法解析的整數: {line!r}") from None
+
+def parse_solutions_file(filename):
+    """解析解決方案文件，獲取所有解決方案
+    
+    每個解決方案為相鄰的 'ss = {...}' 與 'ms = {...}' 兩行；格式錯誤、缺少 ms 行、兩者長度不同
+    或整個文件沒有任何解決方案時拋出 ValueError（指出行號），文件不存在時拋出 FileNotFoundError。
+    """
+    solutions = []
+    
+    # 使用絕對路徑
+    file_path = os.path.join(SCRIPT_DIR, filename)
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"找不到解決方案文件: {file_path}")
+    
+    with open(file_path, 'r', encoding='utf-8') as file:
+        lines = [line.strip() for line in file]
+    
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith("ms ="):
+            raise ValueError(f"第 {i+1} 行: ms 之前缺少對應的 ss 行")
+        if line.startswith("ss ="):
+            ss = _parse_chromosome_line(line, "ss =", i + 1)
+            
+            # 下一行必須是對應的ms
+            if i + 1 >= len(lines) or not lines[i+1].startswith("ms ="):
+                raise ValueError(f"第 {i+1} 行: ss 之後缺少對應的 ms 行")
+            ms = _parse_chromosome_line(lines[i+1], "ms =", i + 2)
+            if len(ss) != len(ms):
+                raise ValueError(f"第 {i+1}-{i+2} 行: ss 有 {len(ss)} 個任務，ms 卻有 {len(ms)} 個")
+            
+            solutions.append({'ss': ss, 'ms': ms})
+            print(f"已解析解決方案 {len(solutions)}: {len(ss)}個任務分配")
+            i += 1
+        elif line:
+            raise ValueError(f"第 {i+1} 行無法解析（應為 'ss = {{...}}' 或 'ms = {{...}}'）: {line!r}")
+        
+        i += 1
+    
+    if not solutions:
+        raise ValueError(f"解決方案文件 {filename} 中沒有任何解決方案")
+    print(f"總共解析了{len(solutions)}個解決方案")
+    return solutions
+
+# 依序排入任務並更新時間
+def _schedule_tasks(tasks, ms, instance, task_start_times, task_end_times, processor_finish_time):
+    """依 tasks 的順序把任務排到 ms 指定的處理器上，就地更新開始、結束時間與處理器完成時間"""
+    predecessors = instance.predecessors
+    cost_table = instance.cost_table
+    comm_columns = instance.comm_columns
+    
+    for task_idx in tasks:
+        processor = ms[task_idx]
+        # 傳送到此處理器的通信率，以來源處理器為索引
+        incoming_rates = comm_columns[processor]
+        
+        # 計算任務的最早開始時間（考慮前置依賴）
+        earliest_start = 0
+        for from_task, data_vol in predecessors[task_idx]:
+            # 前置任務必須完成
+            pred_end = task_end_times[from_task]
+            
+            # 如果前置任務和當前任務在不同處理器，需要考慮通信時間
+            from_processor = ms[from_task]
+            if from_processor != processor and data_vol > 0:
+                comm_time = data_vol * incoming_rates[from_processor]
+                pred_end += comm_time
+            
+            earliest_start = max(earliest_start, pred_end)
+        
+        # 任務開始時間
+        start_time = max(earliest_start, processor_finish_time[processor])
+        
+        # 計算執行時間
+        execution_time = cost_table[task_idx][processor]
+        
+        # 任務結束時間
+        end_time = start_time + execution_time
+        
+        # 更新數據
+        task_start_times[task_idx] = start_time
+        task_end_times[task_idx] = end_time
+        processor_finish_time[processor] = end_time
+
+class _GapIndex:
+    """一個處理器上的閒置空檔 [start, end)，以 treap 依起點排序，並記錄每個子樹中最長的空檔
+    
+    查詢「就緒時間所在的空檔」與「就緒時間之後第一個長度足夠的空檔」以及切割、新增空檔，
+    期望成本都是 O(log 空檔數)。用完的空檔長度記為 -1，不會再被選中。
+    另外以排序列表記錄已放入任務的結束時間（與時間 0），執行時間為 0 的任務可以放在兩個相鄰任務的交界。
+    """
+    __slots__ = ('start', 'end', 'length', 'max_length', 'left', 'right', 'priority', 'root', 'task_ends',
+                 '_random')
+    
+    def __init__(self, seed=0):
+        self.start = []
+        self.end = []
+        self.length = []
+        self.max_length = []
+        self.left = []
+        self.right = []
+        self.priority = []
+        self.root = -1
+        self.task_ends = [0]
+        # 優先權只影響樹的形狀，不影響結果
+        self._random = random.Random(seed).random
+        self.insert(0, float('inf'))
+    
+    def _update(self, node):
+        """由子節點重算 max_length"""
+        best = self.length[node]
+        left, right = self.left[node], self.right[node]
+        if left >= 0 and self.max_length[left] > best:
+            best = self.max_length[left]
+        if right >= 0 and self.max_length[right] > best:
+            best = self.max_length[right]
+        self.max_length[node] = best
+    
+    def _split(self, node, key):
+        """將子樹分成起點小於 key 與不小於 key 的兩棵"""
+        if node < 0:
+            return -1, -1
+        if self.start[node] < key:
+            lower, upper = self._split(self.right[node], key)
+            self.right[node] = lower
+            self._update(node)
+            return node, upper
+        lower, upper = self._split(self.left[node], key)
+        self.left[node] = upper
+        self._update(node)
+        return lower, node
+    
+    def _merge(self, lower, upper):
+        """合併兩棵子樹（lower 的起點都小於 upper）"""
+        if lower < 0:
+            return upper
+        if upper < 0:
+            return lower
+        if self.priority[lower] > self.priority[upper]:
+            self.right[lower] = self._merge(self.right[lower], upper)
+            self._update(lower)
+            return lower
+        self.left[upper] = self._merge(lower, self.left[upper])
+        self._update(upper)
+        return upper
+    
+    def insert(self, start, end):
+        """新增空檔 [start, end)"""
+        node = len(self.start)
+        self.start.append(start)
+        self.end.append(end)
+        self.length.append(end - start)
+        self.max_length.append(end - start)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.priority.append(self._random())
+        lower, upper = self._split(self.root, start)
+        self.root = self._merge(self._merge(lower, node), upper)
+    
+    def _floor_path(self, ready_time):
+        """起點不大於 ready_time 的最後一個空檔及從根到它的路徑（沒有時路徑為空）"""
+        path = []
+        found = 0
+        node = self.root
+        while node >= 0:
+            path.append(node)
+            if self.start[node] <= ready_time:
+                found = len(path)
+                node = self.right[node]
+            else:
+                node = self.left[node]
+        return path[:found]
+    
+    def _first_fit(self, node, ready_time, execution_time, path):
+        """子樹中起點大於 ready_time 且長度至少 execution_time 的第一個空檔，並把路徑附加到 path"""
+        if node < 0 or self.max_length[node] < execution_time:
+            return -1
+        path.append(node)
+        if self.start[node] > ready_time:
+            found = self._first_fit(self.left[node], ready_time, execution_time, path)
+            if found >= 0:
+                return found
+            if self.length[node] >= execution_time:
+                return node
+        found = self._first_fit(self.right[node], ready_time, execution_time, path)
+        if found >= 0:
+            return found
+        path.pop()
+        return -1
+    
+    def place(self, ready_time, execution_time):
+        """把任務放進最早能容納它的空檔並切割該空檔，回傳開始時間
+        
+        執行時間為 0 的任務只要不落在其他任務的執行期間內部即可：就緒時間落在忙碌時段時，
+        放在就緒時間之後最早的任務結束時間（兩個相鄰任務的交界），不會被推遲到下一個空檔。
+        """
+        path = self._floor_path(ready_time)
+        node = path[-1] if path else -1
+        if node >= 0 and self.length[node] >= 0 and self.end[node] - max(self.start[node], ready_time) >= execution_time:
+            start_time = max(self.start[node], ready_time)
+        elif execution_time <= 0:
+            return self.task_ends[bisect.bisect_left(self.task_ends, ready_time)]
+        else:
+            # 之後的空檔起點都晚於就緒時間，只要長度足夠即可（最後一段延伸到無限大，一定找得到）
+            path = []
+            node = self._first_fit(self.root, ready_time, execution_time, path)
+            start_time = self.start[node]
+        end_time = start_time + execution_time
+        bisect.insort(self.task_ends, end_time)
+        
+        # 將空檔切成任務前、後兩段：前段留在原節點（順序不變），後段另外新增，長度為0的部分捨棄
+        gap_start, gap_end = self.start[node], self.end[node]
+        if gap_start < start_time:
+            self.end[node] = start_time
+            self.length[node] = start_time - gap_start
+            after = end_time < gap_end or gap_end == float('inf')
+        elif end_time < gap_end or gap_end == float('inf'):
+            self.start[node] = end_time
+            self.length[node] = gap_end - end_time
+            after = False
+        else:
+            self.length[node] = -1
+            after = False
+        for ancestor in reversed(path):
+            self._update(ancestor)
+        if after:
+            self.insert(end_time, gap_end)
+        return start_time
+
+# 以插入策略依序排入任務
+def _schedule_tasks_insertion(tasks, ms, instance, task_start_times, task_end_times):
+    """與 _schedule_tasks 相同，但任務會放進處理器上最早能容納它的閒置空檔
+    
+    每個處理器的閒置空檔以 _GapIndex 索引（最後一段延伸到無限大），找空檔與切割空檔的期望成本為
+    O(log 空檔數)，整個排程為 O(E + T log T)，不會因為大量放不下的短空檔而退化成平方時間。
+    """
+    predecessors = instance.predecessors
+    cost_table = instance.cost_table
+    comm_columns = instance.comm_columns
+    
+    # 每個處理器的閒置空檔
+    gaps = [_GapIndex(seed=processor) for processor in range(instance.processor_count)]
+    
+    for task_idx in tasks:
+        processor = ms[task_idx]
+        incoming_rates = comm_columns[processor]
+        
+        # 計算任務的最早開始時間（考慮前置依賴）
+        earliest_start = 0
+        for from_task, data_vol in predecessors[task_idx]:
+            pred_end = task_end_times[from_task]
+            from_processor = ms[from_task]
+            if from_processor != processor and data_vol > 0:
+                pred_end += data_vol * incoming_rates[from_processor]
+            earliest_start = max(earliest_start, pred_end)
+        
+        execution_time = cost_table[task_idx][processor]
+        start_time = gaps[processor].place(earliest_start, execution_time)
+        
+        task_start_times[task_idx] = start_time
+        task_end_times[task_idx] = start_time + execution_time
+
+# 評估解決方案
+def evaluate_solution(solution, instance=None, insertion=False):
+    """評估解決方案，計算任務的開始時間、結束時間和總耗時
+    
+    insertion 為 True 時改用插入策略：任務可放進處理器上較早的閒置空檔，而不只是接在最後一個任務之後。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    ss = solution['ss']
+    ms = solution['ms']
+    
+    # 初始化處理器的完成時間
+    processor_finish_time = [0] * instance.processor_count
+    
+    # 初始化任務開始和結束時間
+    task_start_times = [0] * instance.task_count
+    task_end_times = [0] * instance.task_count
+    
+    # 根據排程順序處理任務
+    if insertion:
+        _schedule_tasks_insertion(ss, ms, instance, task_start_times, task_end_times)
+    else:
+        _schedule_tasks(ss, ms, instance, task_start_times, task_end_times, processor_finish_time)
+    
+    # 計算總耗時
+    makespan = max(task_end_times)
+    
+    # 更新解決方案
+    solution['start_times'] = task_start_times
+    solution['end_times'] = task_end_times
+    solution['makespan'] = makespan
+    
+    return solution
+
+# 找出子代與父代第一個受影響的排程位置
+def first_affected_position(parent, child, instance=None):
+    """回傳 child 的排程中第一個時間可能與 parent 不同的位置（完全相同時回傳任務數）
+    
+    ss 第一個不同的位置之後都要重算；ms 改變的任務，其本身及後繼任務（通信時間改變）也要重算。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    parent_ss = parent['ss']
+    child_ss = child['ss']
+    parent_ms = parent['ms']
+    child_ms = child['ms']
+    
+    first = len(child_ss)
+    for position, (a, b) in enumerate(zip(parent_ss, child_ss)):
+        if a != b:
+            first = position
+            break
+    
+    changed_tasks = [task for task, (a, b) in enumerate(zip(parent_ms, child_ms)) if a != b]
+    if changed_tasks:
+        position_of = {task: position for position, task in enumerate(child_ss)}
+        succ_ptr = instance.succ_ptr
+        succ_idx = instance.succ_idx
+        for task in changed_tasks:
+            affected = [task] + succ_idx[succ_ptr[task]:succ_ptr[task + 1]].tolist()
+            for affected_task in affected:
+                if affected_task in position_of:
+                    first = min(first, position_of[affected_task])
+    
+    return first
+
+# 增量評估解決方案
+def evaluate_solution_incremental(parent, child, instance=None):
+    """以已評估的 parent 為基礎評估 child，只重算第一個受影響位置之後的排程
+    
+    parent 必須含有 evaluate_solution 產生的 'start_times' 與 'end_times'；
+    結果與對 child 呼叫 evaluate_solution 完全相同。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    first = first_affected_position(parent, child, instance)
+    
+    task_start_times = list(parent['start_times'])
+    task_end_times = list(parent['end_times'])
+    makespan = reschedule_suffix(child['ss'], child['ms'], first, task_start_times, task_end_times, instance)
+    
+    child['start_times'] = task_start_times
+    child['end_times'] = task_end_times
+    child['makespan'] = makespan
+    
+    return child
+
+# 重算排程的後段
+def reschedule_suffix(ss, ms, first, task_start_times, task_end_times, instance=None):
+    """從 ss 的第 first 個位置開始重新排程，就地更新開始、結束時間列表並回傳總耗時
+    
+    前 first 個位置的任務時間必須已經正確（例如來自父代），區域搜尋可直接以它評估鄰域移動。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    # 還原前段排完後各處理器的完成時間（前段的任務與處理器分配都沒有改變）
+    processor_finish_time = [0] * instance.processor_count
+    for task_idx in ss[:first]:
+        processor_finish_time[ms[task_idx]] = task_end_times[task_idx]
+    
+    # 後段任務尚未排入前的時間視為0，與完整評估一致
+    suffix = ss[first:]
+    for task_idx in suffix:
+        task_start_times[task_idx] = 0
+        task_end_times[task_idx] = 0
+    
+    _schedule_tasks(suffix, ms, instance, task_start_times, task_end_times, processor_finish_time)
+    
+    return max(task_end_times)
+
+# 將解決方案字典轉為族群陣列
+def solutions_to_arrays(solutions):
+    """將多個 {'ss', 'ms'} 解決方案轉成 N×T 的 ss 與 ms 陣列"""
+    ss_batch = np.array([solution['ss'] for solution in solutions], dtype=np.int64)
+    ms_batch = np.array([solution['ms'] for solution in solutions], dtype=np.int64)
+    return ss_batch, ms_batch
+
+# 批次評估整個族群
+def evaluate_population(ss_batch, ms_batch, instance=None):
+    """批次評估族群，沿族群維度向量化計算所有個體的開始時間、結束時間和總耗時
+    
+    ss_batch 與 ms_batch 為 N×T 的整數陣列（每列一個個體），
+    回傳 (makespans, start_times, end_times)，形狀分別為 N、N×T、N×T。
+    計算規則與 evaluate_solution 完全相同。
+    """
+    if instance is None:
+        instance = get_default_instance()
+    
+    ss_batch = np.atleast_2d(np.asarray(ss_batch, dtype=np.int64))
+    ms_batch = np.atleast_2d(np.asarray(ms_batch, dtype=np.int64))
+    pop_size = ss_batch.shape[0]
+    
+    pred_ptr = instance.pred_ptr
+    pred_idx = instance.pred_idx
+    pred_vol = instance.pred_vol
+    in_degree = np.diff(pred_ptr)
+    comp_cost = instance.comp_cost
+    comm_rate = instance.comm_rate
+    rows = np.arange(pop_size)
+    
+    # 初始化處理器的完成時間與任務開始、結束時間
+    processor_finish_time = np.zeros((pop_size, instance.processor_count))
+    task_start_times = np.zeros((pop_size, instance.task_count))
+    task_end_times = np.zeros((pop_size, instance.task_count))
+    
+    # 排程位置之間有先後關係，只能依序處理；同一位置上所有個體一起計算
+    for position in range(ss_batch.shape[1]):
+        tasks = ss_batch[:, position]
+        processors = ms_batch[rows, tasks]
+        
+        # 計算最早開始時間（考慮前置依賴與跨處理器通信）
+        # 各個體的前置邊直接從 CSR 攤平取出，成本與入度總和成正比，不受最大入度影響
+        earliest_start = np.zeros(pop_size)
+        degrees = in_degree[tasks]
+        total = int(degrees.sum())
+        if total > 0:
+            offsets = np.cumsum(degrees) - degrees
+            edge_slots = np.repeat(pred_ptr[tasks] - offsets, degrees) + np.arange(total)
+            edge_rows = np.repeat(rows, degrees)
+            edge_processors = np.repeat(processors, degrees)
+            preds = pred_idx[edge_slots]
+            pred_end = task_end_times[edge_rows, preds]
+            pred_processors = ms_batch[edge_rows, preds]
+            comm_time = pred_vol[edge_slots] * comm_rate[pred_processors, edge_processors]
+            arrival = pred_end + np.where(pred_processors != edge_processors, comm_time, 0.0)
+            has_preds = degrees > 0
+            earliest_start[has_preds] = np.maximum.reduceat(arrival, offsets[has_preds])
+        
+        start_time = np.maximum(earliest_start, processor_finish_time[rows, processors])
+        end_time = start_time + comp_cost[tasks, processors]
+        
+        task_start_times[rows, tasks] = start_time
+        task_end_times[rows, tasks] = end_time
+        processor_finish_time[rows, processors] = end_time
+    
+    makespans = task_end_times.max(axis=1)
+    
+    return makespans, task_start_times, task_end_times
@@ -0,0 +1,35 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+# 程式都是 src 目錄下的平坦腳本，測試時把 src 加入匯入路徑
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import scheduler_core
+from scheduler_core import evaluate_solution, SCRIPT_DIR
+from instance_generator import DAG_SHAPES
+from generated_instances import make_instance, random_solutions, as_solution
+
+@pytest.fixture(params=[(shape, seed) for seed in (1, 2) for shape in DAG_SHAPES], ids=str)
+def evaluated_case(request):
+    """各種形狀的產生實例、一批隨機解決方案，以及 evaluate_solution 的結果（作為比較基準）"""
+    shape, seed = request.param
+    instance = make_instance(shape, seed)
+    ss_batch, ms_batch = random_solutions(instance, seed)
+    expected = [evaluate_solution(as_solution(ss, ms), instance) for ss, ms in zip(ss_batch, ms_batch)]
+    return instance, ss_batch, ms_batch, expected
+
+# parse_problem_file 會更新模組層級的預設數據，每個測試結束後還原
+GLOBAL_NAMES = ('PROCESSOR_COUNT', 'TASK_COUNT', 'EDGE_COUNT', 'comp_costs', 'comm_rates', 'dependencies',
+                '_default_instance')
+
+@pytest.fixture
+def problem_file(tmp_path, monkeypatch):
+    """複製一份 HW01-1.txt 到暫存目錄（絕對路徑不受 SCRIPT_DIR 影響）"""
+    for name in GLOBAL_NAMES:
+        monkeypatch.setattr(scheduler_core, name, getattr(scheduler_core, name))
+    path = tmp_path / 'problem.txt'
+    shutil.copy(os.path.join(SCRIPT_DIR, 'HW01-1.txt'), path)
+    return str(path)
@@ -0,0 +1,51 @@
+import numpy as np
+
+from scheduler_core import build_problem_instance
+from instance_generator import generate_instance
+from random_key import decode_random_keys
+
+# 測試用實例的大小
+PROCESSOR_COUNT = 4
+TASK_COUNT = 60
+SOLUTION_COUNT = 8
+
+def make_instance(shape, seed, zero_costs=False, task_count=TASK_COUNT, processor_count=PROCESSOR_COUNT):
+    """以 instance_generator 產生實例，並換成非均勻的通信率矩陣"""
+    rng = np.random.default_rng(seed)
+    comp_cost, _, edges = generate_instance(shape, task_count, processor_count, seed=seed)
+    comp_cost = np.asarray(comp_cost, dtype=np.float64).copy()
+    if zero_costs:
+        # 整數與零成本讓空檔邊界剛好相等的情況更常出現
+        comp_cost = np.round(comp_cost)
+        comp_cost[rng.random(comp_cost.shape) < 0.2] = 0.0
+    comm_rate = rng.uniform(0.2, 3.0, (processor_count, processor_count))
+    np.fill_diagonal(comm_rate, 0.0)
+    return build_problem_instance(processor_count, comp_cost.shape[0], comp_cost, edges, comm_rate)
+
+def random_solutions(instance, seed, count=SOLUTION_COUNT):
+    """以亂數鍵解碼出符合依賴關係的 ss/ms 陣列"""
+    rng = np.random.default_rng(seed)
+    shape = (count, instance.task_count)
+    return decode_random_keys(rng.random(shape), rng.random(shape), instance)
+
+def as_solution(ss, ms):
+    """將 ss/ms 陣列轉成解決方案字典"""
+    return {'ss': ss.tolist(), 'ms': ms.tolist()}
+
+def edge_arrays(instance):
+    """回傳所有依賴邊的 (前置任務, 後繼任務) 陣列"""
+    to_tasks = np.repeat(np.arange(instance.task_count), np.diff(instance.pred_ptr))
+    return instance.pred_idx, to_tasks
+
+def mutate(solution, instance, rng):
+    """重新分配幾個任務的處理器，並做一次不違反依賴的相鄰交換"""
+    child = {'ss': list(solution['ss']), 'ms': list(solution['ms'])}
+    for task in rng.integers(instance.task_count, size=3).tolist():
+        child['ms'][task] = int(rng.integers(instance.processor_count))
+    edges = set(zip(*(array.tolist() for array in edge_arrays(instance))))
+    for position in rng.permutation(instance.task_count - 1).tolist():
+        a, b = child['ss'][position], child['ss'][position + 1]
+        if (a, b) not in edges:
+            child['ss'][position], child['ss'][position + 1] = b, a
+            break
+    return child
@@ -0,0 +1,22 @@
+from scheduler_core import evaluate_population, solutions_to_arrays
+
+def test_batch_matches_scalar(evaluated_case):
+    instance, ss_batch, ms_batch, expected = evaluated_case
+    makespans, start_times, end_times = evaluate_population(ss_batch, ms_batch, instance)
+    for i, solution in enumerate(expected):
+        assert makespans[i] == solution['makespan']
+        assert start_times[i].tolist() == solution['start_times']
+        assert end_times[i].tolist() == solution['end_times']
+
+def test_single_solution_batch(evaluated_case):
+    instance, ss_batch, ms_batch, expected = evaluated_case
+    makespans, start_times, _ = evaluate_population(ss_batch[0], ms_batch[0], instance)
+    assert makespans.shape == (1,)
+    assert makespans[0] == expected[0]['makespan']
+    assert start_times[0].tolist() == expected[0]['start_times']
+
+def test_solutions_to_arrays_round_trip(evaluated_case):
+    _, _, _, expected = evaluated_case
+    ss_batch, ms_batch = solutions_to_arrays(expected)
+    assert ss_batch.tolist() == [solution['ss'] for solution in expected]
+    assert ms_batch.tolist() == [solution['ms'] for solution in expected]
@@ -0,0 +1,17 @@
+from genetic_algorithm import run_genetic_algorithm
+from generated_instances import make_instance
+
+def test_checkpoint_resume_is_deterministic(tmp_path):
+    instance = make_instance('layered', 5)
+    path = str(tmp_path / 'ga.npz')
+    options = {'population_size': 20, 'verbose': False, 'stagnation_limit': 25}
+    
+    full = run_genetic_algorithm(instance, generations=30, seed=7, **options)
+    run_genetic_algorithm(instance, generations=13, seed=7, checkpoint_path=path, checkpoint_interval=5, **options)
+    # 接續時種子不同也不影響結果：亂數狀態來自檢查點
+    resumed = run_genetic_algorithm(instance, generations=30, seed=123, checkpoint_path=path, resume=True, **options)
+    
+    assert resumed['ss'] == full['ss']
+    assert resumed['ms'] == full['ms']
+    assert resumed['history'] == full['history']
+    assert resumed['stop_reason'] == full['stop_reason']
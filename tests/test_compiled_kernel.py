@@ -0,0 +1,27 @@
+import numpy as np
+
+from scheduler_core import evaluate_solution
+from compiled_kernel import evaluate_arrays, evaluate_solution_fast, evaluate_solution_incremental_fast
+from generated_instances import as_solution, mutate
+
+def test_compiled_matches_scalar(evaluated_case):
+    instance, ss_batch, ms_batch, expected = evaluated_case
+    for ss, ms, solution in zip(ss_batch, ms_batch, expected):
+        makespan, start_times, end_times = evaluate_arrays(ss, ms, instance)
+        assert makespan == solution['makespan']
+        assert start_times.tolist() == solution['start_times']
+        assert end_times.tolist() == solution['end_times']
+        fast = evaluate_solution_fast(as_solution(ss, ms), instance)
+        assert fast['makespan'] == solution['makespan']
+        assert fast['start_times'] == solution['start_times']
+
+def test_compiled_incremental_matches_scalar(evaluated_case):
+    instance, _, _, expected = evaluated_case
+    rng = np.random.default_rng(1)
+    for parent in expected:
+        child = mutate(parent, instance, rng)
+        full = evaluate_solution(dict(child), instance)
+        result = evaluate_solution_incremental_fast(parent, dict(child), instance)
+        assert result['makespan'] == full['makespan']
+        assert result['start_times'] == full['start_times']
+        assert result['end_times'] == full['end_times']
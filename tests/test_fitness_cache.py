@@ -0,0 +1,75 @@
+from scheduler_core import evaluate_population
+from fitness_cache import FitnessCache, ENTRY_OVERHEAD_BYTES, chromosome_key
+from parallel_evaluation import create_evaluation_pool, close_evaluation_pool
+from genetic_algorithm import run_genetic_algorithm
+from generated_instances import make_instance, random_solutions
+
+def test_cached_matches_scalar(evaluated_case):
+    instance, ss_batch, ms_batch, expected = evaluated_case
+    # 很小的位元組上限讓快取在測試中也會淘汰項目
+    cache = FitnessCache(instance, max_bytes=3 * (16 * instance.task_count + ENTRY_OVERHEAD_BYTES))
+    for _ in range(2):
+        makespans, start_times, _ = cache.evaluate_population(ss_batch, ms_batch)
+        assert makespans.tolist() == [solution['makespan'] for solution in expected]
+        assert start_times.tolist() == [solution['start_times'] for solution in expected]
+        for ss, ms, solution in zip(ss_batch, ms_batch, expected):
+            result = cache.evaluate({'ss': ss.tolist(), 'ms': ms.tolist()})
+            assert result['makespan'] == solution['makespan']
+            assert result['end_times'] == solution['end_times']
+    assert cache.hits > 0
+    assert len(cache) <= 3
+    assert cache.bytes <= cache.max_bytes
+
+def test_duplicates_in_one_batch_are_evaluated_once(evaluated_case):
+    instance, ss_batch, ms_batch, expected = evaluated_case
+    cache = FitnessCache(instance)
+    makespans, _, _ = cache.evaluate_population(ss_batch[[0, 0, 1, 0]], ms_batch[[0, 0, 1, 0]])
+    assert makespans.tolist() == [expected[i]['makespan'] for i in (0, 0, 1, 0)]
+    assert cache.misses == 2
+    assert cache.hits == 2
+    assert len(cache) == 2
+
+def test_entry_count_limit_and_clear(evaluated_case):
+    instance, ss_batch, ms_batch, _ = evaluated_case
+    cache = FitnessCache(instance, max_size=2)
+    cache.evaluate_population(ss_batch, ms_batch)
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0 and cache.bytes == 0 and cache.stats()['hits'] == 0
+
+def test_disabled_cache_stores_nothing(evaluated_case):
+    instance, ss_batch, ms_batch, expected = evaluated_case
+    cache = FitnessCache(instance, enabled=False)
+    makespans, _, _ = cache.evaluate_population(ss_batch, ms_batch)
+    assert makespans.tolist() == [solution['makespan'] for solution in expected]
+    assert len(cache) == 0
+
+def test_chromosome_key_distinguishes_ss_and_ms():
+    assert chromosome_key([0, 1, 2], [0, 0, 1]) == chromosome_key([0, 1, 2], [0, 0, 1])
+    assert chromosome_key([0, 1, 2], [0, 0, 1]) != chromosome_key([0, 2, 1], [0, 0, 1])
+    assert chromosome_key([0, 1, 2], [0, 0, 1]) != chromosome_key([0, 1, 2], [0, 1, 1])
+
+def test_misses_go_to_evaluation_pool():
+    instance = make_instance('montage', 1)
+    ss_batch, ms_batch = random_solutions(instance, 1)
+    expected, _, expected_end = evaluate_population(ss_batch, ms_batch, instance)
+    options = {'population_size': 12, 'generations': 5, 'seed': 4, 'verbose': False}
+    plain = run_genetic_algorithm(instance, **options)
+    
+    evaluation_pool = create_evaluation_pool(instance, 2)
+    try:
+        cache = FitnessCache(instance)
+        makespans, _, end_times = cache.evaluate_population(ss_batch[[0, 1, 0]], ms_batch[[0, 1, 0]],
+                                                             evaluation_pool)
+        assert makespans.tolist() == expected[[0, 1, 0]].tolist()
+        assert end_times.tolist() == expected_end[[0, 1, 0]].tolist()
+        assert cache.misses == 2
+        
+        # 同時提供快取與行程池時，結果與單行程評估相同，且快取確實被使用
+        cache = FitnessCache(instance)
+        pooled = run_genetic_algorithm(instance, evaluation_pool=evaluation_pool, fitness_cache=cache, **options)
+    finally:
+        close_evaluation_pool(evaluation_pool)
+    assert pooled['ss'] == plain['ss']
+    assert pooled['history'] == plain['history']
+    assert cache.misses > 0
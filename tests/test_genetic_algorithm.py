@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from scheduler_core import evaluate_solution
+from instance_generator import DAG_SHAPES
+from genetic_algorithm import init_population, crossover, mutate_ms, evolve_generation, run_genetic_algorithm
+from schedule_validation import check_schedule_orders, check_processor_assignments
+from list_scheduling import heft_schedule
+from generated_instances import make_instance
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+def test_crossover_and_mutation_keep_solutions_feasible(shape):
+    instance = make_instance(shape, 1)
+    rng = np.random.default_rng(0)
+    ss_batch, ms_batch = init_population(instance, 10, rng)
+    assert check_schedule_orders(ss_batch, instance).all()
+    
+    children = [crossover(ss_batch[a], ms_batch[a], ss_batch[b], ms_batch[b], rng)
+                for a, b in rng.integers(len(ss_batch), size=(30, 2)).tolist()]
+    child_ss = np.array([ss for ss, _ in children])
+    child_ms = np.array([ms for _, ms in children])
+    mutate_ms(child_ms, instance.processor_count, 0.5, rng)
+    assert check_schedule_orders(child_ss, instance).all()
+    assert check_processor_assignments(child_ms, instance).all()
+    
+    makespans = np.arange(len(ss_batch), dtype=np.float64)
+    next_ss, next_ms = evolve_generation(ss_batch, ms_batch, makespans, instance, rng, mutation_rate=0.5)
+    assert check_schedule_orders(next_ss, instance).all()
+    assert check_processor_assignments(next_ms, instance).all()
+    # 菁英不交配也不突變
+    assert (next_ss[:2] == ss_batch[:2]).all()
+    assert (next_ms[:2] == ms_batch[:2]).all()
+
+def test_fixed_seed_is_deterministic():
+    instance = make_instance('random', 2)
+    options = {'population_size': 16, 'generations': 10, 'seed': 3, 'verbose': False}
+    first = run_genetic_algorithm(instance, **options)
+    second = run_genetic_algorithm(instance, **options)
+    assert first['ss'] == second['ss']
+    assert first['ms'] == second['ms']
+    assert first['history'] == second['history']
+
+def test_seed_solution_elite_is_never_lost():
+    instance = make_instance('layered', 4)
+    seed_solution = evaluate_solution(heft_schedule(instance), instance)
+    result = run_genetic_algorithm(instance, population_size=12, generations=15, seed=0, verbose=False,
+                                   seed_solutions=[seed_solution])
+    
+    # 每代最佳總耗時不會變差，且不會比放入的啟發式解差
+    history = np.array(result['history'])
+    assert (np.diff(history) <= 0).all()
+    assert history.max() <= seed_solution['makespan']
+    assert result['makespan'] <= seed_solution['makespan']
+    assert result['makespan'] == evaluate_solution(dict(result), instance)['makespan']
@@ -0,0 +1,31 @@
+import numpy as np
+
+from scheduler_core import evaluate_solution, evaluate_solution_incremental, first_affected_position
+from generated_instances import mutate
+
+def test_incremental_matches_scalar(evaluated_case):
+    instance, _, _, expected = evaluated_case
+    rng = np.random.default_rng(0)
+    for parent in expected:
+        child = mutate(parent, instance, rng)
+        full = evaluate_solution(dict(child), instance)
+        result = evaluate_solution_incremental(parent, dict(child), instance)
+        assert result['makespan'] == full['makespan']
+        assert result['start_times'] == full['start_times']
+        assert result['end_times'] == full['end_times']
+
+def test_identical_child_is_not_rescheduled(evaluated_case):
+    instance, _, _, expected = evaluated_case
+    parent = expected[0]
+    child = {'ss': list(parent['ss']), 'ms': list(parent['ms'])}
+    assert first_affected_position(parent, child, instance) == instance.task_count
+    assert evaluate_solution_incremental(parent, child, instance)['end_times'] == parent['end_times']
+
+def test_reassignment_affects_task_and_successors(evaluated_case):
+    instance, _, _, expected = evaluated_case
+    parent = expected[0]
+    task = parent['ss'][-1]
+    child = {'ss': list(parent['ss']), 'ms': list(parent['ms'])}
+    child['ms'][task] = (child['ms'][task] + 1) % instance.processor_count
+    # 排程最後一個任務沒有後繼任務，只需要重算最後一個位置
+    assert first_affected_position(parent, child, instance) == instance.task_count - 1
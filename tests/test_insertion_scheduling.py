@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from scheduler_core import evaluate_solution, _GapIndex
+from instance_generator import DAG_SHAPES
+from generated_instances import make_instance, random_solutions, as_solution, edge_arrays
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+@pytest.mark.parametrize('zero_costs', [False, True])
+def test_insertion_schedule_is_valid(shape, zero_costs):
+    instance = make_instance(shape, 3, zero_costs)
+    ss_batch, ms_batch = random_solutions(instance, 3)
+    from_tasks, to_tasks = edge_arrays(instance)
+    for ss, ms in zip(ss_batch, ms_batch):
+        appended = evaluate_solution(as_solution(ss, ms), instance)
+        result = evaluate_solution(as_solution(ss, ms), instance, insertion=True)
+        start = np.array(result['start_times'])
+        end = np.array(result['end_times'])
+        
+        # 執行時間正確
+        assert np.allclose(end - start, instance.comp_cost[np.arange(instance.task_count), ms])
+        
+        # 依賴關係：後繼任務在前置任務結束（加上跨處理器的通信時間）之後才開始
+        comm = np.where(ms[from_tasks] != ms[to_tasks],
+                        instance.pred_vol * instance.comm_rate[ms[from_tasks], ms[to_tasks]], 0.0)
+        assert (start[to_tasks] >= end[from_tasks] + comm - 1e-9).all()
+        
+        # 同一處理器上的任務不重疊
+        for processor in range(instance.processor_count):
+            tasks = np.flatnonzero(ms == processor)
+            order = tasks[np.lexsort((end[tasks], start[tasks]))]
+            assert (start[order][1:] >= end[order][:-1] - 1e-9).all()
+        
+        assert result['makespan'] <= appended['makespan'] + 1e-9
+
+def test_zero_length_task_fits_between_adjacent_tasks():
+    gaps = _GapIndex()
+    assert gaps.place(0, 5) == 0
+    assert gaps.place(5, 3) == 5
+    assert gaps.place(12, 2) == 12
+    # 執行時間為 0 的任務不能落在忙碌時段內部，但可以放在交界或空檔中
+    assert gaps.place(0, 0) == 0
+    assert gaps.place(2, 0) == 5
+    assert gaps.place(6, 0) == 8
+    assert gaps.place(9, 0) == 9
+    assert gaps.place(13, 0) == 14
+    # 之後的任務不能跨過已放入的長度為 0 的任務
+    assert gaps.place(8, 4) == 14
+    assert gaps.place(9, 3) == 9
+
+def brute_force_insertion(instance, ss, ms):
+    """逐一嘗試就緒時間與每個已排任務的結束時間，回傳每個任務最早可行的開始時間"""
+    busy = [[] for _ in range(instance.processor_count)]
+    start = np.zeros(instance.task_count)
+    end = np.zeros(instance.task_count)
+    from_tasks, to_tasks = edge_arrays(instance)
+    for task in ss.tolist():
+        processor = ms[task]
+        edges = np.flatnonzero(to_tasks == task)
+        preds = from_tasks[edges]
+        comm = np.where(ms[preds] != processor,
+                        instance.pred_vol[edges] * instance.comm_rate[ms[preds], processor], 0.0)
+        ready = max(end[preds] + comm, default=0.0)
+        cost = instance.comp_cost[task, processor]
+        for candidate in sorted({ready} | {b for _, b in busy[processor] if b >= ready}):
+            if cost > 0 and all(candidate + cost <= a or candidate >= b for a, b in busy[processor]):
+                break
+            if cost == 0 and not any(a < candidate < b for a, b in busy[processor]):
+                break
+        start[task], end[task] = candidate, candidate + cost
+        # 執行時間為 0 的任務也記錄下來，之後的任務不能跨過它
+        busy[processor].append((candidate, candidate + cost))
+    return start
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+def test_insertion_matches_brute_force(shape):
+    for seed in range(4):
+        instance = make_instance(shape, seed, zero_costs=True)
+        for ss, ms in zip(*random_solutions(instance, seed, count=4)):
+            result = evaluate_solution(as_solution(ss, ms), instance, insertion=True)
+            assert np.allclose(result['start_times'], brute_force_insertion(instance, ss, ms))
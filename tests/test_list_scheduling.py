@@ -0,0 +1,31 @@
+import pytest
+
+from scheduler_core import evaluate_solution, solutions_to_arrays
+from instance_generator import DAG_SHAPES
+from list_scheduling import heft_schedule, cpop_schedule, heuristic_seeds
+from schedule_validation import validate_population
+from generated_instances import make_instance
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+@pytest.mark.parametrize('seed', [1, 2])
+def test_heuristic_schedules_are_feasible(shape, seed):
+    instance = make_instance(shape, seed)
+    solutions = [heft_schedule(instance), cpop_schedule(instance)] + heuristic_seeds(instance)
+    ss_batch, ms_batch = solutions_to_arrays(solutions)
+    validated, valid = validate_population(ss_batch, ms_batch, instance, repair=False)
+    assert valid.all()
+    assert (validated == ss_batch).all()
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+@pytest.mark.parametrize('seed', [1, 2])
+def test_reported_schedule_matches_evaluate_solution(shape, seed):
+    instance = make_instance(shape, seed)
+    for schedule in heuristic_seeds(instance):
+        evaluated = evaluate_solution({'ss': schedule['ss'], 'ms': schedule['ms']}, instance)
+        assert schedule['makespan'] == evaluated['makespan']
+        assert schedule['start_times'] == evaluated['start_times']
+        assert schedule['end_times'] == evaluated['end_times']
+
+def test_heuristic_seeds_are_heft_and_cpop():
+    instance = make_instance('montage', 3)
+    assert heuristic_seeds(instance) == [heft_schedule(instance), cpop_schedule(instance)]
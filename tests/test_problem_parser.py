@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pytest
+
+import scheduler_core
+from scheduler_core import parse_problem_file, _parse_number_row
+
+def test_glued_and_normal_rows():
+    assert _parse_number_row("40.0 40.0 40.0 40.0") == [40.0] * 4
+    assert _parse_number_row("40.0 40.0 40.040.0") == [40.0] * 4
+    assert _parse_number_row("1.25 -2.5010.75") == [1.25, -2.5, 10.75]
+    with pytest.raises(ValueError):
+        _parse_number_row("40.0 40.0.0")
+
+def test_parse_problem_file(problem_file):
+    instance = parse_problem_file(problem_file, use_cache=False)
+    assert (instance.processor_count, instance.task_count, instance.edge_count) == (4, 20, 35)
+    # 第三列在原始檔案中是 '40.0 40.0 40.040.0'
+    assert instance.comp_cost[2].tolist() == [40.0] * 4
+    assert not os.path.exists(problem_file + '.cache.npz')
+
+def test_cache_hit(problem_file, capsys):
+    parsed = parse_problem_file(problem_file)
+    assert os.path.exists(problem_file + '.cache.npz')
+    cached = parse_problem_file(problem_file)
+    assert "從快取讀取" in capsys.readouterr().out
+    for field in scheduler_core.INSTANCE_ARRAY_FIELDS:
+        assert np.array_equal(getattr(cached, field), getattr(parsed, field))
+
+def test_cache_invalidated_by_mtime(problem_file, capsys):
+    parse_problem_file(problem_file)
+    stat = os.stat(problem_file)
+    os.utime(problem_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    capsys.readouterr()
+    parse_problem_file(problem_file)
+    assert "從快取讀取" not in capsys.readouterr().out
+
+def test_cache_invalidated_by_size(problem_file, capsys):
+    parse_problem_file(problem_file)
+    with open(problem_file, encoding='utf-8') as file:
+        text = file.read()
+    with open(problem_file, 'w', encoding='utf-8') as file:
+        file.write(text.replace("80.0 80.0 80.0 80.0", "85.0 85.0 85.0 85.00", 1))
+    capsys.readouterr()
+    instance = parse_problem_file(problem_file)
+    assert "從快取讀取" not in capsys.readouterr().out
+    assert instance.comp_cost[1].tolist() == [85.0] * 4
+
+def test_corrupt_cache_falls_back_to_parsing(problem_file, capsys):
+    expected = parse_problem_file(problem_file, use_cache=False)
+    with open(problem_file + '.cache.npz', 'wb') as file:
+        file.write(b'not a cache')
+    capsys.readouterr()
+    instance = parse_problem_file(problem_file)
+    assert "從快取讀取" not in capsys.readouterr().out
+    assert np.array_equal(instance.comp_cost, expected.comp_cost)
+    # 重新解析後改寫為有效的快取
+    parse_problem_file(problem_file)
+    assert "從快取讀取" in capsys.readouterr().out
+
+def test_missing_file(tmp_path, problem_file):
+    missing = str(tmp_path / 'missing.txt')
+    with pytest.raises(FileNotFoundError):
+        parse_problem_file(missing)
+    assert parse_problem_file(missing, fallback_to_default=True) is scheduler_core.get_default_instance()
+
+def test_malformed_row_reports_line_number(problem_file):
+    with open(problem_file, encoding='utf-8') as file:
+        lines = file.readlines()
+    line_number = next(i for i, line in enumerate(lines, 1) if line.startswith("80.0"))
+    lines[line_number - 1] = "80.0 eighty 80.0 80.0\n"
+    with open(problem_file, 'w', encoding='utf-8') as file:
+        file.writelines(lines)
+    with pytest.raises(ValueError, match=f"第 {line_number} 行"):
+        parse_problem_file(problem_file, use_cache=False)
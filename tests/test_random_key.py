@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from instance_generator import DAG_SHAPES
+from random_key import decode_priority_keys, decode_processor_keys, decode_random_keys, encode_random_keys
+from generated_instances import make_instance, random_solutions, edge_arrays
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+def test_decoded_order_is_topological(shape):
+    instance = make_instance(shape, 1)
+    rng = np.random.default_rng(0)
+    # 也包含大量重複鍵值的情況
+    keys = np.concatenate((rng.random((20, instance.task_count)),
+                           rng.integers(3, size=(20, instance.task_count)) / 3))
+    ss_batch = decode_priority_keys(keys, instance)
+    assert (np.sort(ss_batch, axis=1) == np.arange(instance.task_count)).all()
+    
+    positions = np.argsort(ss_batch, axis=1)
+    from_tasks, to_tasks = edge_arrays(instance)
+    assert (positions[:, from_tasks] < positions[:, to_tasks]).all()
+
+def test_ties_break_by_topological_rank():
+    instance = make_instance('random', 2)
+    ss = decode_priority_keys(np.full(instance.task_count, 0.5), instance)[0]
+    assert ss.tolist() == instance.topo_order.tolist()
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+def test_encode_decode_round_trip(shape):
+    instance = make_instance(shape, 3)
+    for ss, ms in zip(*random_solutions(instance, 3)):
+        priority_keys, ms_keys = encode_random_keys(ss, ms, instance.processor_count)
+        decoded_ss, decoded_ms = decode_random_keys(priority_keys, ms_keys, instance)
+        assert decoded_ss[0].tolist() == ss.tolist()
+        assert decoded_ms[0].tolist() == ms.tolist()
+
+def test_processor_keys_cover_all_processors():
+    keys = np.array([0.0, 0.24, 0.25, 0.5, 0.99, 1.0])
+    assert decode_processor_keys(keys, 4).tolist() == [0, 0, 1, 2, 3, 3]
+
+def test_wrong_length_keys_raise():
+    instance = make_instance('layered', 1)
+    task_count = instance.task_count
+    with pytest.raises(ValueError):
+        decode_priority_keys(np.zeros(task_count - 1), instance)
+    with pytest.raises(ValueError):
+        decode_priority_keys(np.zeros((2, task_count + 1)), instance)
+    with pytest.raises(ValueError):
+        decode_random_keys(np.zeros(task_count), np.zeros(task_count - 1), instance)
+    with pytest.raises(ValueError):
+        decode_random_keys(np.zeros((2, task_count)), np.zeros((3, task_count)), instance)
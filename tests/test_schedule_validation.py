@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from instance_generator import DAG_SHAPES
+from schedule_validation import (check_schedule_orders, check_processor_assignments, repair_schedule_orders,
+                                 validate_population)
+from generated_instances import make_instance, random_solutions
+
+def test_non_permutation_is_rejected():
+    instance = make_instance('layered', 1)
+    ss_batch, ms_batch = random_solutions(instance, 1, count=3)
+    ss_batch[0, -1] = ss_batch[0, 0]        # 重複的任務
+    ss_batch[1, -1] = instance.task_count   # 超出範圍的任務編號
+    assert check_schedule_orders(ss_batch, instance).tolist() == [False, False, True]
+    assert not check_schedule_orders(ss_batch[:, :-1], instance).any()
+    
+    repaired, valid = validate_population(ss_batch, ms_batch, instance)
+    assert valid.tolist() == [False, False, True]
+    assert (repaired[:2] == ss_batch[:2]).all()
+
+def test_out_of_range_processor_is_rejected():
+    instance = make_instance('layered', 1)
+    ss_batch, ms_batch = random_solutions(instance, 1, count=3)
+    ms_batch[0, 5] = instance.processor_count
+    ms_batch[1, 5] = -1
+    assert check_processor_assignments(ms_batch, instance).tolist() == [False, False, True]
+    assert not check_processor_assignments(ms_batch[:, :-1], instance).any()
+    assert validate_population(ss_batch, ms_batch, instance)[1].tolist() == [False, False, True]
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+def test_repaired_order_is_feasible(shape):
+    instance = make_instance(shape, 2)
+    rng = np.random.default_rng(0)
+    ss_batch = np.array([rng.permutation(instance.task_count) for _ in range(10)])
+    _, ms_batch = random_solutions(instance, 2, count=10)
+    
+    repaired = repair_schedule_orders(ss_batch, instance)
+    assert check_schedule_orders(repaired, instance).all()
+    
+    fixed, valid = validate_population(ss_batch, ms_batch, instance)
+    assert valid.all()
+    assert (fixed == repaired).all()
+    # repair 為 False 時不修改 ss
+    unchanged, valid = validate_population(ss_batch, ms_batch, instance, repair=False)
+    assert (unchanged == ss_batch).all()
+    assert valid.tolist() == check_schedule_orders(ss_batch, instance).tolist()
+
+@pytest.mark.parametrize('shape', DAG_SHAPES)
+def test_feasible_order_is_unchanged(shape):
+    instance = make_instance(shape, 3)
+    ss_batch, ms_batch = random_solutions(instance, 3)
+    assert check_schedule_orders(ss_batch, instance).all()
+    assert (repair_schedule_orders(ss_batch, instance) == ss_batch).all()
+    
+    validated, valid = validate_population(ss_batch, ms_batch, instance)
+    assert valid.all()
+    assert (validated == ss_batch).all()
@@ -0,0 +1,102 @@
+import os
+import shutil
+
+import pytest
+
+from scheduler_core import SCRIPT_DIR
+from scheduler_cli import main
+from hw01_3_scheduler import DEFAULT_HW01_3_CHROMOSOMES
+
+# 每個引擎以很小的規模執行一次
+ENGINE_ARGS = {
+    'evaluate': [],
+    'heft': [],
+    'cpop': [],
+    'ga': ['-n', '3', '-p', '10'],
+    'islands': ['-n', '2', '-p', '8', '-w', '2'],
+    'sa': ['-n', '200'],
+    'tabu': ['-n', '5'],
+    'pso': ['-n', '3', '-p', '8'],
+    'de': ['-n', '3', '-p', '8'],
+    'nsga2': ['-n', '3', '-p', '8'],
+}
+
+def copy_input(tmp_path, name):
+    """把 src 中的輸入文件複製到暫存目錄，回傳絕對路徑"""
+    path = tmp_path / name
+    shutil.copy(os.path.join(SCRIPT_DIR, name), path)
+    return str(path)
+
+@pytest.mark.parametrize('engine', sorted(ENGINE_ARGS))
+def test_engine_smoke(engine, problem_file, tmp_path, capsys):
+    solutions = ['-s', copy_input(tmp_path, 'HW01-2.txt')] if engine == 'evaluate' else []
+    output_dir = str(tmp_path / 'out')
+    argv = [problem_file, '-e', engine, '--seed', '0', '-o', output_dir, '--no-charts'] + solutions
+    assert main(argv + ENGINE_ARGS[engine]) == 0
+    assert "最佳總耗時" in capsys.readouterr().out
+    assert os.path.exists(os.path.join(output_dir, 'solutions_and_execution_time.txt'))
+
+def test_evaluate_hw01_3_with_insertion(problem_file, tmp_path, capsys):
+    path = tmp_path / 'HW01-3.txt'
+    path.write_text("\n".join(DEFAULT_HW01_3_CHROMOSOMES), encoding='utf-8')
+    argv = [problem_file, '-s', str(path), '--solutions-format', 'hw01-3', '--insertion',
+            '--no-charts', '--no-report']
+    assert main(argv) == 0
+    assert "解決方案 2" in capsys.readouterr().out
+
+def test_ga_checkpoint(problem_file, tmp_path):
+    checkpoint = str(tmp_path / 'ga.npz')
+    argv = [problem_file, '-e', 'ga', '-n', '4', '-p', '10', '--seed', '0', '--no-charts', '--no-report',
+            '--checkpoint', checkpoint, '--checkpoint-interval', '2']
+    assert main(argv) == 0
+    assert os.path.exists(checkpoint)
+    assert main(argv + ['-n', '6', '--resume']) == 0
+
+def test_missing_instance_file(tmp_path):
+    assert main([str(tmp_path / 'missing.txt'), '--no-charts', '--no-report']) == 2
+
+def test_malformed_instance_file(problem_file):
+    with open(problem_file, 'a', encoding='utf-8') as file:
+        file.write("0 1\n")
+    assert main([problem_file, '-e', 'heft', '--no-charts', '--no-report']) == 2
+
+def test_missing_solutions_file(problem_file, tmp_path):
+    assert main([problem_file, '-s', str(tmp_path / 'missing.txt'), '--no-charts', '--no-report']) == 2
+
+@pytest.mark.parametrize('solutions_format', ['hw01-2', 'hw01-3'])
+def test_malformed_solutions_file(solutions_format, problem_file, tmp_path):
+    path = tmp_path / 'solutions.txt'
+    path.write_text("ss = {0, 1, 2\nms = {0, 1, 2}\n", encoding='utf-8')
+    argv = [problem_file, '-s', str(path), '--solutions-format', solutions_format, '--no-charts', '--no-report']
+    assert main(argv) == 2
+
+@pytest.mark.parametrize('argv', [
+    ['-e', 'sa', '--checkpoint', 'run.npz'],
+    ['-e', 'islands', '--checkpoint', 'run.npz', '--resume'],
+    ['-e', 'evaluate', '--resume'],
+    ['-e', 'ga', '--resume'],
+    ['-e', 'ga', '--checkpoint', 'run.npz', '--checkpoint-interval', '0'],
+])
+def test_checkpoint_options_are_validated(argv, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(argv)
+    assert excinfo.value.code == 2
+    assert "checkpoint" in capsys.readouterr().err
+
+@pytest.mark.parametrize('argv', [
+    ['-e', 'islands', '-t', '5'],
+    ['-e', 'islands', '--stagnation', '10'],
+    ['-e', 'sa', '-p', '10'],
+    ['-e', 'tabu', '-p', '10'],
+    ['-e', 'nsga2', '--stagnation', '10'],
+    ['-e', 'heft', '-n', '10'],
+    ['-e', 'pso', '-w', '4'],
+    ['-e', 'ga', '--insertion'],
+    ['-e', 'ga', '-s', 'HW01-2.txt'],
+    ['-e', 'evaluate', '-t', '5'],
+    ['-e', 'evaluate', '--insertion', '-w', '2'],
+])
+def test_ignored_options_are_rejected(argv):
+    with pytest.raises(SystemExit) as excinfo:
+        main(argv)
+    assert excinfo.value.code == 2